@@ -0,0 +1,3 @@
+-- Serve get_user_applications' newest-first keyset pagination from an index
+CREATE INDEX IF NOT EXISTS idx_job_applications_user_date
+ON job_applications(user_id, application_date DESC);
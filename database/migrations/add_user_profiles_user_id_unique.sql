@@ -0,0 +1,3 @@
+-- One profile per user; lets create_profile upsert with ON CONFLICT (user_id)
+ALTER TABLE user_profiles
+ADD CONSTRAINT user_profiles_user_id_key UNIQUE (user_id);
@@ -0,0 +1,30 @@
+-- Store job search criteria as text[] so PostgREST array operators (cs/ov)
+-- can filter them server-side through GIN indexes
+
+-- Transform expressions can't contain subqueries, so unpack JSON arrays in a function
+CREATE OR REPLACE FUNCTION jsonb_to_text_array(value JSONB)
+RETURNS TEXT[] AS $$
+    SELECT COALESCE(ARRAY(SELECT jsonb_array_elements_text(value)), '{}')
+$$ LANGUAGE sql IMMUTABLE;
+
+ALTER TABLE job_searches
+    ALTER COLUMN job_titles DROP DEFAULT,
+    ALTER COLUMN locations DROP DEFAULT,
+    ALTER COLUMN keywords DROP DEFAULT,
+    ALTER COLUMN excluded_keywords DROP DEFAULT;
+
+ALTER TABLE job_searches
+    ALTER COLUMN job_titles TYPE TEXT[] USING jsonb_to_text_array(job_titles),
+    ALTER COLUMN locations TYPE TEXT[] USING jsonb_to_text_array(locations),
+    ALTER COLUMN keywords TYPE TEXT[] USING jsonb_to_text_array(keywords),
+    ALTER COLUMN excluded_keywords TYPE TEXT[] USING jsonb_to_text_array(excluded_keywords);
+
+ALTER TABLE job_searches
+    ALTER COLUMN job_titles SET DEFAULT '{}',
+    ALTER COLUMN locations SET DEFAULT '{}',
+    ALTER COLUMN keywords SET DEFAULT '{}',
+    ALTER COLUMN excluded_keywords SET DEFAULT '{}';
+
+CREATE INDEX IF NOT EXISTS idx_job_searches_job_titles ON job_searches USING GIN (job_titles);
+CREATE INDEX IF NOT EXISTS idx_job_searches_locations ON job_searches USING GIN (locations);
+CREATE INDEX IF NOT EXISTS idx_job_searches_keywords ON job_searches USING GIN (keywords);
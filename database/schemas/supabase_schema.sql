@@ -18,7 +18,7 @@ CREATE TABLE IF NOT EXISTS users (
 -- User profiles table
 CREATE TABLE IF NOT EXISTS user_profiles (
     id SERIAL PRIMARY KEY,
-    user_id INTEGER NOT NULL REFERENCES users(id) ON DELETE CASCADE,
+    user_id INTEGER UNIQUE NOT NULL REFERENCES users(id) ON DELETE CASCADE,
     resume_text TEXT,
     resume_file_path VARCHAR(500),
     skills JSONB DEFAULT '[]',
@@ -38,10 +38,10 @@ CREATE TABLE IF NOT EXISTS job_searches (
     id SERIAL PRIMARY KEY,
     user_id INTEGER NOT NULL REFERENCES users(id) ON DELETE CASCADE,
     search_name VARCHAR(200) NOT NULL,
-    job_titles JSONB DEFAULT '[]',
-    locations JSONB DEFAULT '[]',
-    keywords JSONB DEFAULT '[]',
-    excluded_keywords JSONB DEFAULT '[]',
+    job_titles TEXT[] DEFAULT '{}',
+    locations TEXT[] DEFAULT '{}',
+    keywords TEXT[] DEFAULT '{}',
+    excluded_keywords TEXT[] DEFAULT '{}',
     remote_only BOOLEAN DEFAULT FALSE,
     is_active BOOLEAN DEFAULT TRUE,
     created_at TIMESTAMP WITH TIME ZONE DEFAULT NOW(),
@@ -89,8 +89,12 @@ CREATE INDEX IF NOT EXISTS idx_users_email ON users(email);
 CREATE INDEX IF NOT EXISTS idx_users_username ON users(username);
 CREATE INDEX IF NOT EXISTS idx_user_profiles_user_id ON user_profiles(user_id);
 CREATE INDEX IF NOT EXISTS idx_job_searches_user_id ON job_searches(user_id);
+CREATE INDEX IF NOT EXISTS idx_job_searches_job_titles ON job_searches USING GIN (job_titles);
+CREATE INDEX IF NOT EXISTS idx_job_searches_locations ON job_searches USING GIN (locations);
+CREATE INDEX IF NOT EXISTS idx_job_searches_keywords ON job_searches USING GIN (keywords);
 CREATE INDEX IF NOT EXISTS idx_job_search_results_search_id ON job_search_results(job_search_id);
 CREATE INDEX IF NOT EXISTS idx_job_applications_user_id ON job_applications(user_id);
+CREATE INDEX IF NOT EXISTS idx_job_applications_user_date ON job_applications(user_id, application_date DESC);
 
 -- Create updated_at trigger function
 CREATE OR REPLACE FUNCTION update_updated_at_column()
@@ -6,14 +6,17 @@ Specialized agent for searching QA engineer positions on Ashby job boards.
 Focuses on QA Engineer, Senior QA Engineer, QA Automation Engineer positions.
 """
 
+import asyncio
 import requests
-from bs4 import BeautifulSoup
 import json
+import orjson
 import time
 import logging
-from typing import List, Dict, Any, Optional
-from urllib.parse import urljoin, urlparse
+from typing import List, Dict, Any, Optional, Tuple
+from urllib.parse import urljoin, urlparse, urlsplit
 import re
+import shutil
+import threading
 from datetime import datetime
 from selenium import webdriver
 from selenium.webdriver.chrome.options import Options
@@ -23,21 +26,224 @@ from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 from webdriver_manager.chrome import ChromeDriverManager
 from selenium.common.exceptions import TimeoutException, WebDriverException, NoSuchElementException
+from playwright.async_api import async_playwright, TimeoutError as PlaywrightTimeoutError
+from selectolax.lexbor import LexborHTMLParser
+
+try:
+    import requests_cache
+except ImportError:
+    requests_cache = None
 
 # Set up logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+USER_AGENT = 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/122.0.0.0 Safari/537.36'
+
+# Resources we never need to read job links
+BLOCKED_RESOURCE_TYPES = frozenset({"image", "font", "media", "stylesheet"})
+BLOCKED_HOSTS = ("doubleclick", "google-analytics", "googletagmanager", "segment.io")
+
+# Every selector that may mark an Ashby job listing, queried in one pass
+JOB_LISTING_SELECTOR = (
+    "a[href*='/jobs/'], [data-testid*='job'], .job-listing, .job-card, "
+    "[class*='job'], a[href*='careers']"
+)
+
+# Collects href, text, title and location for each unique linked listing
+# in a single evaluate instead of per-element round trips
+COLLECT_JOB_LINKS_JS = """
+([selector, titleSelector, locationSelector]) => {
+    const seen = new Set();
+    const links = [];
+    for (const el of document.querySelectorAll(selector)) {
+        const href = el.getAttribute('href');
+        if (!href || seen.has(href)) continue;
+        seen.add(href);
+        const titleEl = el.querySelector(titleSelector);
+        const locationEl = el.querySelector(locationSelector);
+        links.push({
+            href: href,
+            text: el.innerText || '',
+            title: titleEl ? titleEl.innerText : '',
+            location: locationEl ? locationEl.innerText : ''
+        });
+    }
+    return links;
+}
+"""
+
+# Reads every job detail field in one round trip; single fields take the
+# first selector that matches, list fields keep up to 10 distinct entries
+JOB_DETAILS_JS = """
+const firstText = (selectors) => {
+    for (const selector of selectors) {
+        const el = document.querySelector(selector);
+        if (el) return el.innerText.trim();
+    }
+    return null;
+};
+const allTexts = (selector, minLength) => {
+    const seen = new Set();
+    const out = [];
+    for (const el of document.querySelectorAll(selector)) {
+        const text = el.innerText.trim();
+        if (text.length <= minLength || seen.has(text)) continue;
+        seen.add(text);
+        out.push(text);
+        if (out.length >= 10) break;
+    }
+    return out;
+};
+return {
+    title: firstText(["h1", "[class*='title']", "[data-testid*='title']"]),
+    company: firstText(["[class*='company']", "[data-testid*='company']", ".company-name"]),
+    location: firstText(["[class*='location']", "[data-testid*='location']", ".location"]),
+    description: firstText(["[class*='description']", "[data-testid*='description']", ".job-description", "main"]),
+    salary: firstText(["[class*='salary']", "[class*='compensation']", ".salary"]),
+    requirements: allTexts("[class*='requirement'], [class*='qualification'], ul li", 10),
+    benefits: allTexts("[class*='benefit'], [class*='perk'], .benefits li", 5),
+    pageTextLower: document.body ? document.body.innerText.toLowerCase() : ''
+};
+"""
+
+# (marker, label) pairs checked in order against lowercased text
+JOB_TYPE_MARKERS = (
+    ('full-time', 'Full-time'),
+    ('part-time', 'Part-time'),
+    ('contract', 'Contract'),
+    ('internship', 'Internship'),
+)
+REMOTE_OPTION_MARKERS = (
+    ('remote', 'Remote'),
+    ('hybrid', 'Hybrid'),
+    ('on-site', 'On-site'),
+    ('onsite', 'On-site'),
+)
+
+def _match_marker(text_lc: str, markers) -> Optional[str]:
+    """Return the label of the first marker found in lowercased text"""
+    return next((label for marker, label in markers if marker in text_lc), None)
+
+class TokenBucket:
+    """Thread-safe token bucket: `rate` tokens per second, bursts up to `burst`"""
+    
+    def __init__(self, rate: float, burst: int):
+        self.rate = rate
+        self.burst = burst
+        self._tokens = float(burst)
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+    
+    def acquire(self):
+        """Block until a token is available, then take it"""
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self._tokens = min(self.burst, self._tokens + (now - self._updated) * self.rate)
+                self._updated = now
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+                wait = (1 - self._tokens) / self.rate
+            time.sleep(wait)
+
+# Ashby's enum values mapped to the labels used elsewhere in this module
+EMPLOYMENT_TYPE_LABELS = {
+    'FullTime': 'Full-time',
+    'PartTime': 'Part-time',
+    'Contract': 'Contract',
+    'Intern': 'Internship',
+}
+WORKPLACE_TYPE_LABELS = {
+    'Remote': 'Remote',
+    'Hybrid': 'Hybrid',
+    'OnSite': 'On-site',
+}
+
+def _find_job_postings(data: Any) -> Optional[List[Dict[str, Any]]]:
+    """Locate the jobPostings list in an embedded page-data blob"""
+    # Usual Next.js location first, then search the whole blob
+    try:
+        postings = data['props']['pageProps']['jobBoard']['jobPostings']
+        if isinstance(postings, list):
+            return postings
+    except (KeyError, TypeError):
+        pass
+    return _search_job_postings(data)
+
+def _search_job_postings(data: Any) -> Optional[List[Dict[str, Any]]]:
+    """Depth-first search for a jobPostings list"""
+    if isinstance(data, dict):
+        postings = data.get('jobPostings')
+        if isinstance(postings, list):
+            return postings
+        children = data.values()
+    elif isinstance(data, list):
+        children = data
+    else:
+        return None
+    
+    for child in children:
+        postings = _search_job_postings(child)
+        if postings is not None:
+            return postings
+    return None
+
+def _canonical_url(url: str) -> str:
+    """Normalize a job URL so scheme, query, fragment and trailing-slash variants match"""
+    parts = urlsplit(url)
+    return parts._replace(
+        scheme='https',
+        netloc=parts.netloc.lower(),
+        path=parts.path.rstrip('/'),
+        query='',
+        fragment=''
+    ).geturl()
+
+async def _block_heavy_resources(route):
+    """Abort images, fonts, media, stylesheets and analytics beacons"""
+    request = route.request
+    if request.resource_type in BLOCKED_RESOURCE_TYPES or any(host in request.url for host in BLOCKED_HOSTS):
+        await route.abort()
+    else:
+        await route.continue_()
+
 class AshbyJobSearchAgent:
     """Specialized agent for searching Ashby job boards"""
     
+    # Child elements read from each job listing
+    _TITLE_CSS = "h1, h2, h3, h4, h5, h6, [class*='title']"
+    _LOCATION_CSS = "[class*='location'], [class*='place'], [data-testid*='location']"
+    
+    # Checked in order against listing text when no location element exists
+    _LOCATION_KEYWORDS = ('remote', 'san francisco', 'new york', 'austin', 'seattle', 'boston')
+    
     def __init__(self):
         self.base_url = "https://jobs.ashbyhq.com"
-        self.session = requests.Session()
+        if requests_cache is not None:
+            # Repeat runs read listing pages from the local HTTP cache
+            self.session = requests_cache.CachedSession(
+                'ashby_cache', expire_after=3600, allowable_codes=(200,)
+            )
+        else:
+            self.session = requests.Session()
         self.session.headers.update({
-            'User-Agent': 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/122.0.0.0 Safari/537.36'
+            'User-Agent': USER_AGENT
         })
         
+        # Shared limit for every request sent to Ashby
+        self._bucket = TokenBucket(rate=1.0, burst=3)
+        self.max_retries = 3
+        
+        # Shared Playwright browser, launched once per search run
+        self._browser = None
+        self.max_concurrent_pages = 5
+        
+        # ChromeDriver service and driver for detail pages, created once on first use
+        self._service = None
+        self._driver = None
+        
         # QA-focused job titles
         self.qa_job_titles = [
             "QA Engineer",
@@ -58,6 +264,10 @@ class AshbyJobSearchAgent:
             "manual testing", "api testing", "ui testing", "regression testing"
         ]
         
+        # Lowercased once for the per-element filters
+        self._qa_titles_lc = tuple(t.lower() for t in self.qa_job_titles)
+        self._qa_keywords_lc = tuple(k.lower() for k in self.qa_keywords)
+        
         # Companies known to use Ashby (we'll discover more)
         self.known_ashby_companies = [
             "notion",
@@ -77,203 +287,241 @@ class AshbyJobSearchAgent:
             "mixpanel"
         ]
     
-    def search_qa_jobs(self, job_titles: List[str] = None, max_results: int = 100) -> List[Dict[str, Any]]:
+    async def search_qa_jobs(self, job_titles: List[str] = None, max_results: int = 100) -> List[Dict[str, Any]]:
         """Search for QA jobs across Ashby job boards"""
         if job_titles is None:
             job_titles = self.qa_job_titles
         
         logger.info(f"Starting Ashby job search for titles: {job_titles}")
         
-        all_jobs = []
+        if job_titles is self.qa_job_titles:
+            job_titles_lc = self._qa_titles_lc
+        else:
+            job_titles_lc = tuple(t.lower() for t in job_titles)
+        
+        # One browser for every company, one context per company, bounded concurrency
+        semaphore = asyncio.Semaphore(self.max_concurrent_pages)
         
-        # Search known companies
-        for company in self.known_ashby_companies:
+        async def search_company(company: str) -> List[Dict[str, Any]]:
+            async with semaphore:
+                return await self._search_company_jobs(company, job_titles_lc, max_results)
+        
+        async with async_playwright() as p:
+            self._browser = await p.chromium.launch(headless=True)
             try:
-                company_jobs = self._search_company_jobs(company, job_titles, max_results)
-                all_jobs.extend(company_jobs)
-                logger.info(f"Found {len(company_jobs)} jobs at {company}")
-                
-                # Rate limiting
-                time.sleep(1)
-                
-            except Exception as e:
-                logger.error(f"Error searching {company}: {e}")
+                results = await asyncio.gather(
+                    *[search_company(company) for company in self.known_ashby_companies],
+                    return_exceptions=True
+                )
+            finally:
+                await self._browser.close()
+                self._browser = None
+        
+        all_jobs = []
+        for company, company_jobs in zip(self.known_ashby_companies, results):
+            if isinstance(company_jobs, Exception):
+                logger.error(f"Error searching {company}: {company_jobs}")
                 continue
+            all_jobs.extend(company_jobs)
+            logger.info(f"Found {len(company_jobs)} jobs at {company}")
         
-        # Remove duplicates based on URL
-        unique_jobs = []
-        seen_urls = set()
+        # Remove duplicates based on canonical URL, keeping the first seen
+        unique_jobs = {}
         for job in all_jobs:
-            if job['url'] not in seen_urls:
-                unique_jobs.append(job)
-                seen_urls.add(job['url'])
+            unique_jobs.setdefault(_canonical_url(job['url']), job)
         
         logger.info(f"Total unique QA jobs found: {len(unique_jobs)}")
-        return unique_jobs[:max_results]
+        return list(unique_jobs.values())[:max_results]
     
-    def _search_company_jobs(self, company: str, job_titles: List[str], max_results: int) -> List[Dict[str, Any]]:
+    async def _search_company_jobs(self, company: str, job_titles_lc: Tuple[str, ...], max_results: int) -> List[Dict[str, Any]]:
         """Search for jobs at a specific company"""
         company_url = f"{self.base_url}/{company}"
         
         try:
-            # Use Selenium for dynamic content
-            jobs = self._scrape_company_with_selenium(company_url, job_titles, max_results)
+            # Server-rendered job data avoids the browser entirely
+            jobs = await asyncio.to_thread(self._fetch_embedded_jobs, company_url, job_titles_lc, max_results)
+            if jobs is None:
+                # Use the shared browser for dynamic content
+                jobs = await self._scrape_company_page(company_url, job_titles_lc, max_results)
             return jobs
             
         except Exception as e:
             logger.error(f"Error scraping {company}: {e}")
             return []
     
-    def _scrape_company_with_selenium(self, company_url: str, job_titles: List[str], max_results: int) -> List[Dict[str, Any]]:
-        """Scrape company jobs using Selenium for dynamic content"""
+    def _fetch_embedded_jobs(self, company_url: str, job_titles_lc: Tuple[str, ...], max_results: int) -> Optional[List[Dict[str, Any]]]:
+        """Read QA jobs from the page's embedded Next.js data, or None if it isn't there"""
+        try:
+            response = self._get_with_backoff(company_url)
+            response.raise_for_status()
+        except requests.RequestException as e:
+            logger.debug(f"HTTP fetch failed for {company_url}: {e}")
+            return None
+        
+        blob = self._extract_next_data(response.text)
+        if not blob:
+            return None
+        
+        try:
+            postings = _find_job_postings(orjson.loads(blob))
+        except ValueError as e:
+            logger.debug(f"Invalid embedded job data at {company_url}: {e}")
+            return None
+        if postings is None:
+            return None
+        
+        jobs = []
+        for posting in postings:
+            job_data = self._job_from_posting(posting, company_url)
+            
+            if job_data and self._is_qa_job(job_data, job_titles_lc):
+                jobs.append(job_data)
+                
+                if len(jobs) >= max_results:
+                    break
+        
+        return jobs
+    
+    def _get_with_backoff(self, url: str) -> requests.Response:
+        """GET through the rate limiter, backing off exponentially on HTTP 429"""
+        for attempt in range(self.max_retries + 1):
+            self._bucket.acquire()
+            response = self.session.get(url, timeout=15)
+            if response.status_code != 429 or attempt == self.max_retries:
+                return response
+            
+            retry_after = response.headers.get('Retry-After', '')
+            delay = int(retry_after) if retry_after.isdigit() else 2 ** attempt
+            logger.warning(f"Rate limited by {url}, retrying in {delay}s")
+            time.sleep(delay)
+        return response
+    
+    def _extract_next_data(self, html: str) -> Optional[str]:
+        """Return the __NEXT_DATA__ script body from a page, if present"""
+        node = LexborHTMLParser(html).css_first('script#__NEXT_DATA__')
+        return node.text() if node else None
+    
+    def _job_from_posting(self, posting: Dict[str, Any], company_url: str) -> Optional[Dict[str, Any]]:
+        """Build a job record from one embedded Ashby job posting"""
+        title = (posting.get('title') or '').strip()
+        posting_id = posting.get('id')
+        if not title or not posting_id:
+            return None
+        
+        job_url = f"{company_url}/{posting_id}"
+        remote_option = WORKPLACE_TYPE_LABELS.get(posting.get('workplaceType'))
+        if remote_option is None and posting.get('isRemote'):
+            remote_option = 'Remote'
+        
+        return {
+            'title': title,
+            'company': self._extract_company_from_url(job_url),
+            'location': posting.get('locationName') or 'Remote',
+            'url': job_url,
+            'job_board': 'Ashby',
+            'job_type': EMPLOYMENT_TYPE_LABELS.get(posting.get('employmentType')),
+            'remote_option': remote_option,
+            'posted_date': posting.get('publishedDate'),
+            'salary_range': posting.get('compensationTierSummary'),
+            'description_snippet': None  # Will be filled later if needed
+        }
+    
+    async def _scrape_company_page(self, company_url: str, job_titles_lc: Tuple[str, ...], max_results: int) -> List[Dict[str, Any]]:
+        """Scrape company jobs in an isolated context of the shared browser"""
         jobs = []
         
-        # Configure Chrome options
-        options = Options()
-        options.add_argument('--headless')
-        options.add_argument('--disable-blink-features=AutomationControlled')
-        options.add_argument('--disable-dev-shm-usage')
-        options.add_argument('--no-sandbox')
-        options.add_argument('--disable-gpu')
-        options.add_argument('--window-size=1920,1080')
-        options.add_argument('--user-agent=Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/122.0.0.0 Safari/537.36')
+        context = await self._browser.new_context(
+            user_agent=USER_AGENT,
+            viewport={'width': 1920, 'height': 1080}
+        )
+        await context.route("**/*", _block_heavy_resources)
         
         try:
-            service = Service(ChromeDriverManager().install())
-            driver = webdriver.Chrome(service=service, options=options)
-            wait = WebDriverWait(driver, 30)
+            page = await context.new_page()
             
             # Navigate to company page
-            driver.get(company_url)
-            time.sleep(3)
+            await asyncio.to_thread(self._bucket.acquire)
+            await page.goto(company_url, wait_until='domcontentloaded', timeout=30000)
             
-            # Wait for page to load
-            wait.until(EC.presence_of_element_located((By.TAG_NAME, "body")))
+            # Wait for job links to render
+            try:
+                await page.wait_for_selector("a[href*='/jobs/']", timeout=10000)
+            except PlaywrightTimeoutError:
+                logger.debug(f"No job links rendered at {company_url}")
             
             # Look for job listings
-            job_elements = self._find_job_elements(driver)
+            job_links = await self._find_job_elements(page)
             
-            for element in job_elements:
-                try:
-                    job_data = self._extract_job_data(driver, element, company_url)
+            for job_link in job_links:
+                job_data = self._extract_job_data(job_link, company_url)
+                
+                if self._is_qa_job(job_data, job_titles_lc):
+                    jobs.append(job_data)
                     
-                    if job_data and self._is_qa_job(job_data, job_titles):
-                        jobs.append(job_data)
-                        
-                        if len(jobs) >= max_results:
-                            break
-                            
-                except Exception as e:
-                    logger.warning(f"Error extracting job data: {e}")
-                    continue
-            
-            driver.quit()
+                    if len(jobs) >= max_results:
+                        break
             
         except Exception as e:
-            logger.error(f"Error with Selenium scraping: {e}")
-            if 'driver' in locals():
-                driver.quit()
+            logger.error(f"Error with Playwright scraping: {e}")
+        finally:
+            await context.close()
         
         return jobs
     
-    def _find_job_elements(self, driver) -> List:
-        """Find job listing elements on the page"""
-        job_elements = []
-        
-        # Common selectors for Ashby job listings
-        selectors = [
-            "a[href*='/jobs/']",
-            "[data-testid*='job']",
-            ".job-listing",
-            ".job-card",
-            "[class*='job']",
-            "a[href*='careers']"
-        ]
-        
-        for selector in selectors:
-            try:
-                elements = driver.find_elements(By.CSS_SELECTOR, selector)
-                if elements:
-                    job_elements.extend(elements)
-                    logger.debug(f"Found {len(elements)} job elements with selector: {selector}")
-            except Exception as e:
-                logger.debug(f"Selector {selector} failed: {e}")
-                continue
-        
-        # Remove duplicates
-        unique_elements = []
-        seen_urls = set()
-        for element in job_elements:
-            try:
-                url = element.get_attribute('href')
-                if url and url not in seen_urls:
-                    unique_elements.append(element)
-                    seen_urls.add(url)
-            except:
-                continue
-        
-        return unique_elements
-    
-    def _extract_job_data(self, driver, element, company_url: str) -> Optional[Dict[str, Any]]:
-        """Extract job data from an element"""
+    async def _find_job_elements(self, page) -> List[Dict[str, str]]:
+        """Find job listings on the page, deduplicated by href"""
         try:
-            # Get job URL
-            job_url = element.get_attribute('href')
-            if not job_url:
-                return None
-            
-            # Make URL absolute if needed
-            if job_url.startswith('/'):
-                job_url = urljoin(company_url, job_url)
-            
-            # Extract company name from URL
-            company = self._extract_company_from_url(job_url)
-            
-            # Get job title
-            job_title = element.text.strip()
-            if not job_title:
-                # Try to find title in child elements
-                title_elements = element.find_elements(By.CSS_SELECTOR, "h1, h2, h3, h4, h5, h6, [class*='title']")
-                if title_elements:
-                    job_title = title_elements[0].text.strip()
-            
-            # Get additional details if available
-            location = self._extract_location(element)
-            job_type = self._extract_job_type(element)
-            remote_option = self._extract_remote_option(element)
-            
-            return {
-                'title': job_title,
-                'company': company,
-                'location': location or 'Remote',
-                'url': job_url,
-                'job_board': 'Ashby',
-                'job_type': job_type,
-                'remote_option': remote_option,
-                'posted_date': None,  # Ashby doesn't always show this
-                'salary_range': None,  # Ashby doesn't always show this
-                'description_snippet': None  # Will be filled later if needed
-            }
-            
+            job_links = await page.evaluate(
+                COLLECT_JOB_LINKS_JS,
+                [JOB_LISTING_SELECTOR, self._TITLE_CSS, self._LOCATION_CSS]
+            )
+            logger.debug(f"Found {len(job_links)} job listings")
+            return job_links
         except Exception as e:
-            logger.warning(f"Error extracting job data: {e}")
-            return None
+            logger.debug(f"Job listing lookup failed: {e}")
+            return []
     
-    def _is_qa_job(self, job_data: Dict[str, Any], job_titles: List[str]) -> bool:
-        """Check if a job is a QA position"""
-        title = job_data.get('title', '').lower()
+    def _extract_job_data(self, job_link: Dict[str, str], company_url: str) -> Dict[str, Any]:
+        """Extract job data from a collected job listing"""
+        # Get job URL
+        job_url = job_link['href']
+        
+        # Make URL absolute if needed
+        if job_url.startswith('/'):
+            job_url = urljoin(company_url, job_url)
+        
+        # Extract company name from URL
+        company = self._extract_company_from_url(job_url)
         
-        # Check if title matches QA job titles
-        for qa_title in job_titles:
-            if qa_title.lower() in title:
-                return True
+        # Get job title, falling back to the title child element
+        element_text_lc = job_link['text'].lower()
+        job_title = job_link['text'].strip() or job_link['title'].strip()
         
-        # Check for QA keywords in title
-        for keyword in self.qa_keywords:
-            if keyword.lower() in title:
-                return True
+        # Get additional details if available
+        location = self._extract_location(job_link, element_text_lc)
+        job_type = self._extract_job_type(element_text_lc)
+        remote_option = self._extract_remote_option(element_text_lc)
         
-        return False
+        return {
+            'title': job_title,
+            'company': company,
+            'location': location or 'Remote',
+            'url': job_url,
+            'job_board': 'Ashby',
+            'job_type': job_type,
+            'remote_option': remote_option,
+            'posted_date': None,  # Ashby doesn't always show this
+            'salary_range': None,  # Ashby doesn't always show this
+            'description_snippet': None  # Will be filled later if needed
+        }
+    
+    def _is_qa_job(self, job_data: Dict[str, Any], job_titles_lc: Tuple[str, ...]) -> bool:
+        """Check if a job is a QA position (job_titles_lc must be lowercased)"""
+        title = job_data.get('title', '').lower()
+        
+        # Check if title matches QA job titles or QA keywords
+        return (any(qa_title in title for qa_title in job_titles_lc)
+                or any(keyword in title for keyword in self._qa_keywords_lc))
     
     def _extract_company_from_url(self, url: str) -> str:
         """Extract company name from Ashby URL"""
@@ -287,81 +535,42 @@ class AshbyJobSearchAgent:
             pass
         return "Unknown Company"
     
-    def _extract_location(self, element) -> Optional[str]:
-        """Extract location from job element"""
-        try:
-            # Look for location indicators
-            location_selectors = [
-                "[class*='location']",
-                "[class*='place']",
-                "[data-testid*='location']",
-                "span:contains('Remote')",
-                "span:contains('San Francisco')",
-                "span:contains('New York')"
-            ]
-            
-            for selector in location_selectors:
-                try:
-                    location_elem = element.find_element(By.CSS_SELECTOR, selector)
-                    if location_elem:
-                        return location_elem.text.strip()
-                except:
-                    continue
-            
-            # Check element text for location keywords
-            element_text = element.text.lower()
-            location_keywords = ['remote', 'san francisco', 'new york', 'austin', 'seattle', 'boston']
-            
-            for keyword in location_keywords:
-                if keyword in element_text:
-                    return keyword.title()
-                    
-        except Exception as e:
-            logger.debug(f"Error extracting location: {e}")
+    def _extract_location(self, job_link: Dict[str, str], element_text_lc: str) -> Optional[str]:
+        """Extract location from a collected job listing"""
+        # Location child element found in the page
+        location = job_link['location'].strip()
+        if location:
+            return location
         
-        return None
-    
-    def _extract_job_type(self, element) -> Optional[str]:
-        """Extract job type from element"""
-        try:
-            element_text = element.text.lower()
-            
-            if 'full-time' in element_text:
-                return 'Full-time'
-            elif 'part-time' in element_text:
-                return 'Part-time'
-            elif 'contract' in element_text:
-                return 'Contract'
-            elif 'internship' in element_text:
-                return 'Internship'
-                
-        except Exception as e:
-            logger.debug(f"Error extracting job type: {e}")
+        # Check element text for location keywords
+        for keyword in self._LOCATION_KEYWORDS:
+            if keyword in element_text_lc:
+                return keyword.title()
         
         return None
     
-    def _extract_remote_option(self, element) -> Optional[str]:
-        """Extract remote option from element"""
-        try:
-            element_text = element.text.lower()
-            
-            if 'remote' in element_text:
-                return 'Remote'
-            elif 'hybrid' in element_text:
-                return 'Hybrid'
-            elif 'on-site' in element_text or 'onsite' in element_text:
-                return 'On-site'
-                
-        except Exception as e:
-            logger.debug(f"Error extracting remote option: {e}")
-        except:
-            pass
-        return None
+    def _extract_job_type(self, element_text_lc: str) -> Optional[str]:
+        """Extract job type from lowercased element text"""
+        return _match_marker(element_text_lc, JOB_TYPE_MARKERS)
     
-    def get_job_details(self, job_url: str) -> Optional[Dict[str, Any]]:
-        """Get detailed information about a specific job"""
-        try:
-            # Use Selenium to get full job details
+    def _extract_remote_option(self, element_text_lc: str) -> Optional[str]:
+        """Extract remote option from lowercased element text"""
+        return _match_marker(element_text_lc, REMOTE_OPTION_MARKERS)
+    
+    def _get_chrome_service(self) -> Service:
+        """Resolve the ChromeDriver binary once and reuse the Service"""
+        if self._service is None:
+            try:
+                driver_path = ChromeDriverManager().install()
+            except Exception as e:
+                logger.warning(f"ChromeDriverManager unavailable, falling back to PATH: {e}")
+                driver_path = shutil.which("chromedriver")
+            self._service = Service(driver_path)
+        return self._service
+    
+    def _get_driver(self):
+        """Return the shared detail-page driver, launching Chrome on first use"""
+        if self._driver is None:
             options = Options()
             options.add_argument('--headless')
             options.add_argument('--disable-blink-features=AutomationControlled')
@@ -369,203 +578,78 @@ class AshbyJobSearchAgent:
             options.add_argument('--no-sandbox')
             options.add_argument('--disable-gpu')
             
-            service = Service(ChromeDriverManager().install())
-            driver = webdriver.Chrome(service=service, options=options)
-            wait = WebDriverWait(driver, 30)
-            
-            driver.get(job_url)
-            time.sleep(3)
-            
-            wait.until(EC.presence_of_element_located((By.TAG_NAME, "body")))
-            
-            # Extract job details
-            details = {
-                'url': job_url,
-                'title': self._get_job_title(driver),
-                'company': self._get_company_name(driver),
-                'location': self._get_job_location(driver),
-                'description': self._get_job_description(driver),
-                'requirements': self._get_job_requirements(driver),
-                'benefits': self._get_job_benefits(driver),
-                'salary': self._get_job_salary(driver),
-                'job_type': self._get_job_type(driver),
-                'remote_option': self._get_remote_option(driver)
-            }
-            
-            driver.quit()
-            return details
-            
-        except Exception as e:
-            logger.error(f"Error getting job details: {e}")
-            if 'driver' in locals():
-                driver.quit()
-            return None
-    
-    def _get_job_title(self, driver) -> str:
-        """Extract job title from job page"""
-        try:
-            selectors = ["h1", "[class*='title']", "[data-testid*='title']"]
-            for selector in selectors:
-                try:
-                    element = driver.find_element(By.CSS_SELECTOR, selector)
-                    if element:
-                        return element.text.strip()
-                except:
-                    continue
-        except:
-            pass
-        return "Unknown Title"
+            self._driver = webdriver.Chrome(service=self._get_chrome_service(), options=options)
+        return self._driver
     
-    def _get_company_name(self, driver) -> str:
-        """Extract company name from job page"""
-        try:
-            selectors = ["[class*='company']", "[data-testid*='company']", ".company-name"]
-            for selector in selectors:
-                try:
-                    element = driver.find_element(By.CSS_SELECTOR, selector)
-                    if element:
-                        return element.text.strip()
-                except:
-                    continue
-        except:
-            pass
-        return "Unknown Company"
+    def close(self):
+        """Quit the shared detail-page driver"""
+        if self._driver is not None:
+            self._driver.quit()
+            self._driver = None
     
-    def _get_job_location(self, driver) -> str:
-        """Extract job location from job page"""
-        try:
-            selectors = ["[class*='location']", "[data-testid*='location']", ".location"]
-            for selector in selectors:
-                try:
-                    element = driver.find_element(By.CSS_SELECTOR, selector)
-                    if element:
-                        return element.text.strip()
-                except:
-                    continue
-        except:
-            pass
-        return "Remote"
+    def __enter__(self):
+        return self
     
-    def _get_job_description(self, driver) -> str:
-        """Extract job description from job page"""
-        try:
-            selectors = ["[class*='description']", "[data-testid*='description']", ".job-description", "main"]
-            for selector in selectors:
-                try:
-                    element = driver.find_element(By.CSS_SELECTOR, selector)
-                    if element:
-                        return element.text.strip()
-                except:
-                    continue
-        except:
-            pass
-        return ""
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
     
-    def _get_job_requirements(self, driver) -> List[str]:
-        """Extract job requirements from job page"""
+    def get_job_details(self, job_url: str) -> Optional[Dict[str, Any]]:
+        """Get detailed information about a specific job"""
         try:
-            requirements = []
-            selectors = ["[class*='requirement']", "[class*='qualification']", "ul li"]
-            
-            for selector in selectors:
-                try:
-                    elements = driver.find_elements(By.CSS_SELECTOR, selector)
-                    for element in elements:
-                        text = element.text.strip()
-                        if text and len(text) > 10:  # Filter out short text
-                            requirements.append(text)
-                except:
-                    continue
+            # Reuse one Chrome session across detail pages
+            driver = self._get_driver()
+            wait = WebDriverWait(driver, 10)
             
-            return requirements[:10]  # Limit to first 10 requirements
+            driver.get(job_url)
             
-        except Exception as e:
-            logger.debug(f"Error extracting requirements: {e}")
-            return []
-    
-    def _get_job_benefits(self, driver) -> List[str]:
-        """Extract job benefits from job page"""
-        try:
-            benefits = []
-            selectors = ["[class*='benefit']", "[class*='perk']", ".benefits li"]
+            # Wait for the job heading instead of a fixed sleep
+            try:
+                wait.until(EC.presence_of_element_located((By.TAG_NAME, "h1")))
+            except TimeoutException:
+                logger.debug(f"Job heading not found on {job_url}")
             
-            for selector in selectors:
-                try:
-                    elements = driver.find_elements(By.CSS_SELECTOR, selector)
-                    for element in elements:
-                        text = element.text.strip()
-                        if text and len(text) > 5:
-                            benefits.append(text)
-                except:
-                    continue
+            # Extract every field in a single script execution
+            data = driver.execute_script(JOB_DETAILS_JS)
             
-            return benefits[:10]  # Limit to first 10 benefits
+            # Visible page text, lowercased once in the browser for classification
+            page_text_lc = data['pageTextLower']
             
-        except Exception as e:
-            logger.debug(f"Error extracting benefits: {e}")
-            return []
-    
-    def _get_job_salary(self, driver) -> str:
-        """Extract job salary from job page"""
-        try:
-            selectors = ["[class*='salary']", "[class*='compensation']", ".salary"]
-            for selector in selectors:
-                try:
-                    element = driver.find_element(By.CSS_SELECTOR, selector)
-                    if element:
-                        return element.text.strip()
-                except:
-                    continue
-        except:
-            pass
-        return ""
-    
-    def _get_job_type(self, driver) -> str:
-        """Extract job type from job page"""
-        try:
-            element_text = driver.page_source.lower()
+            details = {
+                'url': job_url,
+                'title': data['title'] or "Unknown Title",
+                'company': data['company'] or "Unknown Company",
+                'location': data['location'] or "Remote",
+                'description': data['description'] or "",
+                'requirements': data['requirements'],
+                'benefits': data['benefits'],
+                'salary': data['salary'] or "",
+                'job_type': _match_marker(page_text_lc, JOB_TYPE_MARKERS) or "Full-time",
+                'remote_option': _match_marker(page_text_lc, REMOTE_OPTION_MARKERS) or "Remote"
+            }
             
-            if 'full-time' in element_text:
-                return 'Full-time'
-            elif 'part-time' in element_text:
-                return 'Part-time'
-            elif 'contract' in element_text:
-                return 'Contract'
-            elif 'internship' in element_text:
-                return 'Internship'
-                
-        except Exception as e:
-            logger.debug(f"Error extracting job type: {e}")
-        
-        return "Full-time"
-    
-    def _get_remote_option(self, driver) -> str:
-        """Extract remote option from job page"""
-        try:
-            element_text = driver.page_source.lower()
+            # Keep the shared session small between pages
+            driver.execute_script("window.stop()")
+            driver.delete_all_cookies()
+            return details
             
-            if 'remote' in element_text:
-                return 'Remote'
-            elif 'hybrid' in element_text:
-                return 'Hybrid'
-            elif 'on-site' in element_text or 'onsite' in element_text:
-                return 'On-site'
-                
+        except WebDriverException as e:
+            logger.error(f"Error getting job details: {e}")
+            # The session may be unusable; start a fresh one next time
+            self.close()
+            return None
         except Exception as e:
-            logger.debug(f"Error extracting remote option: {e}")
-        
-        return "Remote"
+            logger.error(f"Error getting job details: {e}")
+            return None
 
 # Example usage
 if __name__ == "__main__":
-    agent = AshbyJobSearchAgent()
-    
-    # Search for QA jobs
-    jobs = agent.search_qa_jobs(max_results=20)
-    
-    print(f"Found {len(jobs)} QA jobs on Ashby:")
-    for i, job in enumerate(jobs, 1):
-        print(f"{i}. {job['title']} at {job['company']}")
-        print(f"   Location: {job['location']}")
-        print(f"   URL: {job['url']}")
-        print() 
\ No newline at end of file
+    with AshbyJobSearchAgent() as agent:
+        # Search for QA jobs
+        jobs = asyncio.run(agent.search_qa_jobs(max_results=20))
+        
+        print(f"Found {len(jobs)} QA jobs on Ashby:")
+        for i, job in enumerate(jobs, 1):
+            print(f"{i}. {job['title']} at {job['company']}")
+            print(f"   Location: {job['location']}")
+            print(f"   URL: {job['url']}")
+            print() 
\ No newline at end of file
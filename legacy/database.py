@@ -5,14 +5,25 @@ Database module for Job Application Agent
 Handles user authentication, profile storage, and job search data.
 """
 
-from sqlalchemy import create_engine, Column, Integer, String, Text, DateTime, Boolean, JSON
+from sqlalchemy import create_engine, event, insert, inspect, select, text, update, Column, ForeignKey, Index, UniqueConstraint, Integer, String, Text, DateTime, Boolean, JSON
+from sqlalchemy.dialects.postgresql import JSONB, insert as pg_insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from sqlalchemy.exc import IntegrityError
 from sqlalchemy.ext.declarative import declarative_base
-from sqlalchemy.orm import sessionmaker, relationship
+from sqlalchemy.orm import load_only, scoped_session, sessionmaker, relationship, selectinload
+from sqlalchemy.pool import StaticPool
 from sqlalchemy.sql import func
-from werkzeug.security import generate_password_hash, check_password_hash
+from cachetools import TTLCache
+import bcrypt
+import asyncio
+import functools
+import hashlib
+import hmac
 import os
-from datetime import datetime
-from typing import Optional, List, Dict, Any
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from typing import Optional, Iterator, List, Dict, Any
 import logging
 
 # Set up logging
@@ -21,13 +32,97 @@ logger = logging.getLogger(__name__)
 
 # Database configuration
 DATABASE_URL = os.getenv("DATABASE_URL", "sqlite:///job_agent.db")
-engine = create_engine(DATABASE_URL, echo=False)
-SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+
+def _engine_options(url: str) -> Dict[str, Any]:
+    """Connection pool settings for the configured backend"""
+    if url.startswith("sqlite"):
+        options = {"connect_args": {"check_same_thread": False}}
+        if url in ("sqlite://", "sqlite:///:memory:"):
+            # Every session must share the one in-memory database
+            options["poolclass"] = StaticPool
+        return options
+    
+    return {
+        "pool_size": 20,
+        "max_overflow": 10,
+        "pool_pre_ping": True,  # Survive database restarts
+        "pool_recycle": 1800,
+    }
+
+# bcrypt cost factor; raise it until a verify takes ~100ms on the server
+BCRYPT_ROUNDS = int(os.getenv("BCRYPT_ROUNDS", "10"))
+
+# Password hashing is CPU-bound; async callers run it here, one hash per core
+_HASH_EXECUTOR = ThreadPoolExecutor(max_workers=os.cpu_count() or 1, thread_name_prefix="password-hash")
+
+def hash_password(password: str) -> str:
+    """Hash a password with bcrypt"""
+    # bcrypt only uses the first 72 bytes
+    return bcrypt.hashpw(password.encode()[:72], bcrypt.gensalt(rounds=BCRYPT_ROUNDS)).decode()
+
+@functools.lru_cache(maxsize=None)
+def _dummy_password_hash() -> str:
+    """Hash checked for unknown emails so they take as long as real ones"""
+    return hash_password("!invalid!")
+
+def _check_legacy_hash(password_hash: str, password: str) -> bool:
+    """Verify a Werkzeug-format pbkdf2/scrypt hash directly with hashlib"""
+    try:
+        method, salt, expected = password_hash.split("$", 2)
+        name, *params = method.split(":")
+        if name == "pbkdf2":
+            digest = params[0] if params else "sha256"
+            iterations = int(params[1]) if len(params) > 1 else 600_000
+            derived = hashlib.pbkdf2_hmac(digest, password.encode(), salt.encode(), iterations)
+        elif name == "scrypt":
+            n, r, p = (int(value) for value in params) if params else (2**15, 8, 1)
+            derived = hashlib.scrypt(password.encode(), salt=salt.encode(), n=n, r=r, p=p,
+                                     maxmem=132 * n * r * p, dklen=64)
+        else:
+            return False
+    except ValueError:
+        return False
+    return hmac.compare_digest(derived.hex(), expected)
+
+def verify_password(password_hash: str, password: str) -> bool:
+    """Check a password against a bcrypt or legacy Werkzeug hash"""
+    if password_hash.startswith("$2"):
+        return bcrypt.checkpw(password.encode()[:72], password_hash.encode())
+    # Hashes created before the switch to bcrypt
+    return _check_legacy_hash(password_hash, password)
+
+# Larger compiled-statement cache so every hot lookup stays cached
+QUERY_CACHE_SIZE = int(os.getenv("SQLALCHEMY_QUERY_CACHE_SIZE", "1200"))
+
+engine = create_engine(DATABASE_URL, echo=False, query_cache_size=QUERY_CACHE_SIZE,
+                       **_engine_options(DATABASE_URL))
+
+if engine.dialect.name == "sqlite":
+    @event.listens_for(engine, "connect")
+    def _set_sqlite_pragmas(dbapi_connection, connection_record):
+        """WAL + NORMAL sync: readers don't block the writer and commits skip most fsyncs"""
+        cursor = dbapi_connection.cursor()
+        cursor.execute("PRAGMA journal_mode=WAL")
+        cursor.execute("PRAGMA synchronous=NORMAL")
+        cursor.execute("PRAGMA temp_store=MEMORY")
+        cursor.execute("PRAGMA mmap_size=268435456")  # 256 MB
+        cursor.execute("PRAGMA cache_size=-65536")  # 64 MB
+        cursor.close()
+
+# Thread-local sessions so a request handler reuses one session
+# expire_on_commit=False: returned objects stay loaded after the unit of work commits
+SessionLocal = scoped_session(sessionmaker(autocommit=False, autoflush=False, expire_on_commit=False, bind=engine))
 Base = declarative_base()
 
+# JSON lists that get filtered on; stored as JSONB on PostgreSQL so GIN indexes apply
+SearchableJSON = JSON().with_variant(JSONB(), "postgresql")
+
 class User(Base):
     """User model for authentication and profile management"""
     __tablename__ = "users"
+    # Fetch SQL-side timestamps with RETURNING so they survive expire_on_commit=False
+    # (default= fills them on tables created before the columns had a server DEFAULT)
+    __mapper_args__ = {"eager_defaults": True}
     
     id = Column(Integer, primary_key=True, index=True)
     email = Column(String(255), unique=True, index=True, nullable=False)
@@ -36,23 +131,28 @@ class User(Base):
     first_name = Column(String(100), nullable=True)
     last_name = Column(String(100), nullable=True)
     is_active = Column(Boolean, default=True)
-    created_at = Column(DateTime, default=func.now())
-    updated_at = Column(DateTime, default=func.now(), onupdate=func.now())
+    created_at = Column(DateTime(timezone=True), default=func.current_timestamp(), server_default=func.now())
+    updated_at = Column(DateTime(timezone=True), default=func.current_timestamp(), server_default=func.now(), onupdate=func.now())
     
-    # Relationships
-    profile = relationship("UserProfile", back_populates="user", uselist=False)
-    job_searches = relationship("JobSearch", back_populates="user")
-    applications = relationship("JobApplication", back_populates="user")
+    # Relationships (lazy="raise": load them explicitly to avoid N+1 queries)
+    profile = relationship("UserProfile", back_populates="user", uselist=False, lazy="raise")
+    job_searches = relationship("JobSearch", back_populates="user", lazy="raise")
+    applications = relationship("JobApplication", back_populates="user", lazy="raise")
 
 class UserProfile(Base):
     """User profile with resume, skills, and preferences"""
     __tablename__ = "user_profiles"
+    __table_args__ = (
+        # Containment lookups such as "profiles with skill X" (PostgreSQL only)
+        Index("ix_user_profiles_skills_gin", "skills", postgresql_using="gin").ddl_if(dialect="postgresql"),
+    )
+    __mapper_args__ = {"eager_defaults": True}
     
     id = Column(Integer, primary_key=True, index=True)
-    user_id = Column(Integer, nullable=False)
+    user_id = Column(Integer, ForeignKey("users.id"), index=True, nullable=False)
     resume_text = Column(Text, nullable=True)
     resume_file_path = Column(String(500), nullable=True)
-    skills = Column(JSON, default=list)  # List of skills
+    skills = Column(SearchableJSON, default=list)  # List of skills
     work_history = Column(JSON, default=list)  # List of work experience
     education = Column(JSON, default=list)  # List of education
     preferences = Column(JSON, default=dict)  # Job preferences
@@ -60,38 +160,51 @@ class UserProfile(Base):
     portfolio_url = Column(String(500), nullable=True)
     phone = Column(String(20), nullable=True)
     location = Column(String(200), nullable=True)
-    created_at = Column(DateTime, default=func.now())
-    updated_at = Column(DateTime, default=func.now(), onupdate=func.now())
+    created_at = Column(DateTime(timezone=True), default=func.current_timestamp(), server_default=func.now())
+    updated_at = Column(DateTime(timezone=True), default=func.current_timestamp(), server_default=func.now(), onupdate=func.now())
     
     # Relationships
-    user = relationship("User", back_populates="profile")
+    user = relationship("User", back_populates="profile", lazy="raise")
 
 class JobSearch(Base):
     """Job search history and preferences"""
     __tablename__ = "job_searches"
+    __table_args__ = (
+        # Covers get_user_searches' (user_id, is_active) filter and user_id lookups
+        Index("ix_jobsearch_user_active", "user_id", "is_active"),
+        # Containment lookups on search criteria (PostgreSQL only)
+        Index("ix_jobsearch_job_titles_gin", "job_titles", postgresql_using="gin").ddl_if(dialect="postgresql"),
+        Index("ix_jobsearch_locations_gin", "locations", postgresql_using="gin").ddl_if(dialect="postgresql"),
+        Index("ix_jobsearch_keywords_gin", "keywords", postgresql_using="gin").ddl_if(dialect="postgresql"),
+    )
+    __mapper_args__ = {"eager_defaults": True}
     
     id = Column(Integer, primary_key=True, index=True)
-    user_id = Column(Integer, nullable=False)
+    user_id = Column(Integer, ForeignKey("users.id"), nullable=False)
     search_name = Column(String(200), nullable=False)
-    job_titles = Column(JSON, default=list)  # List of job titles to search for
-    locations = Column(JSON, default=list)  # List of preferred locations
-    keywords = Column(JSON, default=list)  # Required keywords
+    job_titles = Column(SearchableJSON, default=list)  # List of job titles to search for
+    locations = Column(SearchableJSON, default=list)  # List of preferred locations
+    keywords = Column(SearchableJSON, default=list)  # Required keywords
     excluded_keywords = Column(JSON, default=list)  # Keywords to exclude
     remote_only = Column(Boolean, default=False)
     is_active = Column(Boolean, default=True)
-    created_at = Column(DateTime, default=func.now())
-    updated_at = Column(DateTime, default=func.now(), onupdate=func.now())
+    created_at = Column(DateTime(timezone=True), default=func.current_timestamp(), server_default=func.now())
+    updated_at = Column(DateTime(timezone=True), default=func.current_timestamp(), server_default=func.now(), onupdate=func.now())
     
     # Relationships
-    user = relationship("User", back_populates="job_searches")
-    search_results = relationship("JobSearchResult", back_populates="job_search")
+    user = relationship("User", back_populates="job_searches", lazy="raise")
+    search_results = relationship("JobSearchResult", back_populates="job_search", lazy="raise")
 
 class JobSearchResult(Base):
     """Results from job searches"""
     __tablename__ = "job_search_results"
+    __table_args__ = (
+        # A job re-found by a later scrape is skipped at insert time
+        UniqueConstraint("job_search_id", "url", name="uq_jsr_search_url"),
+    )
     
     id = Column(Integer, primary_key=True, index=True)
-    job_search_id = Column(Integer, nullable=False)
+    job_search_id = Column(Integer, ForeignKey("job_searches.id"), index=True, nullable=False)
     job_title = Column(String(200), nullable=False)
     company = Column(String(200), nullable=False)
     location = Column(String(200), nullable=False)
@@ -104,23 +217,23 @@ class JobSearchResult(Base):
     description_snippet = Column(Text, nullable=True)
     is_applied = Column(Boolean, default=False)
     is_favorite = Column(Boolean, default=False)
-    created_at = Column(DateTime, default=func.now())
+    created_at = Column(DateTime(timezone=True), default=func.current_timestamp(), server_default=func.now())
     
     # Relationships
-    job_search = relationship("JobSearch", back_populates="search_results")
-    applications = relationship("JobApplication", back_populates="job_result")
+    job_search = relationship("JobSearch", back_populates="search_results", lazy="raise")
+    applications = relationship("JobApplication", back_populates="job_result", lazy="raise")
 
 class JobApplication(Base):
     """Job application tracking"""
     __tablename__ = "job_applications"
     
     id = Column(Integer, primary_key=True, index=True)
-    user_id = Column(Integer, nullable=False)
-    job_result_id = Column(Integer, nullable=True)
+    user_id = Column(Integer, ForeignKey("users.id"), index=True, nullable=False)
+    job_result_id = Column(Integer, ForeignKey("job_search_results.id"), nullable=True)
     job_url = Column(String(500), nullable=False)
     job_title = Column(String(200), nullable=False)
     company = Column(String(200), nullable=False)
-    application_date = Column(DateTime, default=func.now())
+    application_date = Column(DateTime(timezone=True), default=func.current_timestamp(), server_default=func.now())
     status = Column(String(50), default="applied")  # applied, interviewed, rejected, accepted
     notes = Column(Text, nullable=True)
     success = Column(Boolean, default=False)
@@ -129,8 +242,45 @@ class JobApplication(Base):
     error_message = Column(Text, nullable=True)
     
     # Relationships
-    user = relationship("User", back_populates="applications")
-    job_result = relationship("JobSearchResult", back_populates="applications")
+    user = relationship("User", back_populates="applications", lazy="raise")
+    job_result = relationship("JobSearchResult", back_populates="applications", lazy="raise")
+
+# create_all never alters an existing table, so databases created before
+# uq_jsr_search_url existed lack the unique index save_search_results' ON
+# CONFLICT (job_search_id, url) targets; older duplicates must go first
+_DEDUPE_RESULT_APPLICATIONS_SQL = text("""
+    UPDATE job_applications SET job_result_id = (
+        SELECT MIN(keep.id) FROM job_search_results dup
+        JOIN job_search_results keep
+          ON keep.job_search_id = dup.job_search_id AND keep.url = dup.url
+        WHERE dup.id = job_applications.job_result_id
+    )
+    WHERE job_result_id IS NOT NULL
+""")
+_DEDUPE_RESULTS_SQL = text("""
+    DELETE FROM job_search_results WHERE id NOT IN (
+        SELECT MIN(id) FROM job_search_results GROUP BY job_search_id, url
+    )
+""")
+_CREATE_RESULT_UNIQUE_INDEX_SQL = text(
+    "CREATE UNIQUE INDEX IF NOT EXISTS uq_jsr_search_url ON job_search_results (job_search_id, url)"
+)
+
+def _ensure_result_unique_index(bind) -> None:
+    """Add the (job_search_id, url) unique index to a job_search_results table that predates it"""
+    columns = ["job_search_id", "url"]
+    inspector = inspect(bind)
+    if any(c["column_names"] == columns for c in inspector.get_unique_constraints("job_search_results")):
+        return
+    if any(i["unique"] and i["column_names"] == columns for i in inspector.get_indexes("job_search_results")):
+        return
+    
+    with bind.begin() as connection:
+        # Point applications at the surviving copy before deleting the rest
+        connection.execute(_DEDUPE_RESULT_APPLICATIONS_SQL)
+        removed = connection.execute(_DEDUPE_RESULTS_SQL).rowcount
+        connection.execute(_CREATE_RESULT_UNIQUE_INDEX_SQL)
+    logger.info(f"Added uq_jsr_search_url to job_search_results, removing {removed} duplicate rows")
 
 # Database operations
 class DatabaseManager:
@@ -143,6 +293,7 @@ class DatabaseManager:
     def create_tables(self):
         """Create all database tables"""
         Base.metadata.create_all(bind=self.engine)
+        _ensure_result_unique_index(self.engine)
         logger.info("Database tables created successfully")
     
     def get_session(self):
@@ -152,6 +303,55 @@ class DatabaseManager:
     def close_session(self, session):
         """Close database session"""
         session.close()
+    
+    @contextmanager
+    def session_scope(self):
+        """Session for a unit of work: commit on success, roll back on error"""
+        session = self.SessionLocal()
+        try:
+            yield session
+            session.commit()
+        except Exception:
+            session.rollback()
+            raise
+        finally:
+            session.close()
+    
+    @contextmanager
+    def read_scope(self):
+        """Session for read-only work: no commit, objects detached on exit"""
+        session = self.SessionLocal()
+        try:
+            yield session
+        finally:
+            session.close()
+
+# Short-lived read caches keyed by user_id; profile and search data change rarely
+# and the same user is read several times per request
+_CACHE_TTL_SECONDS = 30
+_cache_lock = threading.Lock()
+_user_cache = TTLCache(maxsize=10_000, ttl=_CACHE_TTL_SECONDS)
+_profile_cache = TTLCache(maxsize=10_000, ttl=_CACHE_TTL_SECONDS)
+_searches_cache = TTLCache(maxsize=10_000, ttl=_CACHE_TTL_SECONDS)
+_MISSING = object()
+
+def _cache_get(cache: TTLCache, key: Any) -> Any:
+    """Cached value for key, or _MISSING"""
+    with _cache_lock:
+        return cache.get(key, _MISSING)
+
+def _cache_set(cache: TTLCache, key: Any, value: Any) -> None:
+    with _cache_lock:
+        cache[key] = value
+
+def _invalidate_user(user_id: int) -> None:
+    """Drop every cached read for a user after a write"""
+    with _cache_lock:
+        for cache in (_user_cache, _profile_cache, _searches_cache):
+            cache.pop(user_id, None)
+
+# Columns a logged-in user object needs; timestamps are never read on these paths
+_SESSION_USER_COLUMNS = (User.id, User.email, User.username, User.first_name, User.last_name, User.is_active)
 
 class UserManager:
     """User management operations"""
@@ -162,48 +362,76 @@ class UserManager:
     def create_user(self, email: str, username: str, password: str, 
                    first_name: str = None, last_name: str = None) -> Optional[User]:
         """Create a new user"""
-        session = self.db_manager.get_session()
+        user = User(
+            email=email,
+            username=username,
+            password_hash=hash_password(password),
+            first_name=first_name,
+            last_name=last_name
+        )
+        
         try:
-            # Check if user already exists
-            existing_user = session.query(User).filter(
-                (User.email == email) | (User.username == username)
-            ).first()
-            
-            if existing_user:
-                logger.warning(f"User with email {email} or username {username} already exists")
-                return None
-            
-            # Create new user
-            password_hash = generate_password_hash(password)
-            user = User(
-                email=email,
-                username=username,
-                password_hash=password_hash,
-                first_name=first_name,
-                last_name=last_name
-            )
-            
-            session.add(user)
-            session.commit()
-            session.refresh(user)
+            with self.db_manager.session_scope() as session:
+                # The unique indexes on email/username reject duplicates atomically
+                if session.get_bind().dialect.name == "postgresql":
+                    stmt = pg_insert(User).values(
+                        email=email,
+                        username=username,
+                        password_hash=user.password_hash,
+                        first_name=first_name,
+                        last_name=last_name
+                    ).on_conflict_do_nothing().returning(User)
+                    user = session.scalars(stmt).first()
+                    if user is None:
+                        logger.warning(f"User with email {email} or username {username} already exists")
+                        return None
+                else:
+                    session.add(user)
             
             logger.info(f"User {username} created successfully")
             return user
             
+        except IntegrityError:
+            logger.warning(f"User with email {email} or username {username} already exists")
+            return None
         except Exception as e:
-            session.rollback()
             logger.error(f"Error creating user: {e}")
             return None
-        finally:
-            self.db_manager.close_session(session)
     
     def authenticate_user(self, email: str, password: str) -> Optional[User]:
         """Authenticate user with email and password"""
-        session = self.db_manager.get_session()
         try:
-            user = session.query(User).filter(User.email == email).first()
+            with self.db_manager.read_scope() as session:
+                user = session.scalars(select(User).options(
+                    load_only(*_SESSION_USER_COLUMNS, User.password_hash)
+                ).where(User.email == email)).first()
             
-            if user and check_password_hash(user.password_hash, password):
+            if user is None:
+                # Same work as a wrong password so timing doesn't reveal valid emails
+                verify_password(_dummy_password_hash(), password)
+            elif verify_password(user.password_hash, password):
+                logger.info(f"User {user.username} authenticated successfully")
+                return user
+            
+            logger.warning(f"Authentication failed for email: {email}")
+            return None
+            
+        except Exception as e:
+            logger.error(f"Error authenticating user: {e}")
+            return None
+    
+    async def authenticate_user_async(self, email: str, password: str) -> Optional[User]:
+        """Authenticate user without blocking the event loop on the password hash"""
+        try:
+            with self.db_manager.read_scope() as session:
+                user = session.scalars(select(User).options(
+                    load_only(*_SESSION_USER_COLUMNS, User.password_hash)
+                ).where(User.email == email)).first()
+            
+            # Unknown emails verify a dummy hash so timing doesn't reveal valid ones
+            password_hash = user.password_hash if user else _dummy_password_hash()
+            loop = asyncio.get_running_loop()
+            if await loop.run_in_executor(_HASH_EXECUTOR, verify_password, password_hash, password) and user:
                 logger.info(f"User {user.username} authenticated successfully")
                 return user
             
@@ -213,30 +441,35 @@ class UserManager:
         except Exception as e:
             logger.error(f"Error authenticating user: {e}")
             return None
-        finally:
-            self.db_manager.close_session(session)
     
     def get_user_by_id(self, user_id: int) -> Optional[User]:
         """Get user by ID"""
-        session = self.db_manager.get_session()
+        user = _cache_get(_user_cache, user_id)
+        if user is not _MISSING:
+            return user
+        
         try:
-            return session.query(User).filter(User.id == user_id).first()
+            with self.db_manager.read_scope() as session:
+                user = session.scalars(select(User).options(
+                    selectinload(User.profile),
+                    selectinload(User.job_searches).selectinload(JobSearch.search_results)
+                ).where(User.id == user_id)).first()
+            _cache_set(_user_cache, user_id, user)
+            return user
         except Exception as e:
             logger.error(f"Error getting user by ID: {e}")
             return None
-        finally:
-            self.db_manager.close_session(session)
     
     def get_user_by_email(self, email: str) -> Optional[User]:
         """Get user by email"""
-        session = self.db_manager.get_session()
         try:
-            return session.query(User).filter(User.email == email).first()
+            with self.db_manager.read_scope() as session:
+                return session.scalars(select(User).options(
+                    load_only(*_SESSION_USER_COLUMNS)
+                ).where(User.email == email)).first()
         except Exception as e:
             logger.error(f"Error getting user by email: {e}")
             return None
-        finally:
-            self.db_manager.close_session(session)
 
 class ProfileManager:
     """User profile management operations"""
@@ -246,71 +479,97 @@ class ProfileManager:
     
     def create_profile(self, user_id: int, **profile_data) -> Optional[UserProfile]:
         """Create or update user profile"""
-        session = self.db_manager.get_session()
         try:
-            # Check if profile exists
-            profile = session.query(UserProfile).filter(UserProfile.user_id == user_id).first()
-            
-            if profile:
-                # Update existing profile
-                for key, value in profile_data.items():
-                    if hasattr(profile, key):
-                        setattr(profile, key, value)
-                profile.updated_at = datetime.now()
-            else:
-                # Create new profile
-                profile = UserProfile(user_id=user_id, **profile_data)
-                session.add(profile)
-            
-            session.commit()
-            session.refresh(profile)
+            with self.db_manager.session_scope() as session:
+                # Check if profile exists
+                profile = session.scalars(select(UserProfile).where(UserProfile.user_id == user_id)).first()
+                
+                if profile:
+                    # Update existing profile
+                    for key, value in profile_data.items():
+                        if hasattr(profile, key):
+                            setattr(profile, key, value)
+                else:
+                    # Create new profile
+                    profile = UserProfile(user_id=user_id, **profile_data)
+                    session.add(profile)
+                
             
+            _invalidate_user(user_id)
             logger.info(f"Profile updated for user {user_id}")
             return profile
             
         except Exception as e:
-            session.rollback()
             logger.error(f"Error creating/updating profile: {e}")
             return None
-        finally:
-            self.db_manager.close_session(session)
     
     def get_profile(self, user_id: int) -> Optional[UserProfile]:
         """Get user profile"""
-        session = self.db_manager.get_session()
+        profile = _cache_get(_profile_cache, user_id)
+        if profile is not _MISSING:
+            return profile
+        
         try:
-            return session.query(UserProfile).filter(UserProfile.user_id == user_id).first()
+            with self.db_manager.read_scope() as session:
+                profile = session.scalars(select(UserProfile).where(UserProfile.user_id == user_id)).first()
+            _cache_set(_profile_cache, user_id, profile)
+            return profile
         except Exception as e:
             logger.error(f"Error getting profile: {e}")
             return None
-        finally:
-            self.db_manager.close_session(session)
     
     def update_resume(self, user_id: int, resume_text: str, resume_file_path: str = None) -> bool:
         """Update user's resume"""
-        session = self.db_manager.get_session()
         try:
-            profile = session.query(UserProfile).filter(UserProfile.user_id == user_id).first()
-            
-            if not profile:
-                profile = UserProfile(user_id=user_id)
-                session.add(profile)
-            
-            profile.resume_text = resume_text
+            values = {'resume_text': resume_text}
             if resume_file_path:
-                profile.resume_file_path = resume_file_path
-            profile.updated_at = datetime.now()
+                values['resume_file_path'] = resume_file_path
             
-            session.commit()
+            with self.db_manager.session_scope() as session:
+                # Single UPDATE; updated_at comes from the column's onupdate
+                result = session.execute(
+                    update(UserProfile).where(UserProfile.user_id == user_id).values(**values)
+                )
+                
+                if result.rowcount == 0:
+                    session.execute(insert(UserProfile).values(user_id=user_id, **values))
+            
+            _invalidate_user(user_id)
             logger.info(f"Resume updated for user {user_id}")
             return True
             
         except Exception as e:
-            session.rollback()
             logger.error(f"Error updating resume: {e}")
             return False
-        finally:
-            self.db_manager.close_session(session)
+
+# Scraped job dict key -> JobSearchResult column, and the defaults for missing keys
+_RESULT_FIELDS = {
+    'title': 'job_title',
+    'company': 'company',
+    'location': 'location',
+    'url': 'url',
+    'job_board': 'job_board',
+    'posted_date': 'posted_date',
+    'salary_range': 'salary_range',
+    'job_type': 'job_type',
+    'remote_option': 'remote_option',
+    'description_snippet': 'description_snippet',
+}
+_RESULT_DEFAULTS = {
+    'job_title': '',
+    'company': '',
+    'location': '',
+    'url': '',
+    'job_board': 'Ashby',
+    'posted_date': None,
+    'salary_range': None,
+    'job_type': None,
+    'remote_option': None,
+    'description_snippet': None,
+}
+
+# Dialect insert() constructs that support ON CONFLICT DO NOTHING
+_UPSERT_INSERTS = {'postgresql': pg_insert, 'sqlite': sqlite_insert}
 
 class JobSearchManager:
     """Job search management operations"""
@@ -322,89 +581,119 @@ class JobSearchManager:
                          locations: List[str] = None, keywords: List[str] = None,
                          excluded_keywords: List[str] = None, remote_only: bool = False) -> Optional[JobSearch]:
         """Create a new job search"""
-        session = self.db_manager.get_session()
         try:
-            job_search = JobSearch(
-                user_id=user_id,
-                search_name=search_name,
-                job_titles=job_titles,
-                locations=locations or [],
-                keywords=keywords or [],
-                excluded_keywords=excluded_keywords or [],
-                remote_only=remote_only
-            )
-            
-            session.add(job_search)
-            session.commit()
-            session.refresh(job_search)
+            with self.db_manager.session_scope() as session:
+                job_search = JobSearch(
+                    user_id=user_id,
+                    search_name=search_name,
+                    job_titles=job_titles,
+                    locations=locations or [],
+                    keywords=keywords or [],
+                    excluded_keywords=excluded_keywords or [],
+                    remote_only=remote_only
+                )
+                
+                session.add(job_search)
             
+            _invalidate_user(user_id)
             logger.info(f"Job search '{search_name}' created for user {user_id}")
             return job_search
             
         except Exception as e:
-            session.rollback()
             logger.error(f"Error creating job search: {e}")
             return None
-        finally:
-            self.db_manager.close_session(session)
     
     def get_user_searches(self, user_id: int) -> List[JobSearch]:
         """Get all job searches for a user"""
-        session = self.db_manager.get_session()
+        searches = _cache_get(_searches_cache, user_id)
+        if searches is not _MISSING:
+            return searches
+        
         try:
-            return session.query(JobSearch).filter(
-                JobSearch.user_id == user_id,
-                JobSearch.is_active == True
-            ).all()
+            with self.db_manager.read_scope() as session:
+                searches = session.scalars(select(JobSearch).options(
+                    selectinload(JobSearch.search_results)
+                ).where(
+                    JobSearch.user_id == user_id,
+                    JobSearch.is_active == True
+                )).all()
+            _cache_set(_searches_cache, user_id, searches)
+            return searches
         except Exception as e:
             logger.error(f"Error getting user searches: {e}")
             return []
-        finally:
-            self.db_manager.close_session(session)
     
     def save_search_results(self, job_search_id: int, results: List[Dict[str, Any]]) -> bool:
         """Save job search results to database"""
-        session = self.db_manager.get_session()
         try:
-            for result_data in results:
-                job_result = JobSearchResult(
-                    job_search_id=job_search_id,
-                    job_title=result_data.get('title', ''),
-                    company=result_data.get('company', ''),
-                    location=result_data.get('location', ''),
-                    url=result_data.get('url', ''),
-                    job_board=result_data.get('job_board', 'Ashby'),
-                    posted_date=result_data.get('posted_date'),
-                    salary_range=result_data.get('salary_range'),
-                    job_type=result_data.get('job_type'),
-                    remote_option=result_data.get('remote_option'),
-                    description_snippet=result_data.get('description_snippet')
-                )
-                session.add(job_result)
+            with self.db_manager.session_scope() as session:
+                if results:
+                    # One executemany INSERT instead of an ORM object per row
+                    payload = [
+                        {
+                            'job_search_id': job_search_id,
+                            **_RESULT_DEFAULTS,
+                            **{column: result_data[key] for key, column in _RESULT_FIELDS.items() if key in result_data}
+                        }
+                        for result_data in results
+                    ]
+                    dialect = session.get_bind().dialect.name
+                    if dialect in _UPSERT_INSERTS:
+                        stmt = _UPSERT_INSERTS[dialect](JobSearchResult).on_conflict_do_nothing(
+                            index_elements=['job_search_id', 'url']
+                        )
+                    else:
+                        stmt = insert(JobSearchResult)
+                    session.execute(stmt, payload)
             
-            session.commit()
+            # Cached searches embed their results; the owning user isn't known here
+            with _cache_lock:
+                _user_cache.clear()
+                _searches_cache.clear()
             logger.info(f"Saved {len(results)} search results for job search {job_search_id}")
             return True
             
         except Exception as e:
-            session.rollback()
             logger.error(f"Error saving search results: {e}")
             return False
-        finally:
-            self.db_manager.close_session(session)
     
-    def get_search_results(self, job_search_id: int) -> List[JobSearchResult]:
-        """Get search results for a job search"""
-        session = self.db_manager.get_session()
+    def get_search_results(self, job_search_id: int, limit: int = 100,
+                           after_id: Optional[int] = None) -> List[JobSearchResult]:
+        """Get a page of search results, ordered by id; pass the last id seen as after_id"""
         try:
-            return session.query(JobSearchResult).filter(
-                JobSearchResult.job_search_id == job_search_id
-            ).all()
+            stmt = select(JobSearchResult).where(JobSearchResult.job_search_id == job_search_id)
+            if after_id is not None:
+                stmt = stmt.where(JobSearchResult.id > after_id)
+            stmt = stmt.order_by(JobSearchResult.id).limit(limit)
+            
+            with self.db_manager.read_scope() as session:
+                return session.scalars(stmt).all()
         except Exception as e:
             logger.error(f"Error getting search results: {e}")
             return []
-        finally:
-            self.db_manager.close_session(session)
+    
+    def count_search_results(self, job_search_id: int) -> int:
+        """Count search results without loading them"""
+        try:
+            with self.db_manager.read_scope() as session:
+                return session.scalar(
+                    select(func.count()).select_from(JobSearchResult)
+                    .where(JobSearchResult.job_search_id == job_search_id)
+                )
+        except Exception as e:
+            logger.error(f"Error counting search results: {e}")
+            return 0
+    
+    def iter_search_results(self, job_search_id: int, batch_size: int = 500) -> Iterator[JobSearchResult]:
+        """Stream every search result in batches, e.g. for exports"""
+        stmt = (
+            select(JobSearchResult)
+            .where(JobSearchResult.job_search_id == job_search_id)
+            .order_by(JobSearchResult.id)
+            .execution_options(yield_per=batch_size)
+        )
+        with self.db_manager.read_scope() as session:
+            yield from session.scalars(stmt)
 
 # Initialize database
 def init_database():
@@ -413,8 +702,34 @@ def init_database():
     db_manager.create_tables()
     return db_manager
 
-# Global database manager instance
-db_manager = init_database()
-user_manager = UserManager(db_manager)
-profile_manager = ProfileManager(db_manager)
-job_search_manager = JobSearchManager(db_manager) 
\ No newline at end of file
+# Lazily created singletons: importing this module runs no DDL; the first
+# accessor call (e.g. from an app startup hook) creates the tables
+@functools.cache
+def get_db_manager() -> DatabaseManager:
+    """Shared DatabaseManager, initialized on first use"""
+    return init_database()
+
+@functools.cache
+def get_user_manager() -> UserManager:
+    return UserManager(get_db_manager())
+
+@functools.cache
+def get_profile_manager() -> ProfileManager:
+    return ProfileManager(get_db_manager())
+
+@functools.cache
+def get_job_search_manager() -> JobSearchManager:
+    return JobSearchManager(get_db_manager())
+
+_LAZY_GLOBALS = {
+    'db_manager': get_db_manager,
+    'user_manager': get_user_manager,
+    'profile_manager': get_profile_manager,
+    'job_search_manager': get_job_search_manager,
+}
+
+def __getattr__(name: str) -> Any:
+    """Keep `from database import user_manager` working without import-time setup"""
+    if name in _LAZY_GLOBALS:
+        return _LAZY_GLOBALS[name]()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}") 
\ No newline at end of file
@@ -6,10 +6,24 @@ This module provides database operations using Supabase as the backend.
 It replaces the SQLAlchemy implementation with Supabase client.
 """
 
+import asyncio
+import atexit
+import functools
+import hashlib
+import hmac
+import importlib.util
+import json
 import os
-from typing import List, Dict, Any, Optional
+import threading
+import time
+from collections import defaultdict, deque
+from decimal import Decimal
+from typing import Any, Awaitable, Callable, Dict, List, NamedTuple, Optional, Set, TypedDict
 import logging
-from datetime import datetime
+import bcrypt
+import httpx
+import orjson
+from cachetools import TTLCache
 from dotenv import load_dotenv
 
 # Load environment variables
@@ -25,91 +39,454 @@ except ImportError:
     logger.error("Supabase client not installed. Run: pip install supabase")
     raise
 
+try:
+    import asyncpg
+except ImportError:
+    asyncpg = None  # Direct Postgres reads fall back to the REST client
+
+try:
+    import redis
+except ImportError:
+    redis = None  # Read cache falls back to in-process memory
+
+# httpx only negotiates HTTP/2 when the h2 package (httpx[http2]) is installed
+_HTTP2_AVAILABLE = importlib.util.find_spec("h2") is not None
+
+# bcrypt cost factor, shared with the SQLAlchemy backend
+BCRYPT_ROUNDS = int(os.getenv("BCRYPT_ROUNDS", "10"))
+
+def hash_password(password: str) -> str:
+    """Hash a password with bcrypt"""
+    # bcrypt only uses the first 72 bytes
+    return bcrypt.hashpw(password.encode()[:72], bcrypt.gensalt(rounds=BCRYPT_ROUNDS)).decode()
+
+_sha256 = hashlib.sha256
+
+def _sha256_hex(password: str) -> str:
+    return _sha256(password.encode()).hexdigest()
+
+def _is_legacy_hash(password_hash: str) -> bool:
+    """Unsalted SHA-256 hex digests stored before the switch to bcrypt"""
+    return not password_hash.startswith("$2")
+
+def verify_password(password_hash: str, password: str) -> bool:
+    """Check a password against a bcrypt or legacy SHA-256 hash"""
+    if _is_legacy_hash(password_hash):
+        return hmac.compare_digest(password_hash, _sha256_hex(password))
+    return bcrypt.checkpw(password.encode()[:72], password_hash.encode())
+
+@functools.lru_cache(maxsize=None)
+def _dummy_password_hash() -> str:
+    """Hash checked for unknown emails so they take as long as real ones"""
+    return hash_password("!invalid!")
+
+# Successful logins, keyed by (email, sha256(password)), so repeat
+# authentications within the TTL skip the query and the bcrypt check
+_AUTH_CACHE_TTL_SECONDS = 30
+_auth_cache_lock = threading.Lock()
+_auth_cache = TTLCache(maxsize=4096, ttl=_AUTH_CACHE_TTL_SECONDS)
+
+class ReadCache:
+    """Read-through cache for rarely changing rows: Redis when REDIS_URL is set, else in-process"""
+    
+    def __init__(self, redis_url: Optional[str] = None, ttl: int = 300):
+        self.ttl = ttl
+        self._redis = redis.Redis.from_url(redis_url) if redis_url and redis is not None else None
+        self._local = TTLCache(maxsize=10_000, ttl=ttl)
+        self._lock = threading.Lock()
+    
+    def get(self, key: str) -> Any:
+        """Cached value, or None on a miss"""
+        if self._redis is None:
+            with self._lock:
+                return self._local.get(key)
+        try:
+            value = self._redis.get(key)
+            return json.loads(value) if value is not None else None
+        except Exception as e:
+            # A cache outage only costs a database read
+            logger.warning(f"Redis get failed for {key}: {e}")
+            return None
+    
+    def set(self, key: str, value: Any) -> None:
+        if self._redis is None:
+            with self._lock:
+                self._local[key] = value
+            return
+        try:
+            self._redis.setex(key, self.ttl, json.dumps(value, default=str))
+        except Exception as e:
+            logger.warning(f"Redis set failed for {key}: {e}")
+    
+    def delete(self, key: str) -> None:
+        if self._redis is None:
+            with self._lock:
+                self._local.pop(key, None)
+            return
+        try:
+            self._redis.delete(key)
+        except Exception as e:
+            logger.warning(f"Redis delete failed for {key}: {e}")
+
+async def _init_pg_connection(connection) -> None:
+    """Decode json/jsonb columns to Python objects like the REST client does"""
+    for type_name in ('json', 'jsonb'):
+        await connection.set_type_codec(type_name, encoder=json.dumps, decoder=json.loads, schema='pg_catalog')
+
+def _json_default(value: Any) -> Any:
+    """Encode the asyncpg types orjson doesn't know the way PostgREST serialises them"""
+    if isinstance(value, Decimal):
+        return float(value)
+    raise TypeError(f"Type is not JSON serializable: {type(value).__name__}")
+
+def _rest_row(record) -> Dict[str, Any]:
+    """An asyncpg record in the shape the REST client returns (timestamps as ISO strings, UUIDs as str)"""
+    return orjson.loads(orjson.dumps(dict(record), default=_json_default))
+
 class SupabaseManager:
     """Supabase database manager"""
     
     def __init__(self):
         self.supabase_url = os.getenv("SUPABASE_URL")
         self.supabase_key = os.getenv("SUPABASE_KEY")
+        # Supavisor transaction-mode URL (port 6543) for direct reads; optional
+        self.db_url = os.getenv("SUPABASE_DB_URL")
         
         if not self.supabase_url or not self.supabase_key:
             raise ValueError("SUPABASE_URL and SUPABASE_KEY must be set in environment variables")
         
         # Create client without proxy argument
         self.client: Client = create_client(self.supabase_url, self.supabase_key)
+        # An asyncpg pool belongs to the loop that created it, and callers run
+        # each request under its own short-lived asyncio.run. The pool therefore
+        # lives on one long-lived loop in a background thread and every query is
+        # handed to that loop, so all callers share a single pool.
+        self._pool = None
+        self._pool_lock: Optional[asyncio.Lock] = None
+        self._pool_loop: Optional[asyncio.AbstractEventLoop] = None
+        self._pool_loop_lock = threading.Lock()
+        self.cache = ReadCache(os.getenv("REDIS_URL"))
+        self._share_http_client()
         logger.info("Supabase client initialized successfully")
     
+    def _share_http_client(self) -> None:
+        """Give PostgREST (and auth) one larger, HTTP/2 keep-alive pool shared by every manager"""
+        postgrest = getattr(self.client, 'postgrest', None)
+        session = getattr(postgrest, 'session', None)
+        if session is None:
+            return
+        
+        shared = httpx.Client(
+            base_url=session.base_url,
+            headers=session.headers,
+            http2=_HTTP2_AVAILABLE,
+            limits=httpx.Limits(max_connections=100, max_keepalive_connections=50),
+            timeout=10
+        )
+        session.close()
+        postgrest.session = shared
+        
+        auth = getattr(self.client, 'auth', None)
+        if auth is not None and hasattr(auth, '_http_client'):
+            # Auth requests use absolute URLs, so the base_url above doesn't interfere
+            auth._http_client = shared
+    
+    def _loop_for_pool(self) -> asyncio.AbstractEventLoop:
+        """The background event loop that owns the asyncpg pool, started on first use"""
+        with self._pool_loop_lock:
+            if self._pool_loop is None:
+                loop = asyncio.new_event_loop()
+                threading.Thread(target=loop.run_forever, name="supabase-asyncpg", daemon=True).start()
+                self._pool_loop = loop
+                atexit.register(self.close)
+            return self._pool_loop
+    
+    async def _on_pool_loop(self, coro: Awaitable[Any]) -> Any:
+        """Run coro on the pool's loop and await its result from the caller's loop"""
+        return await asyncio.wrap_future(asyncio.run_coroutine_threadsafe(coro, self._loop_for_pool()))
+    
+    async def _open_pool(self):
+        """Create the pool once; always runs on the pool's loop"""
+        if self._pool_lock is None:
+            self._pool_lock = asyncio.Lock()
+        async with self._pool_lock:
+            if self._pool is None:
+                # Transaction-mode pooling can't keep prepared statements across transactions
+                self._pool = await asyncpg.create_pool(
+                    self.db_url,
+                    min_size=2,
+                    max_size=10,
+                    max_inactive_connection_lifetime=1800,
+                    statement_cache_size=0,
+                    init=_init_pg_connection
+                )
+                logger.info("Postgres connection pool created")
+        return self._pool
+    
+    async def get_pool(self):
+        """The shared asyncpg pool, or None when SUPABASE_DB_URL/asyncpg are unavailable
+        
+        The pool is bound to the background loop; run queries through
+        fetch_one/fetch_all rather than on the returned pool directly.
+        """
+        if not self.db_url or asyncpg is None:
+            return None
+        if self._pool is not None:
+            return self._pool
+        return await self._on_pool_loop(self._open_pool())
+    
+    async def close_pool(self) -> None:
+        """Close the asyncpg pool if one was opened"""
+        pool, self._pool = self._pool, None
+        if pool is not None:
+            await self._on_pool_loop(pool.close())
+    
+    def close(self) -> None:
+        """Close the asyncpg pool and stop its loop; registered with atexit once the loop starts"""
+        with self._pool_loop_lock:
+            loop, self._pool_loop = self._pool_loop, None
+        if loop is None:
+            return
+        pool, self._pool = self._pool, None
+        if pool is not None:
+            try:
+                asyncio.run_coroutine_threadsafe(pool.close(), loop).result(timeout=10)
+            except Exception as e:
+                logger.warning(f"Error closing Postgres connection pool: {e}")
+        loop.call_soon_threadsafe(loop.stop)
+        self._pool_lock = None
+    
+    async def _fetch_one(self, query: str, *args) -> Optional[Dict[str, Any]]:
+        pool = await self._open_pool()
+        row = await pool.fetchrow(query, *args)
+        # Same representation as the REST path, since both fill the same cache keys
+        return _rest_row(row) if row else None
+    
+    async def _fetch_all(self, query: str, *args) -> List[Dict[str, Any]]:
+        pool = await self._open_pool()
+        return [_rest_row(row) for row in await pool.fetch(query, *args)]
+    
+    async def fetch_one(self, query: str, *args) -> Optional[Dict[str, Any]]:
+        """Run a parameterized query on the pool and return the first row as a REST-style dict"""
+        return await self._on_pool_loop(self._fetch_one(query, *args))
+    
+    async def fetch_all(self, query: str, *args) -> List[Dict[str, Any]]:
+        """Run a parameterized query on the pool and return every row as a REST-style dict"""
+        return await self._on_pool_loop(self._fetch_all(query, *args))
+    
     def test_connection(self) -> bool:
         """Test the Supabase connection"""
         try:
             # Try a simple query to test connection
-            result = self.client.table('users').select('id').limit(1).execute()
+            _execute(self.client.table('users').select('id').limit(1))
             logger.info("Supabase connection test successful")
             return True
         except Exception as e:
             logger.error(f"Supabase connection test failed: {e}")
             return False
 
+class BatchLoader:
+    """Coalesce single-key async lookups made in the same loop tick into one batched call
+    
+    batch_fn takes a list of keys and returns a dict of the rows found; keys
+    missing from the dict resolve to None.
+    """
+    
+    def __init__(self, batch_fn: Callable[[List[Any]], Awaitable[Dict[Any, Any]]], max_batch_size: int = 100):
+        self.batch_fn = batch_fn
+        self.max_batch_size = max_batch_size
+        self._pending: Dict[Any, asyncio.Future] = {}
+        # Strong references so a running dispatch can't be garbage-collected mid-batch
+        self._dispatches: Set[asyncio.Task] = set()
+    
+    async def load(self, key: Any) -> Any:
+        future = self._pending.get(key)
+        if future is None:
+            loop = asyncio.get_running_loop()
+            if not self._pending:
+                # Dispatch once every caller queued in this tick has registered its key
+                loop.call_soon(self._start_dispatch)
+            future = self._pending[key] = loop.create_future()
+        # The future is shared by every caller of this key; cancelling one caller must not cancel it
+        return await asyncio.shield(future)
+    
+    def _start_dispatch(self) -> None:
+        task = asyncio.ensure_future(self._dispatch())
+        self._dispatches.add(task)
+        task.add_done_callback(self._dispatches.discard)
+    
+    async def _dispatch(self) -> None:
+        pending, self._pending = self._pending, {}
+        keys = list(pending)
+        for start in range(0, len(keys), self.max_batch_size):
+            batch = keys[start:start + self.max_batch_size]
+            try:
+                rows = await self.batch_fn(batch)
+            except Exception as e:
+                for key in batch:
+                    if not pending[key].done():
+                        pending[key].set_exception(e)
+                continue
+            for key in batch:
+                if not pending[key].done():
+                    pending[key].set_result(rows.get(key))
+
+class CircuitOpenError(Exception):
+    """Raised instead of calling Supabase while the circuit breaker is open"""
+
+class CircuitBreaker:
+    """Stop calling a backend that keeps refusing connections, then probe it again after a cool-down"""
+    
+    def __init__(self, failure_threshold: int = 5, reset_timeout: float = 30.0):
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self._failures = 0
+        self._opened_at = None
+        self._lock = threading.Lock()
+    
+    def before_call(self) -> None:
+        with self._lock:
+            if self._opened_at is not None and time.monotonic() - self._opened_at < self.reset_timeout:
+                raise CircuitOpenError("Supabase circuit breaker is open")
+    
+    def record_success(self) -> None:
+        with self._lock:
+            self._failures = 0
+            self._opened_at = None
+    
+    def record_failure(self) -> None:
+        with self._lock:
+            self._failures += 1
+            if self._failures >= self.failure_threshold:
+                self._opened_at = time.monotonic()
+
+# Cap on concurrent Supabase requests so bursts queue here instead of exhausting connections
+SUPABASE_MAX_INFLIGHT = int(os.getenv("SUPABASE_MAX_INFLIGHT", "10"))
+_CONNECT_ATTEMPTS = 3
+_inflight = threading.BoundedSemaphore(SUPABASE_MAX_INFLIGHT)
+_breaker = CircuitBreaker()
+
+def _call(request: Callable[[], Any]) -> Any:
+    """Run a Supabase request with bounded concurrency, connect retries and the circuit breaker"""
+    _breaker.before_call()
+    for attempt in range(_CONNECT_ATTEMPTS):
+        try:
+            with _inflight:
+                response = request()
+        except (httpx.ConnectError, httpx.ConnectTimeout, httpx.PoolTimeout):
+            # Only connection failures count; API errors (e.g. unique violations) are answers
+            if attempt == _CONNECT_ATTEMPTS - 1:
+                _breaker.record_failure()
+                raise
+            time.sleep(min(0.1 * 2 ** attempt, 2.0))
+            continue
+        _breaker.record_success()
+        return response
+
+def _execute(query) -> Any:
+    return _call(query.execute)
+
+def _one(query) -> Optional[Dict[str, Any]]:
+    """Execute a PostgREST query and return its first row, or None"""
+    data = _execute(query).data
+    return data[0] if data else None
+
+def _many(query) -> List[Dict[str, Any]]:
+    """Execute a PostgREST query and return all rows"""
+    return _execute(query).data or []
+
+class RateLimitExceeded(Exception):
+    """Raised when a user has used up their per-minute write allowance"""
+
+class UserRateLimiter:
+    """Sliding one-minute window of allowed calls per user"""
+    
+    def __init__(self, per_minute: int):
+        self.per_minute = per_minute
+        self._calls: Dict[Any, deque] = defaultdict(deque)
+        self._lock = threading.Lock()
+    
+    def allow(self, user_id: Any) -> bool:
+        now = time.monotonic()
+        with self._lock:
+            calls = self._calls[user_id]
+            while calls and now - calls[0] >= 60:
+                calls.popleft()
+            if len(calls) >= self.per_minute:
+                return False
+            calls.append(now)
+            return True
+
+# Column lists shared by the REST selects and the asyncpg SQL; the password
+# hash only leaves the database for authentication, the resume only on request
+_USER_COLUMNS = 'id, email, username, first_name, last_name, is_active, created_at'
+_AUTH_COLUMNS = f'{_USER_COLUMNS}, password_hash'
+_PROFILE_SUMMARY_COLUMNS = 'id, user_id, phone, location, linkedin_url, portfolio_url, skills, resume_file_path'
+
+# Postgres SQLSTATE PostgREST reports for a unique constraint violation
+_UNIQUE_VIOLATION = '23505'
+
 class UserManager:
     """User management operations with Supabase"""
     
     def __init__(self, supabase_manager: SupabaseManager):
+        self.manager = supabase_manager
         self.supabase = supabase_manager.client
+        self._users_by_id = BatchLoader(self._load_users_by_ids)
+        self._users_by_email = BatchLoader(self._load_users_by_emails)
     
     def create_user(self, email: str, username: str, password: str, 
                    first_name: str = None, last_name: str = None) -> Optional[Dict[str, Any]]:
         """Create a new user"""
         try:
-            # Check if user already exists
-            existing_user = self.supabase.table('users').select('*').eq('email', email).execute()
-            if existing_user.data:
-                logger.warning(f"User with email {email} already exists")
-                return None
-            
-            existing_username = self.supabase.table('users').select('*').eq('username', username).execute()
-            if existing_username.data:
-                logger.warning(f"User with username {username} already exists")
-                return None
-            
-            # Hash password (you might want to use a proper hashing library)
-            import hashlib
-            password_hash = hashlib.sha256(password.encode()).hexdigest()
-            
-            # Create user
+            # Create user; the unique constraints on email/username reject duplicates
             user_data = {
                 'email': email,
                 'username': username,
-                'password_hash': password_hash,
+                'password_hash': hash_password(password),
                 'first_name': first_name,
                 'last_name': last_name,
                 'is_active': True
             }
             
-            result = self.supabase.table('users').insert(user_data).execute()
-            
-            if result.data:
-                user = result.data[0]
+            user = _one(self.supabase.table('users').insert(user_data))
+            if user:
+                # The insert echoes the whole row back
+                user.pop('password_hash', None)
                 logger.info(f"User {username} created successfully")
-                return user
-            
-            return None
+            return user
             
         except Exception as e:
+            if getattr(e, 'code', None) == _UNIQUE_VIOLATION:
+                # PostgREST details read e.g. "Key (email)=(a@b.com) already exists."
+                if '(username)' in (getattr(e, 'details', None) or ''):
+                    logger.warning(f"User with username {username} already exists")
+                else:
+                    logger.warning(f"User with email {email} already exists")
+                return None
             logger.error(f"Error creating user: {e}")
             return None
     
     def authenticate_user(self, email: str, password: str) -> Optional[Dict[str, Any]]:
         """Authenticate user with email and password"""
+        cache_key = (email, _sha256_hex(password))
+        with _auth_cache_lock:
+            user = _auth_cache.get(cache_key)
+        if user is not None:
+            return user
+        
         try:
-            # Hash password for comparison
-            import hashlib
-            password_hash = hashlib.sha256(password.encode()).hexdigest()
-            
-            # Find user
-            result = self.supabase.table('users').select('*').eq('email', email).eq('password_hash', password_hash).execute()
+            user = _one(self.supabase.table('users').select(_AUTH_COLUMNS).eq('email', email).limit(1))
             
-            if result.data:
-                user = result.data[0]
+            if user is None:
+                # Same work as a wrong password so timing doesn't reveal valid emails
+                verify_password(_dummy_password_hash(), password)
+            elif verify_password(user['password_hash'], password):
+                # The hash is only needed for this check; never cache or return it
+                if _is_legacy_hash(user.pop('password_hash')):
+                    self._rehash_password(user, password)
+                with _auth_cache_lock:
+                    _auth_cache[cache_key] = user
                 logger.info(f"User {user['username']} authenticated successfully")
                 return user
             
@@ -120,11 +497,28 @@ class UserManager:
             logger.error(f"Error authenticating user: {e}")
             return None
     
+    def _rehash_password(self, user: Dict[str, Any], password: str) -> None:
+        """Upgrade a legacy SHA-256 hash to bcrypt after a successful login"""
+        try:
+            password_hash = hash_password(password)
+            _execute(self.supabase.table('users').update({'password_hash': password_hash}).eq('id', user['id']))
+            self.manager.cache.delete(f"user:{user['id']}")
+        except Exception as e:
+            # The login itself succeeded; retry the upgrade next time
+            logger.warning(f"Could not upgrade password hash for user {user['id']}: {e}")
+    
     def get_user_by_id(self, user_id: int) -> Optional[Dict[str, Any]]:
         """Get user by ID"""
+        cache_key = f"user:{user_id}"
+        user = self.manager.cache.get(cache_key)
+        if user is not None:
+            return user
+        
         try:
-            result = self.supabase.table('users').select('*').eq('id', user_id).execute()
-            return result.data[0] if result.data else None
+            user = _one(self.supabase.table('users').select(_USER_COLUMNS).eq('id', user_id).limit(1))
+            if user is not None:
+                self.manager.cache.set(cache_key, user)
+            return user
         except Exception as e:
             logger.error(f"Error getting user by ID: {e}")
             return None
@@ -132,8 +526,65 @@ class UserManager:
     def get_user_by_email(self, email: str) -> Optional[Dict[str, Any]]:
         """Get user by email"""
         try:
-            result = self.supabase.table('users').select('*').eq('email', email).execute()
-            return result.data[0] if result.data else None
+            return _one(self.supabase.table('users').select(_USER_COLUMNS).eq('email', email).limit(1))
+        except Exception as e:
+            logger.error(f"Error getting user by email: {e}")
+            return None
+    
+    def get_users_by_ids(self, user_ids: List[int]) -> Dict[int, Dict[str, Any]]:
+        """Get many users in one request, keyed by ID"""
+        if not user_ids:
+            return {}
+        try:
+            rows = _many(self.supabase.table('users').select(_USER_COLUMNS).in_('id', list(user_ids)))
+            return {row['id']: row for row in rows}
+        except Exception as e:
+            logger.error(f"Error getting users by ID: {e}")
+            return {}
+    
+    def get_users_by_emails(self, emails: List[str]) -> Dict[str, Dict[str, Any]]:
+        """Get many users in one request, keyed by email"""
+        if not emails:
+            return {}
+        try:
+            rows = _many(self.supabase.table('users').select(_USER_COLUMNS).in_('email', list(emails)))
+            return {row['email']: row for row in rows}
+        except Exception as e:
+            logger.error(f"Error getting users by email: {e}")
+            return {}
+    
+    async def _load_users_by_ids(self, user_ids: List[int]) -> Dict[int, Dict[str, Any]]:
+        if await self.manager.get_pool() is None:
+            return await asyncio.to_thread(self.get_users_by_ids, user_ids)
+        rows = await self.manager.fetch_all(f"SELECT {_USER_COLUMNS} FROM users WHERE id = ANY($1::bigint[])", user_ids)
+        return {row['id']: row for row in rows}
+    
+    async def _load_users_by_emails(self, emails: List[str]) -> Dict[str, Dict[str, Any]]:
+        if await self.manager.get_pool() is None:
+            return await asyncio.to_thread(self.get_users_by_emails, emails)
+        rows = await self.manager.fetch_all(f"SELECT {_USER_COLUMNS} FROM users WHERE email = ANY($1::text[])", emails)
+        return {row['email']: row for row in rows}
+    
+    async def get_user_by_id_async(self, user_id: int) -> Optional[Dict[str, Any]]:
+        """Get user by ID; concurrent calls are coalesced into one query"""
+        cache_key = f"user:{user_id}"
+        user = self.manager.cache.get(cache_key)
+        if user is not None:
+            return user
+        
+        try:
+            user = await self._users_by_id.load(user_id)
+            if user is not None:
+                self.manager.cache.set(cache_key, user)
+            return user
+        except Exception as e:
+            logger.error(f"Error getting user by ID: {e}")
+            return None
+    
+    async def get_user_by_email_async(self, email: str) -> Optional[Dict[str, Any]]:
+        """Get user by email; concurrent calls are coalesced into one query"""
+        try:
+            return await self._users_by_email.load(email)
         except Exception as e:
             logger.error(f"Error getting user by email: {e}")
             return None
@@ -142,29 +593,20 @@ class ProfileManager:
     """User profile management operations with Supabase"""
     
     def __init__(self, supabase_manager: SupabaseManager):
+        self.manager = supabase_manager
         self.supabase = supabase_manager.client
     
     def create_profile(self, user_id: int, **profile_data) -> Optional[Dict[str, Any]]:
         """Create or update user profile"""
         try:
-            # Check if profile exists
-            existing_profile = self.supabase.table('user_profiles').select('*').eq('user_id', user_id).execute()
-            
-            if existing_profile.data:
-                # Update existing profile
-                profile_id = existing_profile.data[0]['id']
-                result = self.supabase.table('user_profiles').update(profile_data).eq('id', profile_id).execute()
-            else:
-                # Create new profile
-                profile_data['user_id'] = user_id
-                result = self.supabase.table('user_profiles').insert(profile_data).execute()
-            
-            if result.data:
-                profile = result.data[0]
+            # One INSERT ... ON CONFLICT (user_id) DO UPDATE instead of select-then-write
+            profile = _one(self.supabase.table('user_profiles').upsert(
+                {**profile_data, 'user_id': user_id}, on_conflict='user_id'
+            ))
+            self.manager.cache.delete(f"user_profile:{user_id}")
+            if profile:
                 logger.info(f"Profile updated for user {user_id}")
-                return profile
-            
-            return None
+            return profile
             
         except Exception as e:
             logger.error(f"Error creating/updating profile: {e}")
@@ -172,9 +614,54 @@ class ProfileManager:
     
     def get_profile(self, user_id: int) -> Optional[Dict[str, Any]]:
         """Get user profile"""
+        cache_key = f"user_profile:{user_id}"
+        profile = self.manager.cache.get(cache_key)
+        if profile is not None:
+            return profile
+        
+        try:
+            profile = _one(self.supabase.table('user_profiles').select('*').eq('user_id', user_id).limit(1))
+            if profile is not None:
+                self.manager.cache.set(cache_key, profile)
+            return profile
+        except Exception as e:
+            logger.error(f"Error getting profile: {e}")
+            return None
+    
+    def get_profile_summary(self, user_id: int) -> Optional[Dict[str, Any]]:
+        """Get contact details and skills without the (large) resume text"""
+        try:
+            return _one(
+                self.supabase.table('user_profiles').select(_PROFILE_SUMMARY_COLUMNS).eq('user_id', user_id).limit(1)
+            )
+        except Exception as e:
+            logger.error(f"Error getting profile summary: {e}")
+            return None
+    
+    def has_resume(self, user_id: int) -> bool:
+        """Whether the user's profile has non-empty resume text, without downloading it"""
         try:
-            result = self.supabase.table('user_profiles').select('*').eq('user_id', user_id).execute()
-            return result.data[0] if result.data else None
+            query = self.supabase.table('user_profiles').select('id').eq('user_id', user_id)
+            return _one(query.not_.is_('resume_text', 'null').neq('resume_text', '').limit(1)) is not None
+        except Exception as e:
+            logger.error(f"Error checking resume: {e}")
+            return False
+    
+    async def get_profile_async(self, user_id: int) -> Optional[Dict[str, Any]]:
+        """Get user profile over the connection pool"""
+        if await self.manager.get_pool() is None:
+            return await asyncio.to_thread(self.get_profile, user_id)
+        
+        cache_key = f"user_profile:{user_id}"
+        profile = self.manager.cache.get(cache_key)
+        if profile is not None:
+            return profile
+        
+        try:
+            profile = await self.manager.fetch_one("SELECT * FROM user_profiles WHERE user_id = $1", user_id)
+            if profile is not None:
+                self.manager.cache.set(cache_key, profile)
+            return profile
         except Exception as e:
             logger.error(f"Error getting profile: {e}")
             return None
@@ -186,7 +673,8 @@ class ProfileManager:
             if resume_file_path:
                 update_data['resume_file_path'] = resume_file_path
             
-            result = self.supabase.table('user_profiles').update(update_data).eq('user_id', user_id).execute()
+            result = _execute(self.supabase.table('user_profiles').update(update_data).eq('user_id', user_id))
+            self.manager.cache.delete(f"user_profile:{user_id}")
             
             if result.data:
                 logger.info(f"Resume updated for user {user_id}")
@@ -198,10 +686,58 @@ class ProfileManager:
             logger.error(f"Error updating resume: {e}")
             return False
 
+class JobSearchResultRow(TypedDict, total=False):
+    """A job_search_results row as sent to and returned by PostgREST"""
+    id: int
+    job_search_id: int
+    job_title: str
+    company: str
+    location: str
+    url: str
+    job_board: str
+    posted_date: Optional[str]
+    salary_range: Optional[str]
+    job_type: Optional[str]
+    remote_option: Optional[str]
+    description_snippet: Optional[str]
+    is_applied: bool
+    is_favorite: bool
+    created_at: str
+
+# Scraped job dict key -> job_search_results column, and the defaults for missing keys
+_RESULT_FIELDS = {
+    'title': 'job_title',
+    'company': 'company',
+    'location': 'location',
+    'url': 'url',
+    'job_board': 'job_board',
+    'posted_date': 'posted_date',
+    'salary_range': 'salary_range',
+    'job_type': 'job_type',
+    'remote_option': 'remote_option',
+    'description_snippet': 'description_snippet',
+}
+_RESULT_DEFAULTS = {
+    'job_title': '',
+    'company': '',
+    'location': '',
+    'url': '',
+    'job_board': 'Ashby',
+    'posted_date': None,
+    'salary_range': None,
+    'job_type': None,
+    'remote_option': None,
+    'description_snippet': None,
+}
+
+# Rows per insert request when saving search results
+RESULT_INSERT_CHUNK_SIZE = 500
+
 class JobSearchManager:
     """Job search management operations with Supabase"""
     
     def __init__(self, supabase_manager: SupabaseManager):
+        self.manager = supabase_manager
         self.supabase = supabase_manager.client
     
     def create_job_search(self, user_id: int, search_name: str, job_titles: List[str],
@@ -220,14 +756,11 @@ class JobSearchManager:
                 'is_active': True
             }
             
-            result = self.supabase.table('job_searches').insert(job_search_data).execute()
-            
-            if result.data:
-                job_search = result.data[0]
+            job_search = _one(self.supabase.table('job_searches').insert(job_search_data))
+            self.manager.cache.delete(f"user_searches:{user_id}")
+            if job_search:
                 logger.info(f"Job search '{search_name}' created for user {user_id}")
-                return job_search
-            
-            return None
+            return job_search
             
         except Exception as e:
             logger.error(f"Error creating job search: {e}")
@@ -235,9 +768,66 @@ class JobSearchManager:
     
     def get_user_searches(self, user_id: int) -> List[Dict[str, Any]]:
         """Get all job searches for a user"""
+        cache_key = f"user_searches:{user_id}"
+        searches = self.manager.cache.get(cache_key)
+        if searches is not None:
+            return searches
+        
+        try:
+            searches = _many(self.supabase.table('job_searches').select('*').eq('user_id', user_id).eq('is_active', True))
+            self.manager.cache.set(cache_key, searches)
+            return searches
+        except Exception as e:
+            logger.error(f"Error getting user searches: {e}")
+            return []
+    
+    def get_user_searches_with_results(self, user_id: int) -> List[Dict[str, Any]]:
+        """Active searches with their results embedded under 'job_search_results', in one request"""
+        try:
+            # PostgREST embeds the child rows through the job_search_id foreign key
+            return _many(
+                self.supabase.table('job_searches')
+                .select('*, job_search_results(*)')
+                .eq('user_id', user_id)
+                .eq('is_active', True)
+            )
+        except Exception as e:
+            logger.error(f"Error getting user searches with results: {e}")
+            return []
+    
+    def find_matching_searches(self, keyword: str, user_id: int = None) -> List[Dict[str, Any]]:
+        """Active searches whose keywords include keyword, filtered by the database"""
         try:
-            result = self.supabase.table('job_searches').select('*').eq('user_id', user_id).eq('is_active', True).execute()
-            return result.data or []
+            # cs (array containment) is served by the GIN index on keywords
+            query = (
+                self.supabase.table('job_searches')
+                .select('id, user_id, search_name')
+                .contains('keywords', [keyword])
+                .eq('is_active', True)
+            )
+            if user_id is not None:
+                query = query.eq('user_id', user_id)
+            return _many(query)
+        except Exception as e:
+            logger.error(f"Error finding matching searches: {e}")
+            return []
+    
+    async def get_user_searches_async(self, user_id: int) -> List[Dict[str, Any]]:
+        """Get all job searches for a user over the connection pool"""
+        if await self.manager.get_pool() is None:
+            return await asyncio.to_thread(self.get_user_searches, user_id)
+        
+        cache_key = f"user_searches:{user_id}"
+        searches = self.manager.cache.get(cache_key)
+        if searches is not None:
+            return searches
+        
+        try:
+            searches = await self.manager.fetch_all(
+                "SELECT * FROM job_searches WHERE user_id = $1 AND is_active", user_id
+            )
+            self.manager.cache.set(cache_key, searches)
+            return searches
         except Exception as e:
             logger.error(f"Error getting user searches: {e}")
             return []
@@ -245,41 +835,62 @@ class JobSearchManager:
     def save_search_results(self, job_search_id: int, results: List[Dict[str, Any]]) -> bool:
         """Save job search results to database"""
         try:
-            # Prepare results data
-            results_data = []
-            for result_data in results:
-                job_result = {
+            results_data: List[JobSearchResultRow] = [
+                {
                     'job_search_id': job_search_id,
-                    'job_title': result_data.get('title', ''),
-                    'company': result_data.get('company', ''),
-                    'location': result_data.get('location', ''),
-                    'url': result_data.get('url', ''),
-                    'job_board': result_data.get('job_board', 'Ashby'),
-                    'posted_date': result_data.get('posted_date'),
-                    'salary_range': result_data.get('salary_range'),
-                    'job_type': result_data.get('job_type'),
-                    'remote_option': result_data.get('remote_option'),
-                    'description_snippet': result_data.get('description_snippet')
+                    **_RESULT_DEFAULTS,
+                    **{column: result_data[key] for key, column in _RESULT_FIELDS.items() if key in result_data}
                 }
-                results_data.append(job_result)
+                for result_data in results
+            ]
             
-            if results_data:
-                result = self.supabase.table('job_search_results').insert(results_data).execute()
-                if result.data:
-                    logger.info(f"Saved {len(results_data)} search results for job search {job_search_id}")
-                    return True
+            if not results_data:
+                return False
             
-            return False
+            # One request per chunk; minimal returning skips echoing the rows back
+            for start in range(0, len(results_data), RESULT_INSERT_CHUNK_SIZE):
+                self._insert_rows('job_search_results', results_data[start:start + RESULT_INSERT_CHUNK_SIZE])
+            
+            logger.info(f"Saved {len(results_data)} search results for job search {job_search_id}")
+            return True
             
         except Exception as e:
             logger.error(f"Error saving search results: {e}")
             return False
     
-    def get_search_results(self, job_search_id: int) -> List[Dict[str, Any]]:
+    def _rest_session(self) -> Optional[httpx.Client]:
+        """The PostgREST httpx session, when the client exposes one"""
+        return getattr(getattr(self.supabase, 'postgrest', None), 'session', None)
+    
+    def _insert_rows(self, table: str, rows: List[JobSearchResultRow]) -> None:
+        """Bulk insert with the body pre-encoded by orjson instead of the client's json.dumps"""
+        session = self._rest_session()
+        if session is None:
+            _execute(self.supabase.table(table).insert(rows, returning='minimal'))
+            return
+        
+        content = orjson.dumps(rows)
+        response = _call(lambda: session.post(
+            f"/{table}",
+            content=content,
+            headers={'Content-Type': 'application/json', 'Prefer': 'return=minimal'}
+        ))
+        response.raise_for_status()
+    
+    def get_search_results(self, job_search_id: int) -> List[JobSearchResultRow]:
         """Get search results for a job search"""
         try:
-            result = self.supabase.table('job_search_results').select('*').eq('job_search_id', job_search_id).execute()
-            return result.data or []
+            session = self._rest_session()
+            if session is None:
+                return _many(self.supabase.table('job_search_results').select('*').eq('job_search_id', job_search_id))
+            
+            # Decode the (potentially large) body with orjson rather than the client's json.loads
+            response = _call(lambda: session.get(
+                "/job_search_results",
+                params={'select': '*', 'job_search_id': f'eq.{job_search_id}'}
+            ))
+            response.raise_for_status()
+            return orjson.loads(response.content)
         except Exception as e:
             logger.error(f"Error getting search results: {e}")
             return []
@@ -288,11 +899,21 @@ class JobApplicationManager:
     """Job application tracking with Supabase"""
     
     def __init__(self, supabase_manager: SupabaseManager):
+        self.manager = supabase_manager
         self.supabase = supabase_manager.client
+        self._rate_limiter = UserRateLimiter(int(os.getenv("SUPABASE_USER_WRITES_PER_MINUTE", "60")))
     
     def create_application(self, user_id: int, job_url: str, job_title: str, company: str,
                           job_result_id: int = None, status: str = 'applied') -> Optional[Dict[str, Any]]:
-        """Create a new job application record"""
+        """Create a new job application record
+        
+        Returns None on a database error; raises RateLimitExceeded when the
+        user is over SUPABASE_USER_WRITES_PER_MINUTE so callers can report it.
+        """
+        if not self._rate_limiter.allow(user_id):
+            logger.warning(f"Rate limit reached for user {user_id}; application for {job_title} not recorded")
+            raise RateLimitExceeded(f"Rate limit reached for user {user_id}; try again in a minute")
+        
         try:
             application_data = {
                 'user_id': user_id,
@@ -304,14 +925,10 @@ class JobApplicationManager:
                 'success': False
             }
             
-            result = self.supabase.table('job_applications').insert(application_data).execute()
-            
-            if result.data:
-                application = result.data[0]
+            application = _one(self.supabase.table('job_applications').insert(application_data))
+            if application:
                 logger.info(f"Job application created for {job_title} at {company}")
-                return application
-            
-            return None
+            return application
             
         except Exception as e:
             logger.error(f"Error creating job application: {e}")
@@ -332,7 +949,7 @@ class JobApplicationManager:
             if error_message is not None:
                 update_data['error_message'] = error_message
             
-            result = self.supabase.table('job_applications').update(update_data).eq('id', application_id).execute()
+            result = _execute(self.supabase.table('job_applications').update(update_data).eq('id', application_id))
             
             if result.data:
                 logger.info(f"Application {application_id} status updated to {status}")
@@ -344,40 +961,85 @@ class JobApplicationManager:
             logger.error(f"Error updating application status: {e}")
             return False
     
-    def get_user_applications(self, user_id: int) -> List[Dict[str, Any]]:
-        """Get all job applications for a user"""
+    def get_user_applications(self, user_id: int, limit: int = 25,
+                              before: Optional[str] = None) -> List[Dict[str, Any]]:
+        """Get a user's most recent job applications, newest first
+        
+        Pass the last row's application_date as before to fetch the next page.
+        """
         try:
-            result = self.supabase.table('job_applications').select('*').eq('user_id', user_id).order('application_date', desc=True).execute()
-            return result.data or []
+            query = self.supabase.table('job_applications').select('*').eq('user_id', user_id)
+            if before is not None:
+                query = query.lt('application_date', before)
+            return _many(query.order('application_date', desc=True).limit(limit))
         except Exception as e:
             logger.error(f"Error getting user applications: {e}")
             return []
+    
+    async def create_application_async(self, user_id: int, job_url: str, job_title: str, company: str,
+                                       job_result_id: int = None, status: str = 'applied') -> Optional[Dict[str, Any]]:
+        """create_application without blocking the event loop"""
+        return await asyncio.to_thread(
+            self.create_application, user_id, job_url, job_title, company, job_result_id, status
+        )
+    
+    async def update_application_status_async(self, application_id: int, status: str, **kwargs) -> bool:
+        """update_application_status without blocking the event loop"""
+        return await asyncio.to_thread(self.update_application_status, application_id, status, **kwargs)
+    
+    async def create_applications_async(self, applications: List[Dict[str, Any]],
+                                        max_concurrency: int = 10) -> List[Any]:
+        """Record many applications concurrently; each dict holds create_application's arguments
+        
+        Each slot of the result is the created row, None after a database
+        error, or the RateLimitExceeded for an application that was refused.
+        """
+        semaphore = asyncio.Semaphore(max_concurrency)
+        
+        async def create(application: Dict[str, Any]) -> Any:
+            async with semaphore:
+                try:
+                    return await self.create_application_async(**application)
+                except RateLimitExceeded as e:
+                    return e
+        
+        return await asyncio.gather(*(create(application) for application in applications))
 
 # Initialize Supabase
 def init_supabase():
-    """Initialize Supabase connection"""
+    """Initialize the Supabase client; connection problems surface on the first query"""
     try:
-        supabase_manager = SupabaseManager()
-        if supabase_manager.test_connection():
-            return supabase_manager
-        else:
-            raise Exception("Failed to connect to Supabase")
+        return SupabaseManager()
     except Exception as e:
         logger.error(f"Failed to initialize Supabase: {e}")
         raise
 
-# Global Supabase manager instance
-try:
-    supabase_manager = init_supabase()
-    user_manager = UserManager(supabase_manager)
-    profile_manager = ProfileManager(supabase_manager)
-    job_search_manager = JobSearchManager(supabase_manager)
-    job_application_manager = JobApplicationManager(supabase_manager)
-except Exception as e:
-    logger.error(f"Failed to initialize Supabase managers: {e}")
-    # Fallback to None for graceful degradation
-    supabase_manager = None
-    user_manager = None
-    profile_manager = None
-    job_search_manager = None
-    job_application_manager = None 
\ No newline at end of file
+class SupabaseManagers(NamedTuple):
+    supabase_manager: Optional[SupabaseManager]
+    user_manager: Optional[UserManager]
+    profile_manager: Optional[ProfileManager]
+    job_search_manager: Optional[JobSearchManager]
+    job_application_manager: Optional[JobApplicationManager]
+
+@functools.lru_cache(maxsize=1)
+def get_managers() -> SupabaseManagers:
+    """Shared managers, created on first use so importing this module does no network I/O"""
+    try:
+        supabase_manager = init_supabase()
+        return SupabaseManagers(
+            supabase_manager,
+            UserManager(supabase_manager),
+            ProfileManager(supabase_manager),
+            JobSearchManager(supabase_manager),
+            JobApplicationManager(supabase_manager)
+        )
+    except Exception as e:
+        logger.error(f"Failed to initialize Supabase managers: {e}")
+        # Fallback to None for graceful degradation
+        return SupabaseManagers(None, None, None, None, None)
+
+def __getattr__(name: str) -> Any:
+    """Keep `from database_supabase import user_manager` working without import-time setup"""
+    if name in SupabaseManagers._fields:
+        return getattr(get_managers(), name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -167,13 +167,15 @@ def demonstrate_batch_processing():
         print(f"Failed: {batch_result.failed_applications}")
         print(f"Execution time: {batch_result.execution_time:.2f} seconds")
         
-        # Show detailed results
-        print(f"\n📋 Detailed Results:")
-        for i, result in enumerate(batch_result.application_results):
-            status = "✅ SUCCESS" if result.get("success") else "❌ FAILED"
-            print(f"{i+1}. {status} - {result.get('url', 'Unknown URL')}")
-            if not result.get("success"):
-                print(f"   Error: {result.get('error_message', 'Unknown error')}")
+        # Show detailed results, written in one call
+        lines = ["\n📋 Detailed Results:"]
+        for i, result in enumerate(batch_result.application_results, 1):
+            if result.get("success"):
+                lines.append(f"{i}. ✅ SUCCESS - {result.get('url', 'Unknown URL')}")
+            else:
+                lines.append(f"{i}. ❌ FAILED - {result.get('url', 'Unknown URL')}")
+                lines.append(f"   Error: {result.get('error_message', 'Unknown error')}")
+        sys.stdout.write("\n".join(lines) + "\n")
         
     except Exception as e:
         print(f"❌ Error: {e}")
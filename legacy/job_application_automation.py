@@ -1,5 +1,5 @@
 from pydantic import BaseModel, Field, field_validator
-from typing import List, Optional, Dict, Any
+from typing import List, Optional, Dict, Any, Tuple
 from langchain_openai import ChatOpenAI
 from langchain_core.tools import tool
 from langchain_core.messages import HumanMessage
@@ -13,21 +13,29 @@ from selenium.webdriver.support import expected_conditions as EC
 from selenium.webdriver.support.ui import Select
 from webdriver_manager.chrome import ChromeDriverManager
 from selenium.common.exceptions import TimeoutException, WebDriverException, NoSuchElementException
+import asyncio
+import atexit
 import json
+import threading
 import time
 import logging
 import re
+import orjson
 import os
 import platform
+from concurrent.futures import Future, ThreadPoolExecutor
+from contextlib import contextmanager
 from enum import Enum
 from dotenv import load_dotenv
 import csv
+import functools
 from datetime import datetime
 from urllib.parse import urlencode, urlparse, quote
-import requests
+import aiohttp
 from bs4 import BeautifulSoup
 import undetected_chromedriver as uc
-from serpapi import GoogleSearch
+
+from ashby_job_search import TokenBucket
 
 # Load environment variables from .env file
 load_dotenv()
@@ -48,6 +56,8 @@ class FieldType(str, Enum):
     CHECKBOX = "checkbox"
     RADIO = "radio"
 
+FIELD_TYPE_VALUES = frozenset(e.value for e in FieldType)
+
 class FormField(BaseModel):
     """Model for individual form fields"""
     label: str = Field(..., description="The label or name of the form field")
@@ -129,124 +139,260 @@ class BatchApplicationResult(BaseModel):
     application_results: List[Dict[str, Any]] = Field(..., description="Detailed results for each application")
     execution_time: float = Field(..., description="Total execution time in seconds")
 
-# TOOL 1: Extract job application form data
-@tool
-def extract_job_application_form(url: str) -> JobFormExtractionResult:
+# Shared Chrome configuration. undetected_chromedriver takes ownership of the
+# options object it is given (and refuses to reuse one), so the arguments are
+# computed once at import and a fresh Options is assembled from them per driver.
+CHROME_ARGUMENTS = (
+    # Enhanced anti-detection measures
+    '--disable-blink-features=AutomationControlled',
+    # Performance and stability
+    '--disable-dev-shm-usage',
+    '--no-sandbox',
+    '--disable-gpu',
+    '--disable-extensions',
+    '--disable-popup-blocking',
+    '--disable-notifications',
+    '--disable-infobars',
+    '--disable-web-security',
+    '--allow-running-insecure-content',
+    # Window and display
+    '--window-size=1920,1080',
+    '--start-maximized',
+    # More realistic user agent
+    '--user-agent=Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
+    # Additional anti-detection. Chrome only honours the last --disable-features
+    # switch, so every feature goes in this one list.
+    '--disable-features=VizDisplayCompositor,TranslateUI,ServiceWorker',
+    '--disable-ipc-flooding-protection',
+    '--disable-renderer-backgrounding',
+    '--disable-background-timer-throttling',
+    '--disable-backgrounding-occluded-windows',
+    '--disable-client-side-phishing-detection',
+    '--disable-default-apps',
+    '--disable-hang-monitor',
+    '--disable-prompt-on-repost',
+    '--disable-sync',
+    '--no-first-run',
+    '--no-default-browser-check',
+    '--disable-component-update',
+    '--disable-domain-reliability',
+    '--disable-ios-password-suggestions',
+)
+
+CHROME_EXPERIMENTAL_OPTIONS = {
+    "excludeSwitches": ["enable-automation"],
+    "useAutomationExtension": False,
+    # Form pages only need their DOM: skip images and notification prompts
+    "prefs": {
+        "profile.managed_default_content_settings.images": 2,
+        "profile.default_content_setting_values.notifications": 2,
+    },
+}
+
+# Root for the persistent per-driver Chrome profiles that keep the HTTP cache
+# warm across runs; set CHROME_PROFILE_DIR to an empty string to disable them
+CHROME_PROFILE_DIR = os.path.expanduser(os.getenv("CHROME_PROFILE_DIR", "~/.cache/job_agent"))
+
+def _build_options(persistent_profile: bool = False) -> Options:
+    """Assemble Chrome options for a new driver from CHROME_ARGUMENTS"""
+    options = Options()
+    # Removed headless mode so you can see the browser
+    for argument in CHROME_ARGUMENTS:
+        options.add_argument(argument)
+    if persistent_profile:
+        options.add_argument('--profile-directory=Default')
+        options.add_argument('--disk-cache-size=200000000')
+    for name, value in CHROME_EXPERIMENTAL_OPTIONS.items():
+        options.add_experimental_option(name, value)
+    # driver.get returns at DOMContentLoaded; callers wait for what they need
+    options.page_load_strategy = 'eager'
+    return options
+
+def _profile_dir(pool_name: str, slot: int) -> Optional[str]:
+    """Persistent user-data-dir for one pool slot, or None when disabled"""
+    if not CHROME_PROFILE_DIR:
+        return None
+    # One directory per slot: Chrome locks a profile to a single running instance
+    return os.path.join(CHROME_PROFILE_DIR, f"chrome_profile_{pool_name}_{slot}")
+
+@functools.cache
+def _chromedriver_path() -> str:
+    """Resolve (downloading on first use) the chromedriver binary for stock Selenium"""
+    return ChromeDriverManager().install()
+
+def _start_chrome(stealth: bool, user_data_dir: Optional[str]):
+    """Start undetected-chromedriver when stealth is needed, stock Selenium Chrome otherwise"""
+    options = _build_options(persistent_profile=user_data_dir is not None)
+    # keep_alive reuses one HTTP connection to chromedriver for every WebDriver command
+    if stealth:
+        # Use undetected-chromedriver for anti-bot
+        return uc.Chrome(options=options, user_data_dir=user_data_dir, keep_alive=True)
+    if user_data_dir:
+        options.add_argument(f'--user-data-dir={user_data_dir}')
+    service = Service(_chromedriver_path(), log_output=os.devnull)
+    return webdriver.Chrome(service=service, options=options, keep_alive=True)
+
+class BrowserPool:
     """
-    Extract form fields from a job application page using Selenium and return structured data.
+    Thread-safe pool of warm Chrome sessions.
     
-    Args:
-        url: The job application URL (e.g., Ashby job posting)
-        
-    Returns:
-        JobFormExtractionResult with detected form fields and suggested data
+    Drivers are started lazily, up to ``size`` of them, and handed back to the
+    pool after each use instead of being quit, so only the first calls pay the
+    Chrome cold start. Each of the ``size`` slots has its own persistent
+    profile directory, so a restarted driver still finds a warm disk cache.
+    Cookies are not kept: they are cleared whenever a driver is returned.
     """
-    logger.info(f"Starting form extraction for URL: {url}")
     
-    # Configure Chrome options with enhanced anti-detection
-    options = Options()
-    # Removed headless mode so you can see the browser
+    def __init__(self, name: str, size: int = 4, stealth: bool = False):
+        self.name = name
+        self.size = size
+        self.stealth = stealth
+        # Guards the idle drivers and free slots; notified whenever either grows
+        self._cond = threading.Condition()
+        self._idle: List[Any] = []
+        self._free_slots = list(range(size))
+        self._slots: Dict[int, int] = {}
     
-    # Enhanced anti-detection measures
-    options.add_argument('--disable-blink-features=AutomationControlled')
-    options.add_experimental_option("excludeSwitches", ["enable-automation"])
-    options.add_experimental_option('useAutomationExtension', False)
+    def _checkout(self):
+        with self._cond:
+            # Wait for an idle driver or a free slot to start one in. A slot
+            # freed by a discarded driver wakes us too, so failures can't
+            # strand a waiter.
+            while not self._idle and not self._free_slots:
+                self._cond.wait()
+            if self._idle:
+                return self._idle.pop()
+            slot = self._free_slots.pop()
+        try:
+            logger.info(f"Starting Chrome for the {self.name} browser pool...")
+            driver = _start_chrome(self.stealth, _profile_dir(self.name, slot))
+        except Exception:
+            with self._cond:
+                self._free_slots.append(slot)
+                self._cond.notify()
+            raise
+        with self._cond:
+            self._slots[id(driver)] = slot
+        return driver
     
-    # Performance and stability
-    options.add_argument('--disable-dev-shm-usage')
-    options.add_argument('--no-sandbox')
-    options.add_argument('--disable-gpu')
-    options.add_argument('--disable-extensions')
-    options.add_argument('--disable-popup-blocking')
-    options.add_argument('--disable-notifications')
-    options.add_argument('--disable-infobars')
-    options.add_argument('--disable-web-security')
-    options.add_argument('--allow-running-insecure-content')
+    def _release(self, driver):
+        with self._cond:
+            self._idle.append(driver)
+            self._cond.notify()
     
-    # Window and display
-    options.add_argument('--window-size=1920,1080')
-    options.add_argument('--start-maximized')
+    def _discard(self, driver):
+        with self._cond:
+            self._free_slots.append(self._slots.pop(id(driver)))
+            self._cond.notify()
+        try:
+            driver.quit()
+        except Exception:
+            pass
     
-    # More realistic user agent
-    options.add_argument('--user-agent=Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36')
+    @contextmanager
+    def acquire(self):
+        """Yield a driver from the pool and return it on exit with every cookie cleared"""
+        driver = self._checkout()
+        try:
+            yield driver
+        except BaseException:
+            # A failed session may be left in an unknown state; replace it
+            self._discard(driver)
+            raise
+        try:
+            # delete_all_cookies() only covers the current page's domain; clear the
+            # whole cookie jar so no job-board session reaches the next user or
+            # the persistent profile. The HTTP cache is kept.
+            driver.execute_cdp_cmd("Network.clearBrowserCookies", {})
+            driver.get("about:blank")
+        except Exception as e:
+            logger.warning(f"Dropping browser that failed to reset: {str(e)}")
+            self._discard(driver)
+        else:
+            self._release(driver)
     
-    # Additional anti-detection
-    options.add_argument('--disable-features=VizDisplayCompositor')
-    options.add_argument('--disable-ipc-flooding-protection')
-    options.add_argument('--disable-renderer-backgrounding')
-    options.add_argument('--disable-background-timer-throttling')
-    options.add_argument('--disable-backgrounding-occluded-windows')
-    options.add_argument('--disable-client-side-phishing-detection')
-    options.add_argument('--disable-default-apps')
-    options.add_argument('--disable-hang-monitor')
-    options.add_argument('--disable-prompt-on-repost')
-    options.add_argument('--disable-sync')
-    options.add_argument('--no-first-run')
-    options.add_argument('--no-default-browser-check')
-    options.add_argument('--disable-component-update')
-    options.add_argument('--disable-domain-reliability')
-    options.add_argument('--disable-features=TranslateUI')
-    options.add_argument('--disable-ios-password-suggestions')
+    def close(self):
+        """Quit every idle driver in the pool"""
+        with self._cond:
+            idle, self._idle = self._idle, []
+        for driver in idle:
+            self._discard(driver)
+
+# Job boards behind bot walls; only these get undetected-chromedriver, whose
+# patched launch is slower than stock chromedriver. Ashby, Greenhouse and
+# Lever forms work with plain Selenium.
+STEALTH_DOMAINS = frozenset({"linkedin.com", "indeed.com", "glassdoor.com"})
+
+BROWSER_POOL = BrowserPool("default", size=int(os.getenv("BROWSER_POOL_SIZE", "4")))
+STEALTH_BROWSER_POOL = BrowserPool("stealth", size=int(os.getenv("BROWSER_POOL_SIZE", "4")), stealth=True)
+atexit.register(BROWSER_POOL.close)
+atexit.register(STEALTH_BROWSER_POOL.close)
+
+def browser_pool_for(url: str) -> BrowserPool:
+    """Pick the stealth pool for domains in STEALTH_DOMAINS, the stock pool otherwise"""
+    host = urlparse(url).hostname or ""
+    if any(host == domain or host.endswith("." + domain) for domain in STEALTH_DOMAINS):
+        return STEALTH_BROWSER_POOL
+    return BROWSER_POOL
+
+# Seconds to wait for the first form control once the document has been parsed
+FORM_FIELD_TIMEOUT = 20
+
+def _open_form_page(driver, url: str):
+    """Navigate to a form page and wait until it has rendered a form control"""
+    # Navigate to URL. With the eager page load strategy this returns at
+    # DOMContentLoaded instead of waiting for every subresource.
+    logger.info(f"Navigating to URL: {url}")
+    driver.get(url)
     
+    # The form is what we need, so return the moment its first control exists,
+    # whether it was in the HTML or is rendered client-side afterwards
     try:
-        # Use undetected-chromedriver for anti-bot
-        driver = uc.Chrome(options=options)
-        wait = WebDriverWait(driver, 30)
-        
-        # Navigate to URL
-        logger.info(f"Navigating to URL: {url}")
-        driver.get(url)
-        time.sleep(5)  # Wait for page load
-        
-        # Wait for page to be ready
-        wait.until(EC.presence_of_element_located((By.TAG_NAME, "body")))
-        wait.until(lambda driver: driver.execute_script('return document.readyState') == 'complete')
-        time.sleep(3)  # Additional wait for dynamic content
-        
-        form_fields = []
+        WebDriverWait(driver, FORM_FIELD_TIMEOUT).until(
+            EC.presence_of_element_located((By.CSS_SELECTOR, "input, textarea, select"))
+        )
+    except TimeoutException:
+        logger.warning(f"No form controls appeared within {FORM_FIELD_TIMEOUT} seconds")
+
+def _load_form_fields(url: str, interactive: bool = False) -> List[FormField]:
+    """Open a URL in a pooled browser and return the form fields on the page"""
+    with browser_pool_for(url).acquire() as driver:
+        _open_form_page(driver, url)
         
-        # Enhanced form field detection
-        field_selectors = [
-            # Input fields
-            "//input[@type='text']",
-            "//input[@type='email']", 
-            "//input[@type='tel']",
-            "//input[@type='url']",
-            "//input[@type='file']",
-            "//textarea",
-            "//select",
-            # Ashby specific
-            "//div[contains(@class, 'form-field')]//input",
-            "//div[contains(@class, 'form-field')]//textarea",
-            "//div[contains(@class, 'form-field')]//select",
-        ]
+        # Snapshot every form field in a single WebDriver round-trip
+        try:
+            form_fields = collect_form_fields(driver)
+        except Exception as e:
+            logger.warning(f"Error collecting form fields, parsing page source instead: {str(e)}")
+            form_fields = parse_form_fields(driver.page_source)
+        for field_info in form_fields:
+            logger.info(f"Found field: {field_info.label} ({field_info.field_type})")
         
-        for selector in field_selectors:
-            try:
-                elements = driver.find_elements(By.XPATH, selector)
-                for element in elements:
-                    try:
-                        # Extract field information
-                        field_info = extract_field_info(driver, element)
-                        if field_info and field_info.label:
-                            form_fields.append(field_info)
-                            logger.info(f"Found field: {field_info.label} ({field_info.field_type})")
-                    except Exception as e:
-                        logger.warning(f"Error processing element: {str(e)}")
-                        continue
-            except Exception as e:
-                logger.warning(f"Error with selector {selector}: {str(e)}")
-                continue
+        if form_fields and interactive:
+            # Keep browser open for a moment so you can see the results
+            logger.info("Extraction complete! Keeping browser open for 3 seconds...")
+            time.sleep(3)  # Reduced from 10 to 3 seconds
         
-        # Remove duplicates based on label
-        unique_fields = []
-        seen_labels = set()
-        for field in form_fields:
-            if field.label.lower() not in seen_labels:
-                unique_fields.append(field)
-                seen_labels.add(field.label.lower())
+        return form_fields
+
+# TOOL 1: Extract job application form data
+@tool
+def extract_job_application_form(url: str, interactive: bool = False) -> JobFormExtractionResult:
+    """
+    Extract form fields from a job application page using Selenium and return structured data.
+    
+    Args:
+        url: The job application URL (e.g., Ashby job posting)
+        interactive: Pause on the finished page so a person watching can review it
         
-        if not unique_fields:
+    Returns:
+        JobFormExtractionResult with detected form fields and suggested data
+    """
+    logger.info(f"Starting form extraction for URL: {url}")
+    
+    try:
+        form_fields = _load_form_fields(url, interactive)
+        if not form_fields:
             return JobFormExtractionResult(
                 url=url,
                 form_fields=[],
@@ -256,15 +402,11 @@ def extract_job_application_form(url: str) -> JobFormExtractionResult:
         
         # Generate suggested data using LLM
         logger.info("Processing form elements with LLM...")
-        suggested_data = generate_suggested_data(unique_fields)
-        
-        # Keep browser open for a moment so you can see the results
-        logger.info("Extraction complete! Keeping browser open for 3 seconds...")
-        time.sleep(3)  # Reduced from 10 to 3 seconds
+        suggested_data = generate_suggested_data(form_fields)
         
         return JobFormExtractionResult(
             url=url,
-            form_fields=unique_fields,
+            form_fields=form_fields,
             success=True,
             suggested_data=suggested_data
         )
@@ -277,238 +419,429 @@ def extract_job_application_form(url: str) -> JobFormExtractionResult:
             success=False,
             error_message=str(e)
         )
-    finally:
-        try:
-            logger.info("Closing browser...")
-            driver.quit()
-        except:
-            pass
 
-def extract_field_info(driver, element) -> Optional[FormField]:
-    """Extract information about a form field element"""
+async def _aextract_job_application_form(url: str) -> JobFormExtractionResult:
+    """Async variant of extract_job_application_form that awaits the LLM call"""
+    logger.info(f"Starting form extraction for URL: {url}")
+    
     try:
-        # Get field type
-        field_type = element.get_attribute("type") or element.tag_name
-        if field_type == "input":
-            field_type = "text"  # default for input without type
-        
-        # Get label
-        label = None
-        
-        # Try different methods to find label
-        element_id = element.get_attribute("id")
-        if element_id:
-            try:
-                label_element = driver.find_element(By.XPATH, f"//label[@for='{element_id}']")
-                label = label_element.text.strip()
-            except:
-                pass
+        # Selenium is blocking, so the browser work runs in a worker thread
+        form_fields = await asyncio.to_thread(_load_form_fields, url)
+        if not form_fields:
+            return JobFormExtractionResult(
+                url=url,
+                form_fields=[],
+                success=False,
+                error_message="No form fields detected on the page"
+            )
         
-        if not label:
-            # Try to find label in parent container
-            try:
-                parent = element.find_element(By.XPATH, "./ancestor::div[contains(@class, 'form-field') or contains(@class, 'field')][1]")
-                label_element = parent.find_element(By.TAG_NAME, "label")
-                label = label_element.text.strip()
-            except:
-                pass
+        logger.info("Processing form elements with LLM...")
+        suggested_data = await _agenerate_suggested_data(form_fields)
         
-        if not label:
-            # Use placeholder or aria-label as fallback
-            label = element.get_attribute("placeholder") or element.get_attribute("aria-label")
+        return JobFormExtractionResult(
+            url=url,
+            form_fields=form_fields,
+            success=True,
+            suggested_data=suggested_data
+        )
         
+    except Exception as e:
+        logger.error(f"Error during form extraction: {str(e)}")
+        return JobFormExtractionResult(
+            url=url,
+            form_fields=[],
+            success=False,
+            error_message=str(e)
+        )
+
+FORM_FIELD_SELECTOR = (
+    'input[type="text"], input[type="email"], input[type="tel"], input[type="url"], '
+    'input[type="file"], textarea, select, div[class*="form-field"] input'
+)
+
+# In-browser XPath builder used by describeField: an id selector when
+# the element has one, otherwise a positional path from <body>
+GET_XPATH_JS = """
+    function getXPath(element) {
+        if (element.id !== '') {
+            return '//*[@id="' + element.id + '"]';
+        }
+        if (element === document.body) {
+            return '/html/body';
+        }
+        var ix = 0;
+        var siblings = element.parentNode.childNodes;
+        for (var i = 0; i < siblings.length; i++) {
+            var sibling = siblings[i];
+            if (sibling === element) {
+                return getXPath(element.parentNode) + '/' + element.tagName.toLowerCase() + '[' + (ix + 1) + ']';
+            }
+            if (sibling.nodeType === 1 && sibling.tagName === element.tagName) {
+                ix++;
+            }
+        }
+    }
+"""
+
+# describeField(element) resolves everything FormField needs for one control
+# in the browser: the label (a <label for=id>, else the label inside the
+# nearest *field* container, else placeholder/aria-label), type, required
+# flag, select options and XPath. Returns null for an unlabelled control.
+DESCRIBE_FIELD_JS = GET_XPATH_JS + """
+    function getLabel(element) {
+        var label = null;
+        if (element.id) {
+            var forLabel = document.querySelector('label[for="' + CSS.escape(element.id) + '"]');
+            if (forLabel) {
+                label = forLabel.innerText.trim();
+            }
+        }
+        if (!label) {
+            var container = element.parentElement && element.parentElement.closest('div[class*="field"]');
+            var containerLabel = container && container.querySelector('label');
+            if (containerLabel) {
+                label = containerLabel.innerText.trim();
+            }
+        }
+        return label || element.getAttribute('placeholder') || element.getAttribute('aria-label');
+    }
+    function describeField(element) {
+        var label = getLabel(element);
+        if (!label || !label.trim()) {
+            return null;
+        }
+        var tag = element.tagName.toLowerCase();
+        return {
+            label: label,
+            type: tag === 'input' ? (element.getAttribute('type') || 'text') : tag,
+            required: element.hasAttribute('required'),
+            placeholder: element.getAttribute('placeholder'),
+            options: tag === 'select'
+                ? Array.from(element.options).map(function (o) { return o.text; }).filter(function (t) { return t.trim(); })
+                : null,
+            xpath: getXPath(element)
+        };
+    }
+"""
+
+# Collects every form field on the page in one execute_script call, so a page
+# costs one WebDriver round-trip instead of several per element.
+COLLECT_FORM_FIELDS_JS = DESCRIBE_FIELD_JS + """
+    var fields = [];
+    var seenLabels = new Set();
+    document.querySelectorAll(arguments[0]).forEach(function (element) {
+        var field = describeField(element);
+        // Keep only the first field for each label
+        var key = field ? field.label.trim().toLowerCase() : '';
+        if (!key || seenLabels.has(key)) {
+            return;
+        }
+        seenLabels.add(key);
+        fields.push(field);
+    });
+    return fields;
+"""
+
+def _form_field_from_script(data: Dict[str, Any]) -> FormField:
+    """Build a FormField from a describeField() result"""
+    field_type = data["type"]
+    return FormField(
+        label=data["label"],
+        field_type=FieldType(field_type) if field_type in FIELD_TYPE_VALUES else FieldType.TEXT,
+        required=data["required"],
+        placeholder=data["placeholder"],
+        options=data["options"],
+        xpath=data["xpath"]
+    )
+
+def collect_form_fields(driver) -> List[FormField]:
+    """Return one FormField per distinct label among the inputs, textareas and selects on the page"""
+    return [
+        _form_field_from_script(data)
+        for data in driver.execute_script(COLLECT_FORM_FIELDS_JS, FORM_FIELD_SELECTOR)
+    ]
+
+def _soup_xpath(tag) -> str:
+    """Build the same XPath as the in-browser getXPath for a parsed tag"""
+    steps = []
+    while tag is not None and tag.name not in ("body", "[document]"):
+        if tag.get("id"):
+            steps.append(f'//*[@id="{tag["id"]}"]')
+            return "".join(reversed(steps))
+        index = len(tag.find_previous_siblings(tag.name)) + 1
+        steps.append(f"/{tag.name}[{index}]")
+        tag = tag.parent
+    steps.append("/html/body")
+    return "".join(reversed(steps))
+
+def parse_form_fields(html: str) -> List[FormField]:
+    """
+    Parse form fields out of rendered page HTML with BeautifulSoup and lxml.
+    
+    Same selection and label rules as collect_form_fields, but needs no live
+    browser, so it also works on a saved or previously fetched page.
+    """
+    soup = BeautifulSoup(html, 'lxml')
+    form_fields = []
+    seen_labels = set()
+    for tag in soup.select(FORM_FIELD_SELECTOR):
+        label = None
+        if tag.get("id"):
+            label_tag = soup.find("label", attrs={"for": tag["id"]})
+            if label_tag:
+                label = label_tag.get_text(strip=True)
         if not label:
-            return None
-        
-        # Get other attributes
-        required = element.get_attribute("required") is not None
-        placeholder = element.get_attribute("placeholder")
+            container = tag.find_parent("div", class_=lambda c: c and "field" in c)
+            label_tag = container.find("label") if container else None
+            if label_tag:
+                label = label_tag.get_text(strip=True)
+        label = label or tag.get("placeholder") or tag.get("aria-label")
+        # Keep only the first field for each label
+        key = label.strip().lower() if label else ""
+        if not key or key in seen_labels:
+            continue
+        seen_labels.add(key)
         
-        # Get options for select elements
+        field_type = (tag.get("type") or "text") if tag.name == "input" else tag.name
         options = None
-        if element.tag_name == "select":
-            try:
-                select_element = Select(element)
-                options = [option.text for option in select_element.options if option.text.strip()]
-            except:
-                pass
-        
-        # Generate XPath
-        xpath = generate_xpath_for_element(driver, element)
+        if tag.name == "select":
+            options = [option.get_text() for option in tag.find_all("option") if option.get_text().strip()]
         
-        return FormField(
+        form_fields.append(FormField(
             label=label,
-            field_type=FieldType(field_type) if field_type in [e.value for e in FieldType] else FieldType.TEXT,
-            required=required,
-            placeholder=placeholder,
+            field_type=FieldType(field_type) if field_type in FIELD_TYPE_VALUES else FieldType.TEXT,
+            required=tag.has_attr("required"),
+            placeholder=tag.get("placeholder"),
             options=options,
-            xpath=xpath
-        )
-        
-    except Exception as e:
-        logger.warning(f"Error extracting field info: {str(e)}")
-        return None
+            xpath=_soup_xpath(tag)
+        ))
+    return form_fields
+
+@functools.cache
+def _chat_model() -> ChatOpenAI:
+    """Shared chat model used to generate suggested form data"""
+    return ChatOpenAI(model="gpt-4o-mini", temperature=0)
+
+# Deterministic answers for the standard contact fields, so only the
+# free-form questions on a form need the LLM. Matched against the lower-cased
+# label with any trailing required-marker or colon removed. Rules are anchored
+# to the short labels contact fields use; a question that merely mentions
+# email or a phone ("Can we email you about future openings?") goes to the LLM.
+FIELD_RULES = {
+    "full_name": (r"^(?:full |legal |your )?name$", "John Doe"),
+    "first_name": (r"^first name$", "John"),
+    "last_name": (r"^(?:last name|surname)$", "Doe"),
+    "email": (r"^(?:your )?e-?mail(?: address)?$", "john.doe@example.com"),
+    "phone": (r"^(?:your )?(?:(?:mobile |cell )?phone|mobile|telephone)(?: number)?$", "555-123-4567"),
+    # "Share any online profiles (LinkedIn, GitHub, ...)" always asks for links
+    "linkedin_url": (r"^(?:your )?linkedin(?: profile)?(?: url| link)?$|online profiles", "https://linkedin.com/in/johndoe"),
+    "portfolio_url": (r"^(?:your )?(?:portfolio|(?:personal )?website|github)(?: profile)?(?: url| link)?$", "https://github.com/johndoe"),
+}
+
+# All rules as one alternation of named groups, so a label is classified in a
+# single regex pass; match.lastgroup names the rule that fired. Each group sits
+# in a lookahead so finditer reports a rule at every position it matches, even
+# inside another rule's match.
+FIELD_RULE_RE = re.compile("|".join(f"(?=(?P<{name}>{pattern}))" for name, (pattern, _) in FIELD_RULES.items()))
+
+# Rules are tried in table order: the first rule matching anywhere in the
+# label wins, wherever in the label another rule matched
+FIELD_RULE_RANK = {name: rank for rank, name in enumerate(FIELD_RULES)}
+
+def _match_field_rule(key: str) -> Optional[str]:
+    """Name of the first FIELD_RULES entry matching key, or None"""
+    names = {match.lastgroup for match in FIELD_RULE_RE.finditer(key)}
+    return min(names, key=FIELD_RULE_RANK.__getitem__, default=None)
+
+# Upload fields are never filled, so they need no suggested value either
+SKIPPED_FIELD_RE = re.compile(r"resume|\bcv\b")
+
+def _apply_rule_table(labels: List[str]) -> Tuple[Dict[str, str], List[str]]:
+    """Answer the labels FIELD_RULES covers, returning (answers, labels still unanswered)"""
+    handled = {}
+    remaining = []
+    for label in labels:
+        key = label.lower().rstrip(" *:")
+        if SKIPPED_FIELD_RE.search(key):
+            logger.info(f"Skipping resume field: {label}")
+            continue
+        rule = _match_field_rule(key)
+        if rule:
+            handled[label] = FIELD_RULES[rule][1]
+        else:
+            remaining.append(label)
+    return handled, remaining
+
+def _suggested_data_prompt(field_labels: List[str]) -> str:
+    """Build the LLM prompt asking for dummy data for the given field labels"""
+    return f"""
+    Generate realistic dummy data for these job application form fields:
+
+    {json.dumps(field_labels, indent=2)}
+
+    Return ONLY a valid JSON object mapping each field label to appropriate dummy data:
+    - For "Name": Use a full name like "Emily Johnson"
+    - For email fields: Use professional email
+    - For online profiles/LinkedIn: Use realistic URLs
+    - For salary: Use realistic numbers with $ symbol
+    - For essay/textarea questions: Provide thorough, professional responses with exactly 2 sentences. Make them detailed and compelling.
+    - For yes/no questions: Answer "Yes" or "No"
+    - For speed/numbers: Use realistic values
+
+    For essay questions, provide detailed, thoughtful responses that demonstrate:
+    - Professional experience and skills
+    - Genuine enthusiasm and motivation
+    - Specific examples and concrete details
+    - Strong communication abilities
+
+    Use the EXACT field labels as keys. Example:
+    {{
+        "Name": "Emily Johnson",
+        "Email": "emily.johnson@email.com",
+        "Share any online profiles (Linkedin, Github, Website, Portfolio, Twitter, etc.)": "https://linkedin.com/in/emilyjohnson, https://github.com/emilyjohnson",
+        "Desired Annual Salary (or OTE if Sales)": "$85,000",
+        "How good are you at what you do? And what does being great mean to you?": "I consistently exceed performance targets and have led three successful product launches that increased company revenue by 40%. Being great means not only delivering exceptional results but also mentoring teammates and continuously learning new skills to stay ahead of industry trends."
+    }}
+
+    Respond with ONLY the JSON object, no other text.
+    """
 
-def generate_xpath_for_element(driver, element) -> str:
-    """Generate a unique XPath for an element"""
+@functools.lru_cache(maxsize=1024)
+def _llm_answer_for_labels(labels: Tuple[str, ...]) -> str:
+    """
+    Raw LLM answer for a set of field labels.
+    
+    Callers pass the labels sorted, so every posting built from the same
+    application template (common on Ashby) shares one completion.
+    """
+    response = _chat_model().invoke([HumanMessage(content=_suggested_data_prompt(list(labels)))])
+    logger.info(f"LLM Raw response: {response.content}")
+    return response.content
+
+# Markdown code fence around an LLM answer, and the outermost JSON object in it
+CODE_FENCE_RE = re.compile(r'^```(?:json)?\s*|\s*```$')
+JSON_OBJECT_RE = re.compile(r'\{.*\}', re.DOTALL)
+
+def _parse_llm_answers(content: str) -> Optional[Dict[str, Any]]:
+    """Decode the JSON object in an LLM answer, or None if there isn't one"""
+    # Clean the response - remove any markdown formatting
+    content = CODE_FENCE_RE.sub("", content.strip())
+    
     try:
-        return driver.execute_script("""
-            function getXPath(element) {
-                if (element.id !== '') {
-                    return '//*[@id="' + element.id + '"]';
-                }
-                if (element === document.body) {
-                    return '/html/body';
-                }
-                var ix = 0;
-                var siblings = element.parentNode.childNodes;
-                for (var i = 0; i < siblings.length; i++) {
-                    var sibling = siblings[i];
-                    if (sibling === element) {
-                        return getXPath(element.parentNode) + '/' + element.tagName.toLowerCase() + '[' + (ix + 1) + ']';
-                    }
-                    if (sibling.nodeType === 1 && sibling.tagName === element.tagName) {
-                        ix++;
-                    }
-                }
-            }
-            return getXPath(arguments[0]);
-        """, element)
-    except:
+        return orjson.loads(content)
+    except orjson.JSONDecodeError as e:
+        logger.error(f"JSON decode error: {e}")
+        logger.error(f"Trying to clean content: {content}")
+        # Try to extract JSON from the response
+        json_match = JSON_OBJECT_RE.search(content)
+        if json_match:
+            return orjson.loads(json_match.group())
+        logger.error("Could not extract JSON from response")
         return None
 
+def _job_data_from_answers(data_dict: Dict[str, Any]) -> JobApplicationData:
+    """Map answers keyed by form label onto JobApplicationData"""
+    # Create a comprehensive mapping of all data for form filling
+    # This includes both the standard JobApplicationData fields and all additional form fields
+    all_form_data = {}
+
+    # Standard field mappings for JobApplicationData
+    mapped_data = {}
+
+    for key, value in data_dict.items():
+        key_lower = key.lower()
+
+        # Map to standard JobApplicationData fields
+        if "name" in key_lower and "first" not in key_lower and "last" not in key_lower:
+            # Split full name into first and last
+            name_parts = str(value).split()
+            if len(name_parts) >= 2:
+                mapped_data["first_name"] = name_parts[0]
+                mapped_data["last_name"] = " ".join(name_parts[1:])
+            else:
+                mapped_data["first_name"] = str(value)
+
+            # IMPORTANT: Store the FULL name for the "Name" field
+            all_form_data["Name"] = str(value)  # Full name like "Emily Johnson"
+            all_form_data["first_name"] = mapped_data.get("first_name", "")
+            all_form_data["last_name"] = mapped_data.get("last_name", "")
+        elif "email" in key_lower:
+            mapped_data["email"] = value
+            all_form_data["Email"] = value
+            all_form_data["email"] = value
+        elif "profiles" in key_lower or "linkedin" in key_lower:
+            mapped_data["linkedin_url"] = value
+            all_form_data[key] = value  # Use exact field name
+            all_form_data["linkedin_url"] = value
+        elif "portfolio" in key_lower or "website" in key_lower:
+            mapped_data["portfolio_url"] = value
+            all_form_data[key] = value
+            all_form_data["portfolio_url"] = value
+        elif "phone" in key_lower:
+            mapped_data["phone"] = value
+            all_form_data[key] = value
+            all_form_data["phone"] = value
+        elif "resume" in key_lower:
+            mapped_data["resume_file"] = value
+            # Skip resume fields in all_form_data since we don't want to fill them
+            logger.info(f"Skipping resume field: {key}")
+        elif "cover" in key_lower:
+            mapped_data["cover_letter"] = value
+            all_form_data[key] = value
+            all_form_data["cover_letter"] = value
+        else:
+            # Add to additional_info for JobApplicationData
+            if "additional_info" not in mapped_data:
+                mapped_data["additional_info"] = {}
+            mapped_data["additional_info"][key] = value
+
+            # Also add to all_form_data for direct field matching
+            all_form_data[key] = value
+
+    # Create JobApplicationData object
+    job_data = JobApplicationData(**mapped_data)
+
+    # Store the comprehensive form data in additional_info for access during form filling
+    if not job_data.additional_info:
+        job_data.additional_info = {}
+    job_data.additional_info.update(all_form_data)
+
+    return job_data
+
+def _suggested_data_from_llm(answers: Dict[str, Any], content: str) -> JobApplicationData:
+    """Merge the LLM's answers into the rule-table answers"""
+    llm_answers = _parse_llm_answers(content)
+    if llm_answers is None:
+        # Don't keep serving an unparseable completion from the cache
+        _llm_answer_for_labels.cache_clear()
+        return create_fallback_data()
+    answers.update(llm_answers)
+    return _job_data_from_answers(answers)
+
 def generate_suggested_data(form_fields: List[FormField]) -> JobApplicationData:
     """Generate suggested dummy data based on detected form fields"""
     try:
-        model = init_chat_model("gpt-4o-mini", model_provider="openai", temperature=0)
+        answers, remaining = _apply_rule_table([field.label for field in form_fields])
+        if not remaining:
+            return _job_data_from_answers(answers)
         
-        # Extract just the field labels for cleaner prompt
-        field_labels = [field.label for field in form_fields]
+        content = _llm_answer_for_labels(tuple(sorted(remaining)))
+        return _suggested_data_from_llm(answers, content)
         
-        prompt = f"""
-        Generate realistic dummy data for these job application form fields:
-        
-        {json.dumps(field_labels, indent=2)}
-        
-        Return ONLY a valid JSON object mapping each field label to appropriate dummy data:
-        - For "Name": Use a full name like "Emily Johnson"
-        - For email fields: Use professional email
-        - For online profiles/LinkedIn: Use realistic URLs
-        - For salary: Use realistic numbers with $ symbol
-        - For essay/textarea questions: Provide thorough, professional responses with exactly 2 sentences. Make them detailed and compelling.
-        - For yes/no questions: Answer "Yes" or "No"
-        - For speed/numbers: Use realistic values
-        
-        For essay questions, provide detailed, thoughtful responses that demonstrate:
-        - Professional experience and skills
-        - Genuine enthusiasm and motivation
-        - Specific examples and concrete details
-        - Strong communication abilities
-        
-        Use the EXACT field labels as keys. Example:
-        {{
-            "Name": "Emily Johnson",
-            "Email": "emily.johnson@email.com",
-            "Share any online profiles (Linkedin, Github, Website, Portfolio, Twitter, etc.)": "https://linkedin.com/in/emilyjohnson, https://github.com/emilyjohnson",
-            "Desired Annual Salary (or OTE if Sales)": "$85,000",
-            "How good are you at what you do? And what does being great mean to you?": "I consistently exceed performance targets and have led three successful product launches that increased company revenue by 40%. Being great means not only delivering exceptional results but also mentoring teammates and continuously learning new skills to stay ahead of industry trends."
-        }}
-        
-        Respond with ONLY the JSON object, no other text.
-        """
-        
-        response = model.invoke([HumanMessage(content=prompt)])
-        logger.info(f"LLM Raw response: {response.content}")
-        
-        # Clean the response - remove any markdown formatting
-        content = response.content.strip()
-        if content.startswith("```json"):
-            content = content[7:]
-        if content.startswith("```"):
-            content = content[3:]
-        if content.endswith("```"):
-            content = content[:-3]
-        content = content.strip()
-        
-        try:
-            data_dict = json.loads(content)
-        except json.JSONDecodeError as e:
-            logger.error(f"JSON decode error: {e}")
-            logger.error(f"Trying to clean content: {content}")
-            # Try to extract JSON from the response
-            json_match = re.search(r'\{.*\}', content, re.DOTALL)
-            if json_match:
-                data_dict = json.loads(json_match.group())
-            else:
-                logger.error("Could not extract JSON from response")
-                return create_fallback_data()
-        
-        # Create a comprehensive mapping of all data for form filling
-        # This includes both the standard JobApplicationData fields and all additional form fields
-        all_form_data = {}
-        
-        # Standard field mappings for JobApplicationData
-        mapped_data = {}
-        
-        for key, value in data_dict.items():
-            key_lower = key.lower()
-            
-            # Map to standard JobApplicationData fields
-            if "name" in key_lower and "first" not in key_lower and "last" not in key_lower:
-                # Split full name into first and last
-                name_parts = str(value).split()
-                if len(name_parts) >= 2:
-                    mapped_data["first_name"] = name_parts[0]
-                    mapped_data["last_name"] = " ".join(name_parts[1:])
-                else:
-                    mapped_data["first_name"] = str(value)
-                
-                # IMPORTANT: Store the FULL name for the "Name" field
-                all_form_data["Name"] = str(value)  # Full name like "Emily Johnson"
-                all_form_data["first_name"] = mapped_data.get("first_name", "")
-                all_form_data["last_name"] = mapped_data.get("last_name", "")
-            elif "email" in key_lower:
-                mapped_data["email"] = value
-                all_form_data["Email"] = value
-                all_form_data["email"] = value
-            elif "profiles" in key_lower or "linkedin" in key_lower:
-                mapped_data["linkedin_url"] = value
-                all_form_data[key] = value  # Use exact field name
-                all_form_data["linkedin_url"] = value
-            elif "portfolio" in key_lower or "website" in key_lower:
-                mapped_data["portfolio_url"] = value
-                all_form_data[key] = value
-                all_form_data["portfolio_url"] = value
-            elif "phone" in key_lower:
-                mapped_data["phone"] = value
-                all_form_data[key] = value
-                all_form_data["phone"] = value
-            elif "resume" in key_lower:
-                mapped_data["resume_file"] = value
-                # Skip resume fields in all_form_data since we don't want to fill them
-                logger.info(f"Skipping resume field: {key}")
-            elif "cover" in key_lower:
-                mapped_data["cover_letter"] = value
-                all_form_data[key] = value
-                all_form_data["cover_letter"] = value
-            else:
-                # Add to additional_info for JobApplicationData
-                if "additional_info" not in mapped_data:
-                    mapped_data["additional_info"] = {}
-                mapped_data["additional_info"][key] = value
-                
-                # Also add to all_form_data for direct field matching
-                all_form_data[key] = value
-        
-        # Create JobApplicationData object
-        job_data = JobApplicationData(**mapped_data)
-        
-        # Store the comprehensive form data in additional_info for access during form filling
-        if not job_data.additional_info:
-            job_data.additional_info = {}
-        job_data.additional_info.update(all_form_data)
+    except Exception as e:
+        logger.error(f"Error generating suggested data: {str(e)}")
+        return create_fallback_data()
+
+async def _agenerate_suggested_data(form_fields: List[FormField]) -> JobApplicationData:
+    """Async variant of generate_suggested_data that keeps the LLM call off the event loop"""
+    try:
+        answers, remaining = _apply_rule_table([field.label for field in form_fields])
+        if not remaining:
+            return _job_data_from_answers(answers)
         
-        return job_data
+        # Goes through the same completion cache as the sync path
+        content = await asyncio.to_thread(_llm_answer_for_labels, tuple(sorted(remaining)))
+        return _suggested_data_from_llm(answers, content)
         
     except Exception as e:
         logger.error(f"Error generating suggested data: {str(e)}")
@@ -538,101 +871,87 @@ def create_fallback_data() -> JobApplicationData:
 
 # TOOL 2: Fill out job application form
 @tool  
-def fill_job_application_form(url: str, form_data: dict) -> FormFillResult:
+def fill_job_application_form(url: str, form_data: dict, interactive: bool = False) -> FormFillResult:
     """
     Fill out a job application form using the provided data.
     
     Args:
         url: The job application URL
         form_data: Dictionary containing the form data to fill
+        interactive: Slow down and pause on the filled form so a person watching can review it
         
     Returns:
         FormFillResult with success status and details
     """
     logger.info(f"Starting form filling for URL: {url}")
     
-    # Configure Chrome options (visible browser window)
-    options = Options()
-    # Removed headless mode so you can see the browser
-    options.add_argument('--disable-blink-features=AutomationControlled')
-    options.add_argument('--disable-dev-shm-usage')
-    options.add_argument('--no-sandbox')
-    options.add_argument('--disable-gpu')
-    options.add_argument('--window-size=1920,1080')
-    
     filled_fields = []
     failed_fields = []
     filled_elements = set()  # Track elements we've already filled to avoid duplicates
     
     try:
-        # Use undetected-chromedriver for anti-bot
-        driver = uc.Chrome(options=options)
-        wait = WebDriverWait(driver, 30)
-        
-        # Navigate to URL
-        logger.info(f"Navigating to URL: {url}")
-        driver.get(url)
-        time.sleep(5)
-        
-        # Wait for page to load
-        wait.until(EC.presence_of_element_located((By.TAG_NAME, "body")))
-        time.sleep(3)
+        with browser_pool_for(url).acquire() as driver:
+            _open_form_page(driver, url)
+            _prime_lowercase_attrs(driver)
         
-        logger.info("Starting to fill form fields...")
+            logger.info("Starting to fill form fields...")
         
-        # Prioritize certain fields and avoid conflicts
-        priority_fields = []
-        regular_fields = []
+            # Prioritize certain fields and avoid conflicts
+            priority_fields = []
+            regular_fields = []
         
-        for field_name, field_value in form_data.items():
-            if not field_value:
-                continue
+            for field_name, field_value in form_data.items():
+                if not field_value:
+                    continue
             
-            # Prioritize exact field names over generic mappings
-            if field_name in ["Name", "Email", "Share any online profiles (Linkedin, Github, Website, Portfolio, Twitter, etc.)"]:
-                priority_fields.append((field_name, field_value))
-            elif field_name not in ["first_name", "last_name", "email", "linkedin_url", "resume_file", "Resume"]:
-                # Skip generic mappings if we have exact field names, and skip resume fields
-                regular_fields.append((field_name, field_value))
-        
-        # Process priority fields first
-        all_fields_to_process = priority_fields + regular_fields
-        
-        for field_name, field_value in all_fields_to_process:
-            try:
-                logger.info(f"Looking for field: {field_name}")
-                input_element = find_input_element(driver, field_name, field_value)
-                if input_element:
-                    # Check if we've already filled this element
-                    element_id = input_element.get_attribute('id') or input_element.get_attribute('name') or str(hash(input_element))
+                # Prioritize exact field names over generic mappings
+                if field_name in ["Name", "Email", "Share any online profiles (Linkedin, Github, Website, Portfolio, Twitter, etc.)"]:
+                    priority_fields.append((field_name, field_value))
+                elif field_name not in ["first_name", "last_name", "email", "linkedin_url", "resume_file", "Resume"]:
+                    # Skip generic mappings if we have exact field names, and skip resume fields
+                    regular_fields.append((field_name, field_value))
+        
+            # Process priority fields first
+            all_fields_to_process = priority_fields + regular_fields
+        
+            for field_name, field_value in all_fields_to_process:
+                try:
+                    logger.info(f"Looking for field: {field_name}")
+                    input_element = find_input_element(driver, field_name, field_value)
+                    if input_element:
+                        # Check if we've already filled this element. WebElement.id is the
+                        # WebDriver reference, stable for a DOM node, so no round-trip is needed.
+                        element_id = input_element.id
                     
-                    if element_id in filled_elements:
-                        logger.info(f"Skipping {field_name} - element already filled")
-                        continue
+                        if element_id in filled_elements:
+                            logger.info(f"Skipping {field_name} - element already filled")
+                            continue
                     
-                    fill_input_field(driver, input_element, field_value)
-                    filled_fields.append(field_name)
-                    filled_elements.add(element_id)
-                    logger.info(f"✅ Successfully filled field: {field_name} with value: {field_value}")
-                    # Small delay to see the field being filled
-                    time.sleep(0.5)  # Reduced from 1 to 0.5 seconds
-                else:
-                    failed_fields.append(field_name)
-                    logger.warning(f"❌ Could not find element for field: {field_name}")
+                        fill_input_field(driver, input_element, field_value)
+                        filled_fields.append(field_name)
+                        filled_elements.add(element_id)
+                        logger.info(f"✅ Successfully filled field: {field_name} with value: {field_value}")
+                        if interactive:
+                            # Small delay to see the field being filled
+                            time.sleep(0.5)  # Reduced from 1 to 0.5 seconds
+                    else:
+                        failed_fields.append(field_name)
+                        logger.warning(f"❌ Could not find element for field: {field_name}")
                     
-            except Exception as e:
-                failed_fields.append(field_name)
-                logger.error(f"❌ Error filling field {field_name}: {str(e)}")
+                except Exception as e:
+                    failed_fields.append(field_name)
+                    logger.error(f"❌ Error filling field {field_name}: {str(e)}")
         
-        # Keep browser open longer so you can see the results
-        logger.info("Form filling complete! Keeping browser open for 5 seconds to review...")
-        time.sleep(5)  # Reduced from 15 to 5 seconds
+            if interactive:
+                # Keep browser open longer so you can see the results
+                logger.info("Form filling complete! Keeping browser open for 5 seconds to review...")
+                time.sleep(5)  # Reduced from 15 to 5 seconds
         
-        return FormFillResult(
-            success=len(filled_fields) > 0,
-            filled_fields=filled_fields,
-            failed_fields=failed_fields
-        )
+            return FormFillResult(
+                success=len(filled_fields) > 0,
+                filled_fields=filled_fields,
+                failed_fields=failed_fields
+            )
         
     except Exception as e:
         logger.error(f"Error during form filling: {str(e)}")
@@ -642,112 +961,196 @@ def fill_job_application_form(url: str, form_data: dict) -> FormFillResult:
             failed_fields=list(form_data.keys()),
             error_message=str(e)
         )
-    finally:
-        try:
-            logger.info("Closing browser...")
-            driver.quit()
-        except:
-            pass
 
-def find_input_element(driver, field_name: str, field_value: str):
-    """Find an input element based on field name"""
+# Special handling for common field mappings: generic data keys to the label
+# text they usually appear under on application forms
+FIELD_MAPPINGS = {
+    "first_name": ("name", "first name", "full name"),
+    "last_name": ("last name", "surname"),
+    "linkedin_url": ("online profiles", "profiles", "linkedin", "social", "links"),
+    "portfolio_url": ("portfolio", "website", "online profiles", "profiles"),
+    "phone": ("phone", "telephone", "mobile", "contact"),
+    "email": ("email", "e-mail", "email address"),
+    "resume_file": ("resume", "cv", "curriculum"),
+    "cover_letter": ("cover letter", "cover", "motivation"),
+}
+
+# Free-text questions that are hard to locate by their label alone: trigger
+# pattern -> (extra search terms, id of the textarea they were last seen under)
+KEYWORD_FIELDS = {
+    "work_ethic": (
+        r"work ethic",
+        ("work ethic", "approach to work", "describe your work"),
+        "bf35a96f-931f-4d8a-b618-7e718f297677",
+    ),
+    "career_plans": (
+        r"career plans",
+        ("career plans", "how long", "staying with", "next company"),
+        "46a14898-77af-427f-9961-0ae9330565b8",
+    ),
+    "motivation": (
+        r"motivates you|wander",
+        ("motivates you", "part of our team", "joining wander", "thrilled"),
+        "8280aedc-c8cc-44b9-bd58-3dcab50e39de",
+    ),
+}
+
+# One alternation of named groups, so a field name is scanned once for every
+# trigger; match.lastgroup names the entry that fired
+KEYWORD_FIELD_RE = re.compile("|".join(f"(?P<{name}>{pattern})" for name, (pattern, _, _) in KEYWORD_FIELDS.items()))
+
+def _keyword_fields(field_name_lower: str) -> List[str]:
+    """Names of the KEYWORD_FIELDS entries triggered by a lowercased field name"""
+    return list(dict.fromkeys(match.lastgroup for match in KEYWORD_FIELD_RE.finditer(field_name_lower)))
+
+@functools.lru_cache(maxsize=512)
+def _build_search_terms(field_name: str) -> Tuple[str, ...]:
+    """Lowercased, de-duplicated label terms to look for field_name under, most specific first"""
     field_name_lower = field_name.lower().replace("_", " ")
     
     # Clean field name for better matching - handle apostrophes and special characters
-    field_name_clean = field_name_lower.replace("'", "").replace("'", "").replace(""", "").replace(""", "")
-    field_name_clean = field_name_clean.replace("?", "").replace("!", "").replace(",", "").replace(".", "")
-    
-    # Special handling for common field mappings
-    field_mappings = {
-        "first_name": ["name", "first name", "full name"],
-        "last_name": ["last name", "surname"],
-        "linkedin_url": ["online profiles", "profiles", "linkedin", "social", "links"],
-        "portfolio_url": ["portfolio", "website", "online profiles", "profiles"],
-        "phone": ["phone", "telephone", "mobile", "contact"],
-        "email": ["email", "e-mail", "email address"],
-        "resume_file": ["resume", "cv", "curriculum"],
-        "cover_letter": ["cover letter", "cover", "motivation"]
-    }
+    field_name_clean = field_name_lower
+    for char in "'\u2019\u201c\u201d\"?!,.":
+        field_name_clean = field_name_clean.replace(char, "")
     
     # Get possible field names to search for
     search_terms = [field_name_lower, field_name_clean]
-    if field_name in field_mappings:
-        search_terms.extend(field_mappings[field_name])
+    search_terms.extend(FIELD_MAPPINGS.get(field_name, ()))
     
     # Add keyword-based search terms for problematic fields
-    if "work ethic" in field_name_lower:
-        search_terms.extend(["work ethic", "approach to work", "describe your work"])
-    if "career plans" in field_name_lower:
-        search_terms.extend(["career plans", "how long", "staying with", "next company"])
-    if "motivates you" in field_name_lower or "wander" in field_name_lower:
-        search_terms.extend(["motivates you", "part of our team", "joining wander", "thrilled"])
-    
-    # Try different strategies to find the element
-    for search_term in search_terms:
-        # Escape single quotes for XPath
-        search_term_escaped = search_term.replace("'", "&apos;")
-        
-        strategies = [
-            # By exact label text match
-            f"//label[contains(translate(text(), 'ABCDEFGHIJKLMNOPQRSTUVWXYZ', 'abcdefghijklmnopqrstuvwxyz'), '{search_term}')]/..//input",
-            f"//label[contains(translate(text(), 'ABCDEFGHIJKLMNOPQRSTUVWXYZ', 'abcdefghijklmnopqrstuvwxyz'), '{search_term}')]/..//textarea",
-            # By label text with following sibling
-            f"//label[contains(translate(text(), 'ABCDEFGHIJKLMNOPQRSTUVWXYZ', 'abcdefghijklmnopqrstuvwxyz'), '{search_term}')]/following-sibling::input",
-            f"//label[contains(translate(text(), 'ABCDEFGHIJKLMNOPQRSTUVWXYZ', 'abcdefghijklmnopqrstuvwxyz'), '{search_term}')]/following-sibling::textarea",
-            # By placeholder
-            f"//input[@placeholder and contains(translate(@placeholder, 'ABCDEFGHIJKLMNOPQRSTUVWXYZ', 'abcdefghijklmnopqrstuvwxyz'), '{search_term}')]",
-            f"//textarea[@placeholder and contains(translate(@placeholder, 'ABCDEFGHIJKLMNOPQRSTUVWXYZ', 'abcdefghijklmnopqrstuvwxyz'), '{search_term}')]",
-            # By aria-label
-            f"//input[@aria-label and contains(translate(@aria-label, 'ABCDEFGHIJKLMNOPQRSTUVWXYZ', 'abcdefghijklmnopqrstuvwxyz'), '{search_term}')]",
-            f"//textarea[@aria-label and contains(translate(@aria-label, 'ABCDEFGHIJKLMNOPQRSTUVWXYZ', 'abcdefghijklmnopqrstuvwxyz'), '{search_term}')]",
-            # By name attribute
-            f"//input[@name and contains(translate(@name, 'ABCDEFGHIJKLMNOPQRSTUVWXYZ', 'abcdefghijklmnopqrstuvwxyz'), '{search_term}')]",
-            f"//textarea[@name and contains(translate(@name, 'ABCDEFGHIJKLMNOPQRSTUVWXYZ', 'abcdefghijklmnopqrstuvwxyz'), '{search_term}')]"
-        ]
-        
-        for strategy in strategies:
-            try:
-                elements = driver.find_elements(By.XPATH, strategy)
-                if elements:
-                    logger.info(f"Found element for '{field_name}' using search term '{search_term}' with strategy: {strategy}")
-                    return elements[0]  # Return first match
-            except Exception as e:
-                continue
+    for name in _keyword_fields(field_name_lower):
+        search_terms.extend(KEYWORD_FIELDS[name][1])
     
-    # Try direct field name match (for cases where field_name is the exact label)
-    direct_strategies = [
-        f"//label[contains(translate(text(), 'ABCDEFGHIJKLMNOPQRSTUVWXYZ', 'abcdefghijklmnopqrstuvwxyz'), '{field_name_clean}')]/..//input",
-        f"//label[contains(translate(text(), 'ABCDEFGHIJKLMNOPQRSTUVWXYZ', 'abcdefghijklmnopqrstuvwxyz'), '{field_name_clean}')]/..//textarea",
-        f"//label[contains(translate(text(), 'ABCDEFGHIJKLMNOPQRSTUVWXYZ', 'abcdefghijklmnopqrstuvwxyz'), '{field_name_clean}')]/following-sibling::input",
-        f"//label[contains(translate(text(), 'ABCDEFGHIJKLMNOPQRSTUVWXYZ', 'abcdefghijklmnopqrstuvwxyz'), '{field_name_clean}')]/following-sibling::textarea"
-    ]
+    return tuple(dict.fromkeys(term.lower() for term in search_terms if term))
+
+# Copy the attributes find_input_element matches on into lowercased
+# data-lc-* shadows, so its XPath can use plain case-sensitive contains()
+# instead of running translate() on every node it visits
+PRIME_LOWERCASE_ATTRS_JS = """
+document.querySelectorAll('input, textarea, label').forEach(function(el) {
+    ['placeholder', 'aria-label', 'name'].forEach(function(attr) {
+        var value = el.getAttribute(attr);
+        if (value) el.setAttribute('data-lc-' + attr, value.toLowerCase());
+    });
+    if (el.tagName === 'LABEL') el.setAttribute('data-lc-text', el.textContent.toLowerCase());
+});
+"""
+
+def _prime_lowercase_attrs(driver):
+    """Add the data-lc-* attributes _field_search_xpath relies on; run once per page load"""
+    driver.execute_script(PRIME_LOWERCASE_ATTRS_JS)
+
+def _xpath_literal(text: str) -> str:
+    """Quote text as an XPath 1.0 string literal, which has no escape syntax"""
+    if "'" not in text:
+        return f"'{text}'"
+    if '"' not in text:
+        return f'"{text}"'
+    parts = text.split("'")
+    return "concat(" + ", \"'\", ".join(f"'{part}'" for part in parts) + ")"
+
+@functools.lru_cache(maxsize=512)
+def _field_search_xpath(search_term: str) -> str:
+    """Build one XPath matching inputs/textareas whose label, placeholder,
+    aria-label or name contains search_term (case-insensitive once the page
+    has been through _prime_lowercase_attrs)"""
+    term = _xpath_literal(search_term.lower())
+    control = "*[self::input or self::textarea]"
+    return (
+        f"//label[contains(@data-lc-text, {term})]/..//{control}"
+        f" | //{control}[contains(@data-lc-placeholder, {term})"
+        f" or contains(@data-lc-aria-label, {term})"
+        f" or contains(@data-lc-name, {term})]"
+    )
+
+# Find the first input/textarea/select whose placeholder, aria-label, name,
+# id or label text contains one of the search terms, trying terms in order.
+# Labels count for controls they point at via "for" and for every control
+# inside the label's parent, which covers both nesting and sibling layouts.
+FIND_FIELD_JS = """
+var terms = arguments[0];
+var controls = Array.prototype.filter.call(
+    document.querySelectorAll('input, textarea, select'),
+    function(el) { return el.type !== 'hidden'; }
+);
+var labels = new Map();
+function addLabel(el, text) {
+    if (!el) return;
+    if (!labels.has(el)) labels.set(el, []);
+    labels.get(el).push(text);
+}
+document.querySelectorAll('label').forEach(function(label) {
+    var text = label.textContent.toLowerCase();
+    if (label.htmlFor) addLabel(document.getElementById(label.htmlFor), text);
+    if (label.parentElement) {
+        label.parentElement.querySelectorAll('input, textarea, select').forEach(function(el) {
+            addLabel(el, text);
+        });
+    }
+});
+var haystacks = controls.map(function(el) {
+    var values = (labels.get(el) || []).slice();
+    ['placeholder', 'aria-label', 'name', 'id'].forEach(function(attr) {
+        var value = el.getAttribute(attr);
+        if (value) values.push(value.toLowerCase());
+    });
+    return values;
+});
+for (var i = 0; i < terms.length; i++) {
+    for (var j = 0; j < controls.length; j++) {
+        if (haystacks[j].some(function(value) { return value.indexOf(terms[i]) !== -1; })) {
+            return controls[j];
+        }
+    }
+}
+return null;
+"""
+
+def _js_find_field(driver, field_name: str, search_terms: Tuple[str, ...]):
+    """Locate the control for field_name in a single execute_script round-trip"""
+    try:
+        element = driver.execute_script(FIND_FIELD_JS, list(search_terms))
+    except Exception as e:
+        logger.debug(f"In-browser lookup failed for '{field_name}': {str(e)}")
+        return None
+    if element is not None:
+        logger.info(f"Found element for '{field_name}' in-browser")
+    return element
+
+def find_input_element(driver, field_name: str, field_value: str):
+    """Find an input element based on field name"""
+    field_name_lower = field_name.lower().replace("_", " ")
+    search_terms = _build_search_terms(field_name)
+    
+    element = _js_find_field(driver, field_name, search_terms)
+    if element is not None:
+        return element
     
-    for strategy in direct_strategies:
+    # XPath fallback, one round-trip per search term: the label, placeholder,
+    # aria-label and name checks are a single union expression, and terms keep
+    # their order of preference
+    for search_term in search_terms:
+        xpath = _field_search_xpath(search_term)
         try:
-            elements = driver.find_elements(By.XPATH, strategy)
-            if elements:
-                logger.info(f"Found element for '{field_name}' using direct match with strategy: {strategy}")
-                return elements[0]
-        except Exception as e:
+            elements = driver.find_elements(By.XPATH, xpath)
+        except Exception:
             continue
+        if elements:
+            logger.info(f"Found element for '{field_name}' using search term '{search_term}'")
+            return elements[0]
     
     # Final fallback: Try to find by specific IDs we know are problematic
-    fallback_id_strategies = []
-    if "work ethic" in field_name_lower:
-        fallback_id_strategies.append("//textarea[@id='bf35a96f-931f-4d8a-b618-7e718f297677']")
-    if "career plans" in field_name_lower:
-        fallback_id_strategies.append("//textarea[@id='46a14898-77af-427f-9961-0ae9330565b8']")
-    if "motivates you" in field_name_lower or "wander" in field_name_lower:
-        fallback_id_strategies.append("//textarea[@id='8280aedc-c8cc-44b9-bd58-3dcab50e39de']")
-    
-    for strategy in fallback_id_strategies:
+    fallback_ids = [KEYWORD_FIELDS[name][2] for name in _keyword_fields(field_name_lower)]
+    
+    if fallback_ids:
+        xpath = " | ".join(f"//textarea[@id='{fallback_id}']" for fallback_id in fallback_ids)
         try:
-            elements = driver.find_elements(By.XPATH, strategy)
+            elements = driver.find_elements(By.XPATH, xpath)
             if elements:
-                logger.info(f"Found element for '{field_name}' using fallback ID strategy: {strategy}")
+                logger.info(f"Found element for '{field_name}' using fallback ID strategy: {xpath}")
                 return elements[0]
-        except Exception as e:
-            continue
+        except Exception:
+            pass
     
     return None
 
@@ -772,6 +1175,12 @@ def fill_input_field(driver, element, value: str):
         logger.error(f"Error filling input field: {str(e)}")
         raise
 
+# Job searches run concurrently; each board is held to SEARCH_RATE searches
+# per second (the old fixed 2s pause) with bursts of up to SEARCH_BURST
+SEARCH_MAX_WORKERS = 8
+SEARCH_RATE = 0.5
+SEARCH_BURST = 4
+
 # TOOL 3: Search for QA/SDET jobs across multiple job boards
 @tool
 def search_qa_jobs(
@@ -792,7 +1201,9 @@ def search_qa_jobs(
     """
     logger.info(f"Starting job search for titles: {job_titles} in locations: {locations}")
     
-    all_jobs = []
+    # Jobs keyed by URL: duplicates are dropped as they arrive, first one wins,
+    # and dict order keeps the order they were found in
+    jobs_by_url: Dict[str, JobPosition] = {}
     search_timestamp = datetime.now().isoformat()
     
     # Configure Chrome options for job search
@@ -813,44 +1224,58 @@ def search_qa_jobs(
     
     try:
         # Use undetected-chromedriver for anti-bot
-        driver = uc.Chrome(options=options)
+        driver = uc.Chrome(options=options, keep_alive=True)
         
         # Focus only on Ashby job boards using SerpAPI
         job_boards = [
             {
                 "name": "Ashby",
                 "search_function": search_ashby_jobs_serpapi,
+                "needs_driver": False,  # SerpAPI function doesn't need driver
                 "enabled": True
             }
         ]
         
-        for job_title in job_titles:
-            for location in locations:
-                logger.info(f"Searching for '{job_title}' in '{location}'")
-                
-                for board in job_boards:
-                    if board["enabled"]:
-                        try:
-                            logger.info(f"Searching on {board['name']}")
-                            if board["search_function"] == search_ashby_jobs_serpapi:
-                                # SerpAPI function doesn't need driver
-                                jobs = board["search_function"](job_title, location, max_results_per_search // len(job_boards))
-                            else:
-                                # Browser-based functions need driver
-                                jobs = board["search_function"](driver, job_title, location, max_results_per_search // len(job_boards))
-                            all_jobs.extend(jobs)
-                            time.sleep(2)  # Rate limiting
-                        except Exception as e:
-                            logger.error(f"Error searching {board['name']}: {str(e)}")
-                            continue
+        per_search = max_results_per_search // len(job_boards)
+        searches = [
+            (job_title, location, board)
+            for job_title in job_titles
+            for location in locations
+            for board in job_boards
+            if board["enabled"]
+        ]
+        rate_limits = {board["name"]: TokenBucket(rate=SEARCH_RATE, burst=SEARCH_BURST) for board in job_boards}
         
-        # Remove duplicates based on URL
-        unique_jobs = []
-        seen_urls = set()
-        for job in all_jobs:
-            if job.url not in seen_urls:
-                unique_jobs.append(job)
-                seen_urls.add(job.url)
+        def run_search(job_title: str, location: str, board: Dict[str, Any]) -> List[JobPosition]:
+            rate_limits[board["name"]].acquire()
+            logger.info(f"Searching for '{job_title}' in '{location}' on {board['name']}")
+            try:
+                if board["needs_driver"]:
+                    return board["search_function"](driver, job_title, location, per_search)
+                return board["search_function"](job_title, location, per_search)
+            except Exception as e:
+                logger.error(f"Error searching {board['name']}: {str(e)}")
+                return []
+        
+        with ThreadPoolExecutor(max_workers=SEARCH_MAX_WORKERS) as executor:
+            # HTTP-only boards go to the pool. The WebDriver isn't thread-safe,
+            # so browser-based boards meanwhile share it serially on this thread.
+            outcomes = [
+                None if board["needs_driver"] else executor.submit(run_search, job_title, location, board)
+                for job_title, location, board in searches
+            ]
+            for i, (job_title, location, board) in enumerate(searches):
+                if board["needs_driver"]:
+                    outcomes[i] = run_search(job_title, location, board)
+            
+            # Collect in search order, not completion order, so the first
+            # occurrence of a duplicate job is the same from run to run
+            for outcome in outcomes:
+                jobs = outcome.result() if isinstance(outcome, Future) else outcome
+                for job in jobs:
+                    jobs_by_url.setdefault(job.url, job)
+        
+        unique_jobs = list(jobs_by_url.values())
         
         logger.info(f"Found {len(unique_jobs)} unique jobs after deduplication")
         
@@ -884,6 +1309,40 @@ def search_qa_jobs(
         except:
             pass
 
+# Seconds a search page gets to render its first result before we read it anyway
+SEARCH_RESULTS_TIMEOUT = 15
+
+def _wait_for_results(driver, selector: str):
+    """Block until selector matches on the current page, or SEARCH_RESULTS_TIMEOUT passes"""
+    try:
+        WebDriverWait(driver, SEARCH_RESULTS_TIMEOUT).until(
+            EC.presence_of_element_located((By.CSS_SELECTOR, selector))
+        )
+    except TimeoutException:
+        logger.warning(f"No '{selector}' results appeared within {SEARCH_RESULTS_TIMEOUT} seconds")
+
+# Fields of the first arguments[0] Indeed job cards, read in a single pass.
+# Missing pieces come back as null.
+INDEED_CARDS_JS = """
+var cards = document.querySelectorAll('div[data-jk]');
+if (!cards.length) cards = document.querySelectorAll('.job_seen_beacon');
+function text(card, selector) {
+    var el = card.querySelector(selector);
+    return el ? el.innerText.trim() : null;
+}
+return Array.prototype.slice.call(cards, 0, arguments[0]).map(function(card) {
+    var link = card.querySelector('h2 a[data-jk]') || card.querySelector('h2 a');
+    return {
+        title: link ? (link.getAttribute('title') || link.innerText.trim()) : null,
+        url: link ? link.href : null,
+        company: text(card, "[data-testid='company-name'], .companyName"),
+        location: text(card, "[data-testid='job-location'], .companyLocation"),
+        salary: text(card, "[data-testid='salary-snippet']"),
+        snippet: text(card, "[data-testid='job-snippet']")
+    };
+});
+"""
+
 def search_indeed_jobs(driver, job_title: str, location: str, max_results: int) -> List[JobPosition]:
     """Search for jobs on Indeed"""
     jobs = []
@@ -899,65 +1358,36 @@ def search_indeed_jobs(driver, job_title: str, location: str, max_results: int)
         
         logger.info(f"Searching Indeed: {indeed_url}")
         driver.get(indeed_url)
-        time.sleep(5)  # Give more time for page to load
+        _wait_for_results(driver, "div[data-jk], .job_seen_beacon")
         
-        # Look for job cards with more generic selectors
-        job_cards = driver.find_elements(By.CSS_SELECTOR, "div[data-jk]")
-        
-        if not job_cards:
-            # Try alternative selector
-            job_cards = driver.find_elements(By.CSS_SELECTOR, ".job_seen_beacon")
+        # Read every card's fields in one round-trip instead of several
+        # find_elements/text calls per card
+        job_cards = driver.execute_script(INDEED_CARDS_JS, max_results)
         
         logger.info(f"Found {len(job_cards)} job cards on Indeed")
         
-        for i, job_card in enumerate(job_cards[:max_results]):
+        for i, job_card in enumerate(job_cards):
             try:
-                # Try to get job title
-                title_elements = job_card.find_elements(By.CSS_SELECTOR, "h2 a[data-jk]")
-                if not title_elements:
-                    title_elements = job_card.find_elements(By.CSS_SELECTOR, "h2 a")
+                title = job_card["title"]
+                job_url = job_card["url"]
+                company = job_card["company"] or "Unknown Company"
+                job_location = job_card["location"] or location
+                salary = job_card["salary"]
+                snippet = job_card["snippet"]
+                if snippet and len(snippet) > 200:
+                    snippet = snippet[:200] + "..."
                 
-                if title_elements:
-                    title = title_elements[0].get_attribute('title') or title_elements[0].text
-                    job_url = title_elements[0].get_attribute('href')
-                    
-                    # Try to get company name
-                    company_elements = job_card.find_elements(By.CSS_SELECTOR, "[data-testid='company-name']")
-                    if not company_elements:
-                        company_elements = job_card.find_elements(By.CSS_SELECTOR, ".companyName")
-                    
-                    company = company_elements[0].text if company_elements else "Unknown Company"
-                    
-                    # Try to get location
-                    location_elements = job_card.find_elements(By.CSS_SELECTOR, "[data-testid='job-location']")
-                    if not location_elements:
-                        location_elements = job_card.find_elements(By.CSS_SELECTOR, ".companyLocation")
-                    
-                    job_location = location_elements[0].text if location_elements else location
-                    
-                    # Try to get salary
-                    salary = None
-                    salary_elements = job_card.find_elements(By.CSS_SELECTOR, "[data-testid='salary-snippet']")
-                    if salary_elements:
-                        salary = salary_elements[0].text
-                    
-                    # Try to get snippet
-                    snippet = None
-                    snippet_elements = job_card.find_elements(By.CSS_SELECTOR, "[data-testid='job-snippet']")
-                    if snippet_elements:
-                        snippet = snippet_elements[0].text[:200] + "..." if len(snippet_elements[0].text) > 200 else snippet_elements[0].text
-                    
-                    if title and company and job_url:
-                        jobs.append(JobPosition(
-                            title=title,
-                            company=company,
-                            location=job_location,
-                            url=job_url,
-                            job_board="Indeed",
-                            salary_range=salary,
-                            description_snippet=snippet
-                        ))
-                        logger.info(f"Found job: {title} at {company}")
+                if title and company and job_url:
+                    jobs.append(JobPosition(
+                        title=title,
+                        company=company,
+                        location=job_location,
+                        url=job_url,
+                        job_board="Indeed",
+                        salary_range=salary,
+                        description_snippet=snippet
+                    ))
+                    logger.info(f"Found job: {title} at {company}")
                     
             except Exception as e:
                 logger.warning(f"Error parsing Indeed job {i}: {str(e)}")
@@ -969,6 +1399,25 @@ def search_indeed_jobs(driver, job_title: str, location: str, max_results: int)
     logger.info(f"Indeed search completed: {len(jobs)} jobs found")
     return jobs
 
+# Links to Ashby from a Google results page. The title is the link's own
+# heading or first line of text, falling back to a heading elsewhere in the
+# result block, which is also where the snippet comes from.
+ASHBY_RESULT_LINKS_JS = """
+function text(el) {
+    return el ? el.innerText.trim() : '';
+}
+return Array.prototype.map.call(document.querySelectorAll('a[href*="ashbyhq.com/"]'), function(link) {
+    var result = link.closest('div.g, div[data-hveid], div[data-ved]');
+    var title = text(link.querySelector('h3, h2, [role="heading"]')) || text(link).split('\\n')[0].trim();
+    if (!title && result) title = text(result.querySelector('h3, h2, .LC20lb, [role="heading"], .DKV0Md'));
+    return {
+        url: link.href,
+        title: title || null,
+        snippet: (result && text(result.querySelector('.VwiC3b'))) || null
+    };
+});
+"""
+
 def search_ashby_jobs(driver, job_title: str, location: str, max_results: int) -> List[JobPosition]:
     """Search for jobs on Ashby job boards"""
     jobs = []
@@ -1002,48 +1451,19 @@ def search_ashby_jobs(driver, job_title: str, location: str, max_results: int) -
                 logger.info(f"Search URL: {google_url}")
                 
                 driver.get(google_url)
-                time.sleep(3)
+                _wait_for_results(driver, 'a[href*="ashbyhq.com"], #search')
                 
-                # Get search results - try multiple selectors for Google search results
-                search_results = []
-                selectors_to_try = [
-                    "div.g",  # Old selector
-                    "div[data-sokoban-container]",  # Newer selector
-                    "div[jscontroller]",  # Another common selector
-                    "div[data-ved]",  # Results with data-ved attribute
-                    "div[jsname]",  # Results with jsname attribute
-                    "div[data-hveid]",  # Another Google result identifier
-                    "div[data-ved] a[href]",  # Direct links in results
-                    "div[jscontroller] a[href]",  # Links in jscontroller divs
-                ]
-                
-                for selector in selectors_to_try:
-                    results = driver.find_elements(By.CSS_SELECTOR, selector)
-                    if results:
-                        logger.info(f"Found {len(results)} results with selector: {selector}")
-                        search_results = results
-                        break
-                
-                # If still no results, try a broader approach
-                if not search_results:
-                    # Look for any links that might be search results
-                    all_links = driver.find_elements(By.TAG_NAME, "a")
-                    search_results = [link for link in all_links if link.get_attribute('href') and 'ashbyhq.com' in link.get_attribute('href')]
-                    logger.info(f"Found {len(search_results)} Ashby links using broad search")
+                # Every Ashby link on the page with its title and snippet, read in
+                # one round-trip rather than nested finds per result container
+                search_results = driver.execute_script(ASHBY_RESULT_LINKS_JS)
+                logger.info(f"Found {len(search_results)} Ashby links")
                 
                 for result in search_results:
                     if len(jobs) >= max_results:
                         break
                         
                     try:
-                        # Handle different result structures
-                        if result.tag_name == 'a':
-                            # Result is already a link
-                            url = result.get_attribute('href')
-                        else:
-                            # Result is a container, find the link inside
-                            link_element = result.find_element(By.CSS_SELECTOR, "a")
-                            url = link_element.get_attribute('href')
+                        url = result["url"]
                         
                         # Check if it's an Ashby job URL
                         if url and ('ashbyhq.com' in url or 'jobs.ashbyhq.com' in url) and '/jobs/' in url:
@@ -1052,38 +1472,14 @@ def search_ashby_jobs(driver, job_title: str, location: str, max_results: int) -
                                 
                             seen_urls.add(url)
                             
-                            # Get job title
-                            try:
-                                if result.tag_name == 'a':
-                                    # If result is a link, use its text as title
-                                    title = result.text.strip()
-                                else:
-                                    # Look for title in various possible elements
-                                    title_selectors = ["h3", "h2", ".LC20lb", "[role='heading']", ".DKV0Md"]
-                                    title = None
-                                    for selector in title_selectors:
-                                        try:
-                                            title_element = result.find_element(By.CSS_SELECTOR, selector)
-                                            title = title_element.text.strip()
-                                            if title:
-                                                break
-                                        except:
-                                            continue
-                                    
-                                    if not title:
-                                        title = job_title  # Fallback
-                            except:
-                                title = job_title  # Fallback
+                            title = result["title"] or job_title  # Fallback
                             
                             # Extract company name from URL
                             company = extract_company_from_ashby_url(url)
                             
-                            # Try to get snippet for more info
-                            try:
-                                snippet_element = result.find_element(By.CSS_SELECTOR, ".VwiC3b")
-                                description_snippet = snippet_element.text[:200] + "..." if len(snippet_element.text) > 200 else snippet_element.text
-                            except:
-                                description_snippet = None
+                            description_snippet = result["snippet"]
+                            if description_snippet and len(description_snippet) > 200:
+                                description_snippet = description_snippet[:200] + "..."
                             
                             # Check if job title matches our search criteria
                             title_lower = title.lower()
@@ -1127,7 +1523,7 @@ def search_google_jobs(driver, job_title: str, location: str, max_results: int)
         google_jobs_url = f"https://www.google.com/search?q={quote(query)}&ibp=htl;jobs"
         
         driver.get(google_jobs_url)
-        time.sleep(3)
+        _wait_for_results(driver, "[data-ved] .pE8vnd")
         
         # Look for job cards in Google Jobs
         job_cards = driver.find_elements(By.CSS_SELECTOR, "[data-ved] .pE8vnd")
@@ -1163,15 +1559,15 @@ def search_google_jobs(driver, job_title: str, location: str, max_results: int)
     
     return jobs
 
+# URL format: https://jobs.ashbyhq.com/COMPANY/...
+ASHBY_COMPANY_RE = re.compile(r"ashbyhq\.com/([^/?#]+)")
+
+@functools.lru_cache(maxsize=1024)
 def extract_company_from_ashby_url(url: str) -> str:
     """Extract company name from Ashby URL"""
-    try:
-        # URL format: https://jobs.ashbyhq.com/COMPANY/...
-        parts = urlparse(url).path.split('/')
-        if len(parts) > 1:
-            return parts[1].replace('-', ' ').title()
-    except:
-        pass
+    match = ASHBY_COMPANY_RE.search(url)
+    if match:
+        return match.group(1).replace('-', ' ').title()
     return "Unknown Company"
 
 def save_jobs_to_csv(jobs: List[JobPosition], filename: str = None):
@@ -1183,27 +1579,92 @@ def save_jobs_to_csv(jobs: List[JobPosition], filename: str = None):
     try:
         with open(filename, 'w', newline='', encoding='utf-8') as csvfile:
             fieldnames = ['title', 'company', 'location', 'url', 'job_board', 'posted_date', 'salary_range', 'job_type', 'remote_option', 'description_snippet']
-            writer = csv.DictWriter(csvfile, fieldnames=fieldnames)
+            writer = csv.DictWriter(csvfile, fieldnames=fieldnames, extrasaction='ignore')
             
             writer.writeheader()
-            for job in jobs:
-                writer.writerow({
-                    'title': job.title,
-                    'company': job.company,
-                    'location': job.location,
-                    'url': job.url,
-                    'job_board': job.job_board,
-                    'posted_date': job.posted_date,
-                    'salary_range': job.salary_range,
-                    'job_type': job.job_type,
-                    'remote_option': job.remote_option,
-                    'description_snippet': job.description_snippet
-                })
+            writer.writerows(job.model_dump() for job in jobs)
         
         logger.info(f"Jobs saved to {filename}")
     except Exception as e:
         logger.error(f"Error saving jobs to CSV: {str(e)}")
 
+def _failed_application(url: str, error_message: str) -> Dict[str, Any]:
+    """Result row for an application that never reached form filling"""
+    return {
+        "url": url,
+        "success": False,
+        "filled_fields": 0,
+        "failed_fields": 0,
+        "error_message": error_message
+    }
+
+def _fill_extracted_form(url: str, extraction_result: JobFormExtractionResult) -> Dict[str, Any]:
+    """Fill the form at url with the data suggested during extraction"""
+    if not (extraction_result.success and extraction_result.suggested_data):
+        return _failed_application(url, extraction_result.error_message or "Failed to extract form fields")
+    
+    # Fill the form
+    form_data = extraction_result.suggested_data.additional_info
+    fill_result = fill_job_application_form.invoke({"url": url, "form_data": form_data})
+    
+    if fill_result.success:
+        logger.info(f"✅ Successfully applied to {url}")
+    else:
+        logger.warning(f"❌ Failed to apply to {url}")
+    
+    return {
+        "url": url,
+        "success": fill_result.success,
+        "filled_fields": len(fill_result.filled_fields),
+        "failed_fields": len(fill_result.failed_fields),
+        "error_message": fill_result.error_message
+    }
+
+def _apply_to_job(url: str) -> Dict[str, Any]:
+    """Extract and fill the application form at one URL, returning a result row"""
+    try:
+        # Extract form fields
+        extraction_result = extract_job_application_form.invoke({"url": url})
+        return _fill_extracted_form(url, extraction_result)
+    except Exception as e:
+        logger.error(f"Error processing {url}: {str(e)}")
+        return _failed_application(url, str(e))
+
+async def _aapply_to_job(url: str) -> Dict[str, Any]:
+    """Async variant of _rate_limited_apply; the LLM call is awaited, Selenium runs in a thread"""
+    # Same per-host spacing as batch_apply_to_jobs, waited out off the event loop
+    await asyncio.to_thread(_host_rate_limit(url).acquire)
+    logger.info(f"Processing application: {url}")
+    try:
+        extraction_result = await _aextract_job_application_form(url)
+        return await asyncio.to_thread(_fill_extracted_form, url, extraction_result)
+    except Exception as e:
+        logger.error(f"Error processing {url}: {str(e)}")
+        return _failed_application(url, str(e))
+
+# batch_apply_to_jobs runs this many applications at once, each on its own
+# pooled browser. Starts against the same host stay APPLY_INTERVAL seconds
+# apart (the old global pause); different hosts don't wait on each other.
+BATCH_APPLY_WORKERS = 3
+APPLY_INTERVAL = 30
+_host_rate_limits: Dict[str, TokenBucket] = {}
+_host_rate_limits_lock = threading.Lock()
+
+def _host_rate_limit(url: str) -> TokenBucket:
+    """The shared TokenBucket for url's host"""
+    host = urlparse(url).netloc
+    with _host_rate_limits_lock:
+        bucket = _host_rate_limits.get(host)
+        if bucket is None:
+            bucket = _host_rate_limits[host] = TokenBucket(rate=1 / APPLY_INTERVAL, burst=1)
+        return bucket
+
+def _rate_limited_apply(url: str) -> Dict[str, Any]:
+    """_apply_to_job once url's host has a free slot"""
+    _host_rate_limit(url).acquire()
+    logger.info(f"Processing application: {url}")
+    return _apply_to_job(url)
+
 # TOOL 4: Apply to multiple jobs in batch
 @tool
 def batch_apply_to_jobs(job_urls: List[str], max_applications: int = 10) -> Dict[str, Any]:
@@ -1227,60 +1688,14 @@ def batch_apply_to_jobs(job_urls: List[str], max_applications: int = 10) -> Dict
     # Limit the number of applications
     urls_to_process = job_urls[:max_applications]
     
-    for i, url in enumerate(urls_to_process, 1):
-        logger.info(f"Processing application {i}/{len(urls_to_process)}: {url}")
-        
-        try:
-            # Extract form fields
-            extraction_result = extract_job_application_form(url)
-            
-            if extraction_result.success and extraction_result.suggested_data:
-                # Fill the form
-                form_data = extraction_result.suggested_data.additional_info
-                fill_result = fill_job_application_form(url, form_data)
-                
-                result = {
-                    "url": url,
-                    "success": fill_result.success,
-                    "filled_fields": len(fill_result.filled_fields),
-                    "failed_fields": len(fill_result.failed_fields),
-                    "error_message": fill_result.error_message
-                }
-                
-                if fill_result.success:
-                    successful_count += 1
-                    logger.info(f"✅ Successfully applied to {url}")
-                else:
-                    failed_count += 1
-                    logger.warning(f"❌ Failed to apply to {url}")
-                    
+    with ThreadPoolExecutor(max_workers=BATCH_APPLY_WORKERS) as executor:
+        # map yields in submission order, so results line up with the URLs
+        for result in executor.map(_rate_limited_apply, urls_to_process):
+            application_results.append(result)
+            if result["success"]:
+                successful_count += 1
             else:
-                result = {
-                    "url": url,
-                    "success": False,
-                    "filled_fields": 0,
-                    "failed_fields": 0,
-                    "error_message": extraction_result.error_message or "Failed to extract form fields"
-                }
                 failed_count += 1
-                
-            application_results.append(result)
-            
-            # Rate limiting between applications
-            if i < len(urls_to_process):
-                logger.info("Waiting 30 seconds before next application...")
-                time.sleep(30)
-                
-        except Exception as e:
-            logger.error(f"Error processing {url}: {str(e)}")
-            application_results.append({
-                "url": url,
-                "success": False,
-                "filled_fields": 0,
-                "failed_fields": 0,
-                "error_message": str(e)
-            })
-            failed_count += 1
     
     execution_time = time.time() - start_time
     
@@ -1297,6 +1712,73 @@ def batch_apply_to_jobs(job_urls: List[str], max_applications: int = 10) -> Dict
         "execution_time": execution_time
     }
 
+async def extract_job_application_forms_batch(urls: List[str], max_concurrency: int = 5) -> List[JobFormExtractionResult]:
+    """
+    Extract the application forms for several URLs concurrently.
+    
+    Selenium is blocking, so the browser work runs in a worker thread with its
+    own pooled driver while the LLM calls are awaited; at most
+    ``max_concurrency`` extractions run at once.
+    
+    Returns:
+        One JobFormExtractionResult per URL, in input order
+    """
+    sem = asyncio.BoundedSemaphore(max_concurrency)
+    
+    async def _one(url: str) -> JobFormExtractionResult:
+        async with sem:
+            return await _aextract_job_application_form(url)
+    
+    return await asyncio.gather(*[_one(url) for url in urls])
+
+async def apply_to_jobs_batch(job_urls: List[str], max_concurrency: int = 5) -> BatchApplicationResult:
+    """
+    Apply to several jobs concurrently, extracting and filling each form.
+    
+    Applications to the same host still start APPLY_INTERVAL seconds apart,
+    as in batch_apply_to_jobs; only different hosts overlap.
+    
+    Returns:
+        BatchApplicationResult with one result row per URL, in input order
+    """
+    logger.info(f"Starting concurrent batch application to {len(job_urls)} jobs (concurrency: {max_concurrency})")
+    
+    start_time = time.time()
+    sem = asyncio.BoundedSemaphore(max_concurrency)
+    
+    async def _one(url: str) -> Dict[str, Any]:
+        async with sem:
+            return await _aapply_to_job(url)
+    
+    application_results = await asyncio.gather(*[_one(url) for url in job_urls])
+    successful_count = sum(1 for result in application_results if result["success"])
+    
+    save_application_results(application_results)
+    
+    logger.info(f"Batch application complete: {successful_count} successful, {len(application_results) - successful_count} failed")
+    
+    return BatchApplicationResult(
+        total_attempted=len(application_results),
+        successful_applications=successful_count,
+        failed_applications=len(application_results) - successful_count,
+        application_results=application_results,
+        execution_time=time.time() - start_time
+    )
+
+@tool
+def extract_and_fill_batch(job_urls: List[str], max_concurrency: int = 5) -> Dict[str, Any]:
+    """
+    Apply to multiple jobs concurrently, extracting and filling several forms at once.
+    
+    Args:
+        job_urls: List of job application URLs
+        max_concurrency: Maximum number of applications in flight at once
+        
+    Returns:
+        BatchApplicationResult with detailed results
+    """
+    return asyncio.run(apply_to_jobs_batch(job_urls, max_concurrency)).model_dump()
+
 def save_application_results(results: List[Dict[str, Any]], filename: str = None):
     """Save application results to JSON file"""
     if not filename:
@@ -1304,11 +1786,11 @@ def save_application_results(results: List[Dict[str, Any]], filename: str = None
         filename = f"application_results_{timestamp}.json"
     
     try:
-        with open(filename, 'w', encoding='utf-8') as f:
-            json.dump({
+        with open(filename, 'wb') as f:
+            f.write(orjson.dumps({
                 "timestamp": datetime.now().isoformat(),
                 "results": results
-            }, f, indent=2)
+            }, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS))
         
         logger.info(f"Application results saved to {filename}")
     except Exception as e:
@@ -1365,8 +1847,25 @@ def filter_jobs_by_criteria(
     logger.info(f"Filtered {len(jobs)} jobs down to {len(filtered_jobs)} matching criteria")
     return filtered_jobs
 
-def search_ashby_jobs_serpapi(job_title: str, location: str, max_results: int) -> List[JobPosition]:
-    """Search for Ashby jobs using SerpAPI (Google Search API)"""
+SERPAPI_SEARCH_URL = "https://serpapi.com/search.json"
+
+# Concurrent SerpAPI requests per search, to stay inside its rate limits
+SERPAPI_MAX_CONCURRENCY = 10
+
+async def _serpapi_search(session: aiohttp.ClientSession, sem: asyncio.BoundedSemaphore, query: str, api_key: str) -> Dict[str, Any]:
+    """Run one Google search through SerpAPI and return the decoded response"""
+    params = {
+        "engine": "google",
+        "q": query,
+        "api_key": api_key,
+        "num": 10  # Number of results per request
+    }
+    async with sem:
+        async with session.get(SERPAPI_SEARCH_URL, params=params) as response:
+            return await response.json(loads=orjson.loads, content_type=None)
+
+async def search_ashby_jobs_serpapi_async(job_title: str, location: str, max_results: int) -> List[JobPosition]:
+    """Search for Ashby jobs using SerpAPI, issuing every search strategy concurrently"""
     jobs = []
     
     # Get API key from environment
@@ -1385,81 +1884,85 @@ def search_ashby_jobs_serpapi(job_title: str, location: str, max_results: int) -
         f'site:jobs.ashbyhq.com "QA Engineer" OR "SDET" OR "Software Engineer in Test"'
     ]
     
+    sem = asyncio.BoundedSemaphore(SERPAPI_MAX_CONCURRENCY)
+    async with aiohttp.ClientSession(timeout=aiohttp.ClientTimeout(total=30)) as session:
+        responses = await asyncio.gather(
+            *[_serpapi_search(session, sem, strategy, api_key) for strategy in search_strategies],
+            return_exceptions=True
+        )
+    
     seen_urls = set()
     
-    for strategy in search_strategies:
+    # Results are consumed in strategy order, so the most specific queries still win
+    for strategy, results in zip(search_strategies, responses):
         if len(jobs) >= max_results:
             break
+        
+        if isinstance(results, Exception):
+            logger.warning(f"Error with search strategy '{strategy}': {str(results)}")
+            continue
+        
+        logger.info(f"Trying search strategy: {strategy}")
+        
+        if "organic_results" in results:
+            organic_results = results["organic_results"]
+            logger.info(f"Found {len(organic_results)} organic results")
             
-        try:
-            logger.info(f"Trying search strategy: {strategy}")
-            
-            # Use SerpAPI for Google search
-            search = GoogleSearch({
-                "q": strategy,
-                "api_key": api_key,
-                "num": 10  # Number of results per request
-            })
-            
-            results = search.get_dict()
-            
-            if "organic_results" in results:
-                organic_results = results["organic_results"]
-                logger.info(f"Found {len(organic_results)} organic results")
-                
-                for result in organic_results:
-                    if len(jobs) >= max_results:
-                        break
+            for result in organic_results:
+                if len(jobs) >= max_results:
+                    break
+                    
+                try:
+                    url = result.get("link", "")
+                    
+                    # Check if it's an Ashby job URL
+                    if url and ('ashbyhq.com' in url or 'jobs.ashbyhq.com' in url) and '/jobs/' in url:
+                        if url in seen_urls:
+                            continue
+                            
+                        seen_urls.add(url)
                         
-                    try:
-                        url = result.get("link", "")
+                        # Get job title
+                        title = result.get("title", job_title)
                         
-                        # Check if it's an Ashby job URL
-                        if url and ('ashbyhq.com' in url or 'jobs.ashbyhq.com' in url) and '/jobs/' in url:
-                            if url in seen_urls:
-                                continue
-                                
-                            seen_urls.add(url)
-                            
-                            # Get job title
-                            title = result.get("title", job_title)
-                            
-                            # Extract company name from URL
-                            company = extract_company_from_ashby_url(url)
-                            
-                            # Get snippet for more info
-                            description_snippet = result.get("snippet", None)
-                            
-                            # Check if job title matches our search criteria
-                            title_lower = title.lower()
-                            job_title_lower = job_title.lower()
+                        # Extract company name from URL
+                        company = extract_company_from_ashby_url(url)
+                        
+                        # Get snippet for more info
+                        description_snippet = result.get("snippet", None)
+                        
+                        # Check if job title matches our search criteria
+                        title_lower = title.lower()
+                        job_title_lower = job_title.lower()
+                        
+                        if (job_title_lower in title_lower or 
+                            any(term in title_lower for term in ["qa", "sdet", "test", "automation"]) or
+                            "engineer" in title_lower):
                             
-                            if (job_title_lower in title_lower or 
-                                any(term in title_lower for term in ["qa", "sdet", "test", "automation"]) or
-                                "engineer" in title_lower):
-                                
-                                jobs.append(JobPosition(
-                                    title=title,
-                                    company=company,
-                                    location=location,
-                                    url=url,
-                                    job_board="Ashby",
-                                    description_snippet=description_snippet
-                                ))
-                                
-                                logger.info(f"Found Ashby job: {title} at {company}")
+                            jobs.append(JobPosition(
+                                title=title,
+                                company=company,
+                                location=location,
+                                url=url,
+                                job_board="Ashby",
+                                description_snippet=description_snippet
+                            ))
                             
-                    except Exception as e:
-                        logger.warning(f"Error parsing Ashby job result: {str(e)}")
-                        continue
+                            logger.info(f"Found Ashby job: {title} at {company}")
                         
-        except Exception as e:
-            logger.warning(f"Error with search strategy '{strategy}': {str(e)}")
-            continue
+                except Exception as e:
+                    logger.warning(f"Error parsing Ashby job result: {str(e)}")
+                    continue
+        elif "error" in results:
+            logger.warning(f"SerpAPI error for strategy '{strategy}': {results['error']}")
             
     logger.info(f"Ashby search completed: {len(jobs)} jobs found")
     return jobs
 
+def search_ashby_jobs_serpapi(job_title: str, location: str, max_results: int) -> List[JobPosition]:
+    """Search for Ashby jobs using SerpAPI (Google Search API)"""
+    return asyncio.run(search_ashby_jobs_serpapi_async(job_title, location, max_results))
+
 # Update the main execution to include new functionality
 if __name__ == "__main__":
     # Set up tools and agent with new functionality
@@ -1468,6 +1971,7 @@ if __name__ == "__main__":
         fill_job_application_form,
         search_qa_jobs,
         batch_apply_to_jobs,
+        extract_and_fill_batch,
         filter_jobs_by_criteria
     ]
     model = ChatOpenAI(model="gpt-4o-mini", temperature=0)
@@ -6,6 +6,7 @@ Provides a command-line interface for user authentication, profile management,
 and job searching with the Ashby job search agent.
 """
 
+import asyncio
 import os
 import sys
 import getpass
@@ -343,7 +344,7 @@ class JobAgentUI:
                 return
             
             # Perform the search
-            jobs = self.ashby_agent.search_qa_jobs(job_titles=job_titles, max_results=max_results)
+            jobs = asyncio.run(self.ashby_agent.search_qa_jobs(job_titles=job_titles, max_results=max_results))
             
             if jobs:
                 # Save results to database
@@ -414,14 +415,15 @@ class JobAgentUI:
                 return
             
             selected_search = searches[int(choice) - 1]
-            results = job_search_manager.get_search_results(selected_search.id)
+            results = job_search_manager.get_search_results(selected_search.id, limit=20)
             
             if results:
+                total = job_search_manager.count_search_results(selected_search.id)
                 print(f"\nResults for '{selected_search.search_name}':")
-                print(f"Total jobs: {len(results)}")
+                print(f"Total jobs: {total}")
                 print()
                 
-                for i, result in enumerate(results[:20], 1):  # Show first 20
+                for i, result in enumerate(results, 1):  # Show first 20
                     print(f"{i}. {result.job_title} at {result.company}")
                     print(f"   Location: {result.location}")
                     print(f"   URL: {result.url}")
@@ -429,8 +431,8 @@ class JobAgentUI:
                     print(f"   Favorite: {'Yes' if result.is_favorite else 'No'}")
                     print()
                 
-                if len(results) > 20:
-                    print(f"... and {len(results) - 20} more jobs")
+                if total > len(results):
+                    print(f"... and {total - len(results)} more jobs")
             else:
                 print("No results found for this search.")
                 
@@ -142,9 +142,6 @@ class UserInterface:
         print("\n👤 Profile Management")
         print("-" * 30)
         
-        # Get current profile
-        current_profile = profile_manager.get_profile(self.current_user['id'])
-        
         print("1. View Current Profile")
         print("2. Update Profile")
         print("3. Update Resume")
@@ -161,7 +158,8 @@ class UserInterface:
     
     def view_profile(self):
         """View current profile"""
-        profile = profile_manager.get_profile(self.current_user['id'])
+        # Contact fields only; the resume text itself is never shown here
+        profile = profile_manager.get_profile_summary(self.current_user['id'])
         
         if profile:
             print("\n📋 Current Profile:")
@@ -170,7 +168,7 @@ class UserInterface:
             print(f"LinkedIn: {profile.get('linkedin_url', 'Not set')}")
             print(f"Portfolio: {profile.get('portfolio_url', 'Not set')}")
             print(f"Skills: {', '.join(profile.get('skills', []))}")
-            print(f"Resume: {'Set' if profile.get('resume_text') else 'Not set'}")
+            print(f"Resume: {'Set' if profile_manager.has_resume(self.current_user['id']) else 'Not set'}")
         else:
             print("❌ No profile found. Please create one first.")
     
@@ -300,7 +298,7 @@ class UserInterface:
         print("\n🔍 Your Job Searches")
         print("-" * 30)
         
-        searches = job_search_manager.get_user_searches(self.current_user['id'])
+        searches = job_search_manager.get_user_searches_with_results(self.current_user['id'])
         
         if not searches:
             print("No job searches found. Create one first!")
@@ -315,8 +313,7 @@ class UserInterface:
             print(f"   Created: {search['created_at']}")
             
             # Show results count
-            results = job_search_manager.get_search_results(search['id'])
-            print(f"   Results: {len(results)} jobs found")
+            print(f"   Results: {len(search['job_search_results'])} jobs found")
     
     def search_jobs_ashby(self):
         """Search jobs on Ashby"""
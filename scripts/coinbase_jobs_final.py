@@ -6,10 +6,37 @@ Handles Cloudflare protection and various page structures
 
 import asyncio
 import json
+import orjson
 import re
 from playwright.async_api import async_playwright
 import time
 
+try:
+    from selectolax.lexbor import LexborHTMLParser
+except ImportError:
+    LexborHTMLParser = None
+    from bs4 import BeautifulSoup
+
+# Resources we never need to find job data
+BLOCKED_RESOURCE_TYPES = {"image", "font", "media", "stylesheet"}
+BLOCKED_HOSTS = ("doubleclick", "google-analytics", "googletagmanager", "segment.io")
+
+# "jobs", "positions", "careers" and "departments" arrays embedded in scripts.
+# One pattern per key: findall never returns overlapping matches, so a single
+# alternation would swallow a "jobs" array nested inside a "departments" one.
+JOB_ARRAY_PATTERNS = tuple(
+    re.compile(rf'"{key}":\s*(\[.*?\])', re.DOTALL)
+    for key in ("jobs", "positions", "careers", "departments")
+)
+
+async def block_heavy_resources(route):
+    """Abort images, fonts, media, stylesheets and analytics beacons."""
+    request = route.request
+    if request.resource_type in BLOCKED_RESOURCE_TYPES or any(host in request.url for host in BLOCKED_HOSTS):
+        await route.abort()
+    else:
+        await route.continue_()
+
 async def extract_coinbase_jobs():
     """Extract job listings from Coinbase careers page with Cloudflare handling."""
     
@@ -31,6 +58,7 @@ async def extract_coinbase_jobs():
         )
         
         page = await context.new_page()
+        await page.route("**/*", block_heavy_resources)
         
         # Add extra headers to look more like a real browser
         await page.set_extra_http_headers({
@@ -44,7 +72,7 @@ async def extract_coinbase_jobs():
         
         try:
             print("Navigating to Coinbase careers page...")
-            await page.goto("https://www.coinbase.com/careers", wait_until='networkidle', timeout=60000)
+            await page.goto("https://www.coinbase.com/careers", wait_until='domcontentloaded', timeout=60000)
             
             # Wait for potential Cloudflare challenge
             print("Waiting for page to load (handling potential Cloudflare challenge)...")
@@ -74,8 +102,9 @@ async def extract_coinbase_jobs():
             for url in urls_to_try:
                 print(f"Trying URL: {url}")
                 try:
-                    await page.goto(url, wait_until='networkidle', timeout=30000)
-                    await page.wait_for_timeout(5000)
+                    await page.goto(url, wait_until='domcontentloaded', timeout=30000)
+                    # Only script tags and links are needed, not a quiet network
+                    await page.wait_for_selector('script', state='attached', timeout=10000)
                     
                     content = await page.content()
                     
@@ -84,12 +113,12 @@ async def extract_coinbase_jobs():
                     print(f"Found {len(job_links)} potential job links")
                     
                     # Method 2: Look for job data in script tags
-                    scripts = await page.query_selector_all('script')
+                    # Parse the captured HTML locally instead of querying the live DOM
+                    scripts = extract_script_bodies(content)
                     print(f"Found {len(scripts)} script tags to analyze")
                     
-                    for script in scripts:
+                    for script_content in scripts:
                         try:
-                            script_content = await script.inner_text()
                             if script_content and ('job' in script_content.lower() or 'position' in script_content.lower()):
                                 # Look for JSON data
                                 job_data = extract_jobs_from_script(script_content)
@@ -156,9 +185,9 @@ async def extract_coinbase_jobs():
             
             print(f"Total jobs found: {len(jobs_found)}")
             
-            # Save results
-            with open("coinbase_jobs_final.json", "w") as f:
-                json.dump(jobs_found, f, indent=2)
+            # Save results in one serialized write
+            with open("coinbase_jobs_final.json", "wb") as f:
+                f.write(orjson.dumps(jobs_found, option=orjson.OPT_INDENT_2))
             
             # Display results
             for i, job in enumerate(jobs_found[:10]):  # Show first 10
@@ -176,21 +205,18 @@ async def extract_coinbase_jobs():
         finally:
             await browser.close()
 
+def extract_script_bodies(html):
+    """Return the text of every <script> tag in an HTML string."""
+    if LexborHTMLParser is not None:
+        return [node.text() or '' for node in LexborHTMLParser(html).css('script')]
+    return [tag.get_text() for tag in BeautifulSoup(html, 'lxml').find_all('script')]
+
 def extract_jobs_from_script(script_content):
     """Extract job data from script content."""
     jobs = []
     
-    # Look for various JSON patterns
-    patterns = [
-        r'"jobs":\s*(\[.*?\])',
-        r'"positions":\s*(\[.*?\])',
-        r'"careers":\s*(\[.*?\])',
-        r'"departments":\s*(\[.*?\])',
-    ]
-    
-    for pattern in patterns:
-        matches = re.findall(pattern, script_content, re.DOTALL)
-        for match in matches:
+    for pattern in JOB_ARRAY_PATTERNS:
+        for match in pattern.findall(script_content):
             try:
                 data = json.loads(match)
                 if isinstance(data, list):
@@ -128,7 +128,7 @@ class FastScraper(BaseJobScraper):
             async with session.get(url) as response:
                 if response.status == 200:
                     html = await response.text()
-                    soup = BeautifulSoup(html, 'html.parser')
+                    soup = BeautifulSoup(html, 'lxml')
                     
                     # Look for job listings (simplified)
                     job_elements = soup.find_all('div', class_='job-listing')
@@ -34,7 +34,7 @@ class LeverScraper(BaseJobScraper):
             response.raise_for_status()
             
             # Parse with BeautifulSoup
-            soup = BeautifulSoup(response.text, 'html.parser')
+            soup = BeautifulSoup(response.text, 'lxml')
             
             # Find job listings
             job_elements = self._find_job_elements(soup)
@@ -0,0 +1,121 @@
+"""
+Unit tests for the legacy Ashby search helpers: the token bucket rate
+limiter, Retry-After aware backoff and job URL canonicalisation.
+"""
+
+import os
+import sys
+from types import SimpleNamespace
+
+import pytest
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "..", "legacy"))
+
+ashby_job_search = pytest.importorskip("ashby_job_search")
+
+
+class FakeClock:
+    """Stands in for the time module: sleep() advances monotonic() instantly"""
+
+    def __init__(self):
+        self.now = 1000.0
+        self.sleeps = []
+
+    def monotonic(self):
+        return self.now
+
+    def sleep(self, seconds):
+        self.sleeps.append(seconds)
+        self.now += seconds
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    clock = FakeClock()
+    monkeypatch.setattr(ashby_job_search, "time", clock)
+    return clock
+
+
+def test_token_bucket_allows_a_burst_then_paces(clock):
+    bucket = ashby_job_search.TokenBucket(rate=2.0, burst=3)
+    for _ in range(3):
+        bucket.acquire()
+    assert clock.sleeps == []
+
+    bucket.acquire()
+    assert clock.sleeps == [pytest.approx(0.5)]
+
+
+def test_token_bucket_refills_up_to_burst(clock):
+    bucket = ashby_job_search.TokenBucket(rate=1.0, burst=2)
+    bucket.acquire()
+    bucket.acquire()
+    clock.now += 60  # Idle for a long time: still only `burst` tokens
+    bucket.acquire()
+    bucket.acquire()
+    assert clock.sleeps == []
+    bucket.acquire()
+    assert clock.sleeps == [pytest.approx(1.0)]
+
+
+@pytest.mark.parametrize("url, canonical", [
+    ("https://jobs.ashbyhq.com/acme/123", "https://jobs.ashbyhq.com/acme/123"),
+    ("http://jobs.ashbyhq.com/acme/123", "https://jobs.ashbyhq.com/acme/123"),
+    ("https://Jobs.AshbyHQ.com/acme/123/", "https://jobs.ashbyhq.com/acme/123"),
+    ("https://jobs.ashbyhq.com/acme/123?utm_source=x#apply", "https://jobs.ashbyhq.com/acme/123"),
+])
+def test_canonical_url(url, canonical):
+    assert ashby_job_search._canonical_url(url) == canonical
+
+
+def test_canonical_url_keeps_path_case():
+    assert ashby_job_search._canonical_url("https://jobs.ashbyhq.com/Acme/ABC") == "https://jobs.ashbyhq.com/Acme/ABC"
+
+
+def _agent(responses, max_retries=3):
+    """AshbyJobSearchAgent whose session replays responses and whose bucket never blocks"""
+    agent = ashby_job_search.AshbyJobSearchAgent.__new__(ashby_job_search.AshbyJobSearchAgent)
+    replies = iter(responses)
+    agent.requested = []
+
+    def get(url, timeout):
+        agent.requested.append(url)
+        return next(replies)
+
+    agent.session = SimpleNamespace(get=get)
+    agent._bucket = SimpleNamespace(acquire=lambda: None)
+    agent.max_retries = max_retries
+    return agent
+
+
+def _response(status_code, retry_after=None):
+    headers = {"Retry-After": retry_after} if retry_after is not None else {}
+    return SimpleNamespace(status_code=status_code, headers=headers)
+
+
+def test_backoff_honours_retry_after(clock):
+    agent = _agent([_response(429, "7"), _response(200)])
+    response = agent._get_with_backoff("https://jobs.ashbyhq.com/acme")
+    assert response.status_code == 200
+    assert clock.sleeps == [7]
+
+
+def test_backoff_is_exponential_without_retry_after(clock):
+    agent = _agent([_response(429), _response(429, "soon"), _response(429), _response(200)])
+    response = agent._get_with_backoff("https://jobs.ashbyhq.com/acme")
+    assert response.status_code == 200
+    assert clock.sleeps == [1, 2, 4]
+
+
+def test_backoff_gives_up_after_max_retries(clock):
+    agent = _agent([_response(429)] * 3, max_retries=2)
+    response = agent._get_with_backoff("https://jobs.ashbyhq.com/acme")
+    assert response.status_code == 429
+    assert len(agent.requested) == 3
+    assert clock.sleeps == [1, 2]
+
+
+def test_non_429_errors_are_returned_immediately(clock):
+    agent = _agent([_response(503)])
+    assert agent._get_with_backoff("https://jobs.ashbyhq.com/acme").status_code == 503
+    assert clock.sleeps == []
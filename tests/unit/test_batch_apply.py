@@ -0,0 +1,50 @@
+"""
+Unit tests for the legacy concurrent batch apply: every application waits
+for its host's rate-limit slot before the form is touched. No browser or LLM
+is started; extraction is stubbed to fail fast.
+"""
+
+import asyncio
+import os
+import sys
+from types import SimpleNamespace
+
+import pytest
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "..", "legacy"))
+
+automation = pytest.importorskip("job_application_automation")
+
+
+@pytest.fixture
+def events(monkeypatch):
+    """Record host-slot acquisitions and extraction starts, in order"""
+    events = []
+
+    def host_rate_limit(url):
+        return SimpleNamespace(acquire=lambda: events.append(("slot", url)))
+
+    async def extract(url):
+        events.append(("extract", url))
+        return automation.JobFormExtractionResult(url=url, form_fields=[], success=False, error_message="no form")
+
+    monkeypatch.setattr(automation, "_host_rate_limit", host_rate_limit)
+    monkeypatch.setattr(automation, "_aextract_job_application_form", extract)
+    monkeypatch.setattr(automation, "save_application_results", lambda results: None)
+    return events
+
+
+def test_async_apply_waits_for_the_host_slot_first(events):
+    result = asyncio.run(automation._aapply_to_job("https://jobs.ashbyhq.com/acme/1"))
+    assert result["success"] is False
+    assert events == [
+        ("slot", "https://jobs.ashbyhq.com/acme/1"),
+        ("extract", "https://jobs.ashbyhq.com/acme/1"),
+    ]
+
+
+def test_concurrent_batch_is_host_rate_limited(events):
+    urls = ["https://jobs.ashbyhq.com/acme/1", "https://jobs.ashbyhq.com/acme/2"]
+    result = asyncio.run(automation.apply_to_jobs_batch(urls, max_concurrency=2))
+    assert result.total_attempted == 2
+    assert sorted(url for kind, url in events if kind == "slot") == urls
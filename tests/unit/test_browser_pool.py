@@ -0,0 +1,147 @@
+"""
+Unit tests for the legacy BrowserPool: slot accounting and waking waiters
+when a driver is discarded. Chrome is never started; _start_chrome is stubbed.
+"""
+
+import os
+import sys
+import threading
+
+import pytest
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "..", "legacy"))
+
+automation = pytest.importorskip("job_application_automation")
+
+
+class FakeDriver:
+    def __init__(self, fail_reset: bool = False):
+        self.fail_reset = fail_reset
+        self.quit_called = False
+        self.cookies = {"jobs.ashbyhq.com": "session"}
+
+    def get(self, url):
+        pass
+
+    def execute_cdp_cmd(self, cmd, params):
+        if self.fail_reset:
+            raise RuntimeError("browser crashed")
+        assert cmd == "Network.clearBrowserCookies"
+        self.cookies.clear()
+
+    def quit(self):
+        self.quit_called = True
+
+
+@pytest.fixture
+def started(monkeypatch):
+    """Stub out Chrome startup, recording every fake driver handed out"""
+    drivers = []
+
+    def fake_start_chrome(stealth, user_data_dir):
+        driver = FakeDriver()
+        drivers.append(driver)
+        return driver
+
+    monkeypatch.setattr(automation, "_start_chrome", fake_start_chrome)
+    return drivers
+
+
+def test_driver_is_reused_after_clean_exit(started):
+    pool = automation.BrowserPool("test", size=1)
+    with pool.acquire() as first:
+        pass
+    with pool.acquire() as second:
+        pass
+    assert first is second
+    assert len(started) == 1
+
+
+def test_release_clears_cookies_for_every_domain(started):
+    pool = automation.BrowserPool("test", size=1)
+    with pool.acquire() as driver:
+        driver.cookies["boards.greenhouse.io"] = "session"
+    assert driver.cookies == {}
+
+
+def test_failed_driver_is_discarded_and_replaced(started):
+    pool = automation.BrowserPool("test", size=1)
+    with pytest.raises(RuntimeError):
+        with pool.acquire():
+            raise RuntimeError("page failed to load")
+    assert started[0].quit_called
+    with pool.acquire() as driver:
+        assert driver is started[1]
+
+
+def test_waiter_wakes_when_holder_fails(started):
+    pool = automation.BrowserPool("test", size=1)
+    holder_has_driver = threading.Event()
+    release_holder = threading.Event()
+    acquired = []
+
+    def holder():
+        try:
+            with pool.acquire():
+                holder_has_driver.set()
+                release_holder.wait(5)
+                raise RuntimeError("page failed to load")
+        except RuntimeError:
+            pass
+
+    def waiter():
+        with pool.acquire() as driver:
+            acquired.append(driver)
+
+    holder_thread = threading.Thread(target=holder, daemon=True)
+    holder_thread.start()
+    assert holder_has_driver.wait(5)
+
+    waiter_thread = threading.Thread(target=waiter, daemon=True)
+    waiter_thread.start()
+    release_holder.set()
+    holder_thread.join(5)
+    waiter_thread.join(5)
+
+    assert not waiter_thread.is_alive(), "waiter stayed blocked after the slot was freed"
+    assert acquired == [started[1]]
+
+
+def test_waiter_wakes_when_reset_fails(monkeypatch):
+    drivers = iter([FakeDriver(fail_reset=True), FakeDriver()])
+    monkeypatch.setattr(automation, "_start_chrome", lambda stealth, user_data_dir: next(drivers))
+    pool = automation.BrowserPool("test", size=1)
+
+    with pool.acquire() as broken:
+        waiter_thread = threading.Thread(target=lambda: pool.acquire().__enter__(), daemon=True)
+        waiter_thread.start()
+
+    waiter_thread.join(5)
+    assert not waiter_thread.is_alive()
+    assert broken.quit_called
+
+
+def test_failed_start_frees_the_slot(monkeypatch):
+    calls = []
+
+    def flaky_start_chrome(stealth, user_data_dir):
+        calls.append(user_data_dir)
+        if len(calls) == 1:
+            raise RuntimeError("chromedriver missing")
+        return FakeDriver()
+
+    monkeypatch.setattr(automation, "_start_chrome", flaky_start_chrome)
+    pool = automation.BrowserPool("test", size=1)
+    with pytest.raises(RuntimeError):
+        pool.acquire().__enter__()
+    with pool.acquire() as driver:
+        assert isinstance(driver, FakeDriver)
+
+
+def test_close_quits_idle_drivers(started):
+    pool = automation.BrowserPool("test", size=2)
+    with pool.acquire():
+        with pool.acquire():
+            pass
+    pool.close()
+    assert all(driver.quit_called for driver in started)
@@ -0,0 +1,416 @@
+"""
+Unit tests for the legacy Supabase backend helpers that need no live
+Supabase project: the shared asyncpg pool, the per-user write
+rate limit, what authenticate_user hands back, the BatchLoader and the
+circuit breaker.
+"""
+
+import asyncio
+import os
+import sys
+import threading
+import time
+from datetime import date, datetime, timezone
+from decimal import Decimal
+from types import SimpleNamespace
+
+import pytest
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "..", "legacy"))
+
+database_supabase = pytest.importorskip("database_supabase")
+
+
+class FakePool:
+    def __init__(self):
+        self.loop = asyncio.get_running_loop()
+        self.closed = False
+
+    def _check_loop(self):
+        assert asyncio.get_running_loop() is self.loop, "pool used from a different loop"
+
+    async def fetchrow(self, query, *args):
+        self._check_loop()
+        return {"query": query, "args": args}
+
+    async def fetch(self, query, *args):
+        self._check_loop()
+        return [{"query": query, "args": args}]
+
+    async def close(self):
+        self._check_loop()
+        self.closed = True
+
+
+@pytest.fixture
+def manager(monkeypatch):
+    """SupabaseManager with a DB URL and a fake asyncpg, skipping the REST client setup"""
+    created = []
+
+    async def create_pool(dsn, **kwargs):
+        await asyncio.sleep(0)
+        pool = FakePool()
+        created.append(pool)
+        return pool
+
+    monkeypatch.setattr(database_supabase, "asyncpg", SimpleNamespace(create_pool=create_pool))
+    manager = database_supabase.SupabaseManager.__new__(database_supabase.SupabaseManager)
+    manager.db_url = "postgresql://localhost/test"
+    manager._pool = None
+    manager._pool_lock = None
+    manager._pool_loop = None
+    manager._pool_loop_lock = threading.Lock()
+    manager.created = created
+    yield manager
+    manager.close()
+
+
+def test_concurrent_callers_share_one_pool(manager):
+    async def run():
+        return await asyncio.gather(*(manager.get_pool() for _ in range(5)))
+
+    pools = asyncio.run(run())
+    assert len(manager.created) == 1
+    assert all(pool is manager.created[0] for pool in pools)
+
+
+def test_separate_asyncio_runs_share_one_pool(manager):
+    first = asyncio.run(manager.get_pool())
+    second = asyncio.run(manager.get_pool())
+    assert first is second
+    assert len(manager.created) == 1
+
+
+def test_queries_run_on_the_pools_own_loop(manager):
+    async def run():
+        return await manager.fetch_one("SELECT 1"), await manager.fetch_all("SELECT $1", 2)
+
+    assert asyncio.run(run()) == (
+        {"query": "SELECT 1", "args": []},
+        [{"query": "SELECT $1", "args": [2]}],
+    )
+    assert asyncio.run(manager.fetch_one("SELECT 3")) == {"query": "SELECT 3", "args": []}
+    assert len(manager.created) == 1
+
+
+def test_close_pool_closes_it_and_a_later_call_reopens(manager):
+    pool = asyncio.run(manager.get_pool())
+    asyncio.run(manager.close_pool())
+    assert pool.closed
+    assert asyncio.run(manager.get_pool()) is not pool
+
+
+def test_close_stops_the_pool_loop(manager):
+    pool = asyncio.run(manager.get_pool())
+    loop = manager._pool_loop
+    manager.close()
+    assert pool.closed
+    for _ in range(100):
+        if not loop.is_running():
+            break
+        time.sleep(0.01)
+    assert not loop.is_running()
+
+
+def test_pool_rows_match_the_rest_representation(manager):
+    row = {
+        "user_id": 7,
+        "updated_at": datetime(2024, 5, 1, 12, 30, 15, 250000, tzinfo=timezone.utc),
+        "graduation_date": date(2020, 6, 1),
+        "salary_expectation": Decimal("120000.50"),
+    }
+
+    async def fetchrow(query, *args):
+        return row
+
+    pool = asyncio.run(manager.get_pool())
+    pool.fetchrow = fetchrow
+    manager.cache = database_supabase.ReadCache()
+    manager.client = SimpleNamespace()
+    profiles = database_supabase.ProfileManager(manager)
+
+    profile = asyncio.run(profiles.get_profile_async(7))
+
+    assert profile == {
+        "user_id": 7,
+        "updated_at": "2024-05-01T12:30:15.250000+00:00",
+        "graduation_date": "2020-06-01",
+        "salary_expectation": 120000.5,
+    }
+    assert manager.cache.get("user_profile:7") == profile
+
+
+def test_no_pool_without_db_url(manager):
+    manager.db_url = None
+    assert asyncio.run(manager.get_pool()) is None
+    assert manager._pool_loop is None
+
+
+class FakeTable:
+    def __init__(self, rows):
+        self.rows = rows
+
+    def insert(self, data):
+        row = {"id": len(self.rows) + 1, **data}
+        return SimpleNamespace(execute=lambda: self._insert(row))
+
+    def _insert(self, row):
+        self.rows.append(row)
+        return SimpleNamespace(data=[row])
+
+
+@pytest.fixture
+def application_manager():
+    rows = []
+    client = SimpleNamespace(table=lambda name: FakeTable(rows))
+    manager = database_supabase.JobApplicationManager(SimpleNamespace(client=client))
+    manager._rate_limiter = database_supabase.UserRateLimiter(per_minute=1)
+    manager.rows = rows
+    return manager
+
+
+def test_rate_limited_application_raises_instead_of_returning_none(application_manager):
+    created = application_manager.create_application(1, "https://example.com/1", "QA Engineer", "Acme")
+    assert created["job_title"] == "QA Engineer"
+
+    with pytest.raises(database_supabase.RateLimitExceeded):
+        application_manager.create_application(1, "https://example.com/2", "SDET", "Acme")
+    assert len(application_manager.rows) == 1
+
+    # Other users have their own allowance
+    assert application_manager.create_application(2, "https://example.com/2", "SDET", "Acme")
+
+
+def test_batch_reports_refused_applications_in_place(application_manager):
+    applications = [
+        {"user_id": 1, "job_url": f"https://example.com/{i}", "job_title": "QA Engineer", "company": "Acme"}
+        for i in range(3)
+    ]
+    results = asyncio.run(application_manager.create_applications_async(applications, max_concurrency=1))
+    assert isinstance(results[0], dict)
+    assert all(isinstance(result, database_supabase.RateLimitExceeded) for result in results[1:])
+
+
+class FakeUsersTable:
+    """Just enough of the PostgREST builder for authenticate_user and _rehash_password"""
+
+    def __init__(self, row):
+        self.row = row
+        self.updates = []
+
+    def select(self, columns):
+        return self
+
+    def eq(self, column, value):
+        return self
+
+    def limit(self, count):
+        return self
+
+    def update(self, data):
+        self.updates.append(data)
+        return self
+
+    def execute(self):
+        return SimpleNamespace(data=[dict(self.row)])
+
+
+def _user_manager(password_hash):
+    table = FakeUsersTable({"id": 7, "email": "qa@example.com", "username": "qa", "password_hash": password_hash})
+    supabase_manager = SimpleNamespace(
+        client=SimpleNamespace(table=lambda name: table),
+        cache=SimpleNamespace(delete=lambda key: None),
+    )
+    return database_supabase.UserManager(supabase_manager), table
+
+
+@pytest.fixture(autouse=True)
+def empty_auth_cache():
+    database_supabase._auth_cache.clear()
+    yield
+    database_supabase._auth_cache.clear()
+
+
+def test_authenticate_user_never_returns_or_caches_the_hash():
+    manager, _ = _user_manager(database_supabase.hash_password("secret"))
+
+    user = manager.authenticate_user("qa@example.com", "secret")
+
+    assert user["id"] == 7
+    assert "password_hash" not in user
+    assert all("password_hash" not in cached for cached in database_supabase._auth_cache.values())
+    # A repeat login is served from the cache, still without the hash
+    assert "password_hash" not in manager.authenticate_user("qa@example.com", "secret")
+
+
+def test_legacy_hash_is_upgraded_but_not_returned():
+    manager, table = _user_manager(database_supabase._sha256_hex("secret"))
+
+    user = manager.authenticate_user("qa@example.com", "secret")
+
+    assert "password_hash" not in user
+    assert len(table.updates) == 1
+    assert table.updates[0]["password_hash"].startswith("$2")
+
+
+def test_wrong_password_is_rejected():
+    manager, _ = _user_manager(database_supabase.hash_password("secret"))
+    assert manager.authenticate_user("qa@example.com", "wrong") is None
+
+
+def _recording_loader(rows, max_batch_size=100):
+    calls = []
+
+    async def batch_fn(keys):
+        calls.append(list(keys))
+        return {key: rows[key] for key in keys if key in rows}
+
+    return database_supabase.BatchLoader(batch_fn, max_batch_size=max_batch_size), calls
+
+
+def test_batch_loader_coalesces_one_tick_into_one_call():
+    loader, calls = _recording_loader({1: "a", 2: "b"})
+
+    async def run():
+        return await asyncio.gather(loader.load(1), loader.load(2), loader.load(1), loader.load(3))
+
+    assert asyncio.run(run()) == ["a", "b", "a", None]
+    assert calls == [[1, 2, 3]]
+
+
+def test_batch_loader_dispatches_again_on_a_later_tick():
+    loader, calls = _recording_loader({1: "a", 2: "b"})
+
+    async def run():
+        return [await loader.load(1), await loader.load(2)]
+
+    assert asyncio.run(run()) == ["a", "b"]
+    assert calls == [[1], [2]]
+
+
+def test_batch_loader_splits_at_max_batch_size():
+    loader, calls = _recording_loader({key: key * 10 for key in range(5)}, max_batch_size=2)
+
+    async def run():
+        return await asyncio.gather(*(loader.load(key) for key in range(5)))
+
+    assert asyncio.run(run()) == [0, 10, 20, 30, 40]
+    assert calls == [[0, 1], [2, 3], [4]]
+
+
+def test_batch_loader_fails_only_the_batch_that_raised():
+    async def batch_fn(keys):
+        if 0 in keys:
+            raise RuntimeError("query failed")
+        return {key: key for key in keys}
+
+    loader = database_supabase.BatchLoader(batch_fn, max_batch_size=2)
+
+    async def run():
+        return await asyncio.gather(*(loader.load(key) for key in range(3)), return_exceptions=True)
+
+    first, second, third = asyncio.run(run())
+    assert isinstance(first, RuntimeError) and isinstance(second, RuntimeError)
+    assert third == 2
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    now = [1000.0]
+    monkeypatch.setattr(database_supabase, "time", SimpleNamespace(monotonic=lambda: now[0]))
+    return now
+
+
+def test_circuit_opens_at_the_failure_threshold(clock):
+    breaker = database_supabase.CircuitBreaker(failure_threshold=3, reset_timeout=30.0)
+    for _ in range(2):
+        breaker.record_failure()
+        breaker.before_call()
+
+    breaker.record_failure()
+    with pytest.raises(database_supabase.CircuitOpenError):
+        breaker.before_call()
+
+
+def test_circuit_allows_a_probe_after_the_reset_timeout(clock):
+    breaker = database_supabase.CircuitBreaker(failure_threshold=1, reset_timeout=30.0)
+    breaker.record_failure()
+
+    clock[0] += 29
+    with pytest.raises(database_supabase.CircuitOpenError):
+        breaker.before_call()
+    clock[0] += 1
+    breaker.before_call()
+
+    # A failed probe opens the circuit for another full timeout
+    breaker.record_failure()
+    with pytest.raises(database_supabase.CircuitOpenError):
+        breaker.before_call()
+
+
+def test_success_closes_the_circuit_and_resets_the_count(clock):
+    breaker = database_supabase.CircuitBreaker(failure_threshold=2, reset_timeout=30.0)
+    breaker.record_failure()
+    breaker.record_failure()
+    breaker.record_success()
+    breaker.before_call()
+
+    breaker.record_failure()
+    breaker.before_call()
+
+
+def test_batch_loader_survives_a_cancelled_caller():
+    loader, calls = _recording_loader({1: "a", 2: "b"})
+
+    async def run():
+        cancelled = asyncio.ensure_future(loader.load(1))
+        shared = asyncio.ensure_future(loader.load(1))
+        other = asyncio.ensure_future(loader.load(2))
+        await asyncio.sleep(0)
+        cancelled.cancel()
+        return await asyncio.wait_for(asyncio.gather(shared, other), 1)
+
+    assert asyncio.run(run()) == ["a", "b"]
+    assert calls == [[1, 2]]
+
+
+class FakeProfilesTable:
+    """Records the PostgREST calls made against user_profiles"""
+
+    def __init__(self, rows):
+        self.rows = rows
+        self.calls = []
+        self.not_ = self
+
+    def __getattr__(self, name):
+        def record(*args):
+            self.calls.append((name, *args))
+            return self
+        return record
+
+    def execute(self):
+        return SimpleNamespace(data=self.rows)
+
+
+def _profile_manager(rows):
+    table = FakeProfilesTable(rows)
+    manager = database_supabase.ProfileManager(SimpleNamespace(client=SimpleNamespace(table=lambda name: table)))
+    return manager, table
+
+
+def test_profile_summary_never_selects_the_resume_text():
+    manager, table = _profile_manager([{"id": 1, "user_id": 7, "phone": "555"}])
+    assert manager.get_profile_summary(7)["phone"] == "555"
+    (select,) = [call for call in table.calls if call[0] == "select"]
+    assert "resume_text" not in select[1]
+
+
+def test_has_resume_filters_server_side():
+    manager, table = _profile_manager([{"id": 1}])
+    assert manager.has_resume(7)
+    assert ("select", "id") in table.calls
+    assert ("is_", "resume_text", "null") in table.calls
+    assert ("neq", "resume_text", "") in table.calls
+
+    manager, _ = _profile_manager([])
+    assert not manager.has_resume(7)
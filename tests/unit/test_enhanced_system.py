@@ -9,6 +9,7 @@ This script demonstrates the new features:
 - Database storage
 """
 
+import asyncio
 import sys
 import os
 
@@ -113,10 +114,10 @@ def test_ashby_job_search():
         
         # Test job search with limited results
         print("Searching for QA Engineer positions...")
-        jobs = agent.search_qa_jobs(
+        jobs = asyncio.run(agent.search_qa_jobs(
             job_titles=["QA Engineer", "Senior QA Engineer"],
             max_results=5
-        )
+        ))
         
         if jobs:
             print(f"✅ Found {len(jobs)} QA jobs")
@@ -235,10 +236,10 @@ def test_integration():
             # Perform actual job search
             print("\n4. Performing job search...")
             agent = AshbyJobSearchAgent()
-            jobs = agent.search_qa_jobs(
+            jobs = asyncio.run(agent.search_qa_jobs(
                 job_titles=["QA Engineer", "QA Automation Engineer"],
                 max_results=3
-            )
+            ))
             
             if jobs:
                 print(f"✅ Found {len(jobs)} jobs")
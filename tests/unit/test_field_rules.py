@@ -0,0 +1,72 @@
+"""
+Unit tests for the legacy suggested-data rule table: which form labels are
+answered without the LLM, and which rule wins when several match.
+"""
+
+import os
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "..", "legacy"))
+
+automation = pytest.importorskip("job_application_automation")
+
+
+@pytest.mark.parametrize("label, rule", [
+    ("Name", "full_name"),
+    ("Full name *", "full_name"),
+    ("First Name", "first_name"),
+    ("Surname", "last_name"),
+    ("Email", "email"),
+    ("E-mail address:", "email"),
+    ("Phone number", "phone"),
+    ("Mobile phone", "phone"),
+    ("LinkedIn Profile URL", "linkedin_url"),
+    ("Website", "portfolio_url"),
+    ("GitHub profile", "portfolio_url"),
+])
+def test_contact_labels_match_their_rule(label, rule):
+    key = label.lower().rstrip(" *:")
+    assert automation._match_field_rule(key) == rule
+
+
+def test_online_profiles_prefers_linkedin_over_later_rules():
+    label = "share any online profiles (linkedin, github, website, portfolio, twitter, etc.)"
+    assert automation._match_field_rule(label) == "linkedin_url"
+
+
+@pytest.mark.parametrize("label", [
+    "Can we email you about future openings?",
+    "Is it OK to contact you by phone?",
+    "Phone or email",
+    "Personal website or LinkedIn",
+    "How did you hear about our website?",
+    "Why do you want to work here?",
+])
+def test_questions_mentioning_contact_details_go_to_the_llm(label):
+    handled, remaining = automation._apply_rule_table([label])
+    assert handled == {}
+    assert remaining == [label]
+
+
+def test_apply_rule_table_splits_and_skips_uploads():
+    labels = [
+        "Full name *",
+        "Email",
+        "Resume/CV",
+        "Upload your CV",
+        "What motivates you?",
+        "LinkedIn",
+    ]
+    handled, remaining = automation._apply_rule_table(labels)
+    assert handled == {
+        "Full name *": "John Doe",
+        "Email": "john.doe@example.com",
+        "LinkedIn": "https://linkedin.com/in/johndoe",
+    }
+    assert remaining == ["What motivates you?"]
+
+
+def test_apply_rule_table_empty():
+    assert automation._apply_rule_table([]) == ({}, [])
@@ -0,0 +1,185 @@
+"""
+Unit tests for legacy database upgrades: a job_search_results table created
+before uq_jsr_search_url existed gets deduplicated and indexed at startup, so
+save_search_results' ON CONFLICT insert keeps working, and timestamps are
+still filled on tables whose columns have no DEFAULT. Also covers checking
+pre-bcrypt Werkzeug password hashes.
+"""
+
+import hashlib
+import os
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "..", "legacy"))
+
+database = pytest.importorskip("database")
+
+from sqlalchemy import create_engine, inspect, text
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
+
+# job_search_results as create_all built it before the unique constraint
+OLD_RESULTS_TABLE = """
+CREATE TABLE job_search_results (
+    id INTEGER PRIMARY KEY,
+    job_search_id INTEGER NOT NULL REFERENCES job_searches(id),
+    job_title VARCHAR(200) NOT NULL,
+    company VARCHAR(200) NOT NULL,
+    location VARCHAR(200) NOT NULL,
+    url VARCHAR(500) NOT NULL,
+    job_board VARCHAR(100),
+    posted_date VARCHAR(100),
+    salary_range VARCHAR(200),
+    job_type VARCHAR(100),
+    remote_option VARCHAR(100),
+    description_snippet TEXT,
+    is_applied BOOLEAN,
+    is_favorite BOOLEAN,
+    created_at DATETIME
+)
+"""
+
+
+def _insert_result(connection, result_id, url):
+    connection.execute(
+        text(
+            "INSERT INTO job_search_results (id, job_search_id, job_title, company, location, url) "
+            "VALUES (:id, 1, 'QA Engineer', 'Acme', 'Remote', :url)"
+        ),
+        {"id": result_id, "url": url},
+    )
+
+
+@pytest.fixture
+def db_manager():
+    """DatabaseManager over an in-memory database whose results table predates the constraint"""
+    engine = create_engine("sqlite://", connect_args={"check_same_thread": False}, poolclass=StaticPool)
+    database.Base.metadata.create_all(bind=engine)
+    with engine.begin() as connection:
+        connection.execute(text("DROP TABLE job_search_results"))
+        connection.execute(text(OLD_RESULTS_TABLE))
+
+    manager = database.DatabaseManager()
+    manager.engine = engine
+    manager.SessionLocal = sessionmaker(autoflush=False, expire_on_commit=False, bind=engine)
+    return manager
+
+
+def _result_urls(engine):
+    with engine.connect() as connection:
+        return connection.execute(text("SELECT id, url FROM job_search_results ORDER BY id")).all()
+
+
+def test_startup_removes_duplicates_and_adds_unique_index(db_manager):
+    engine = db_manager.engine
+    with engine.begin() as connection:
+        _insert_result(connection, 1, "https://jobs.ashbyhq.com/acme/1")
+        _insert_result(connection, 2, "https://jobs.ashbyhq.com/acme/1")
+        _insert_result(connection, 3, "https://jobs.ashbyhq.com/acme/2")
+        connection.execute(
+            text(
+                "INSERT INTO job_applications (user_id, job_result_id, job_url, job_title, company) "
+                "VALUES (1, 2, 'https://jobs.ashbyhq.com/acme/1', 'QA Engineer', 'Acme')"
+            )
+        )
+
+    db_manager.create_tables()
+
+    assert _result_urls(engine) == [
+        (1, "https://jobs.ashbyhq.com/acme/1"),
+        (3, "https://jobs.ashbyhq.com/acme/2"),
+    ]
+    with engine.connect() as connection:
+        assert connection.execute(text("SELECT job_result_id FROM job_applications")).scalar() == 1
+    indexes = inspect(engine).get_indexes("job_search_results")
+    assert any(index["unique"] and index["column_names"] == ["job_search_id", "url"] for index in indexes)
+
+
+def test_save_search_results_skips_duplicates_after_upgrade(db_manager):
+    db_manager.create_tables()
+    manager = database.JobSearchManager(db_manager)
+    job = {"title": "QA Engineer", "company": "Acme", "location": "Remote", "url": "https://jobs.ashbyhq.com/acme/1"}
+
+    assert manager.save_search_results(1, [job])
+    assert manager.save_search_results(1, [job, {**job, "url": "https://jobs.ashbyhq.com/acme/2"}])
+
+    assert [url for _, url in _result_urls(db_manager.engine)] == [
+        "https://jobs.ashbyhq.com/acme/1",
+        "https://jobs.ashbyhq.com/acme/2",
+    ]
+
+
+def test_fresh_database_is_left_alone():
+    engine = create_engine("sqlite://", poolclass=StaticPool)
+    database.Base.metadata.create_all(bind=engine)
+    database._ensure_result_unique_index(engine)
+    index_names = [index["name"] for index in inspect(engine).get_indexes("job_search_results")]
+    assert "uq_jsr_search_url" not in index_names
+
+
+def _drop_column_defaults(engine):
+    """Rebuild every table the way the pre-server_default schema created it"""
+    with engine.begin() as connection:
+        tables = connection.execute(text("SELECT name, sql FROM sqlite_master WHERE type = 'table'")).all()
+        connection.execute(text("PRAGMA foreign_keys=OFF"))
+        for name, sql in tables:
+            connection.execute(text(f"DROP TABLE {name}"))
+            connection.execute(text(sql.replace(" DEFAULT (CURRENT_TIMESTAMP)", "")))
+
+
+def test_timestamps_are_set_on_tables_without_column_defaults(db_manager):
+    database.Base.metadata.create_all(bind=db_manager.engine)
+    _drop_column_defaults(db_manager.engine)
+
+    user = database.UserManager(db_manager).create_user("qa@example.com", "qa", "secret")
+    profile = database.ProfileManager(db_manager).create_profile(user.id, location="Remote")
+    search = database.JobSearchManager(db_manager).create_job_search(user.id, "QA", ["QA Engineer"])
+
+    for row in (user, profile, search):
+        assert row.created_at is not None
+        assert row.updated_at is not None
+    with db_manager.engine.connect() as connection:
+        assert connection.execute(text("SELECT created_at FROM users")).scalar() is not None
+
+
+def _pbkdf2_hash(password, salt="saltsalt", iterations=1000):
+    derived = hashlib.pbkdf2_hmac("sha256", password.encode(), salt.encode(), iterations)
+    return f"pbkdf2:sha256:{iterations}${salt}${derived.hex()}"
+
+
+def _scrypt_hash(password, salt="saltsalt", n=1024, r=8, p=1):
+    derived = hashlib.scrypt(password.encode(), salt=salt.encode(), n=n, r=r, p=p, dklen=64)
+    return f"scrypt:{n}:{r}:{p}${salt}${derived.hex()}"
+
+
+@pytest.mark.parametrize("make_hash", [_pbkdf2_hash, _scrypt_hash])
+def test_legacy_hash_accepts_only_the_right_password(make_hash):
+    password_hash = make_hash("secret")
+    assert database._check_legacy_hash(password_hash, "secret")
+    assert not database._check_legacy_hash(password_hash, "Secret")
+    assert database.verify_password(password_hash, "secret")
+
+
+def test_legacy_pbkdf2_defaults_to_600000_iterations():
+    derived = hashlib.pbkdf2_hmac("sha256", b"secret", b"saltsalt", 600_000)
+    assert database._check_legacy_hash(f"pbkdf2:sha256$saltsalt${derived.hex()}", "secret")
+
+
+@pytest.mark.parametrize("password_hash", [
+    "md5$saltsalt$5ebe2294ecd0e0f08eab7690d2a6ee69",
+    "pbkdf2:sha256:many$saltsalt$00",
+    "scrypt:1024:8$saltsalt$00",
+    "no-separators-at-all",
+    "",
+])
+def test_unknown_or_malformed_legacy_hashes_are_rejected(password_hash):
+    assert not database._check_legacy_hash(password_hash, "secret")
+
+
+def test_verify_password_checks_bcrypt_hashes():
+    password_hash = database.hash_password("secret")
+    assert password_hash.startswith("$2")
+    assert database.verify_password(password_hash, "secret")
+    assert not database.verify_password(password_hash, "wrong")